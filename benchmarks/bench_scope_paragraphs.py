@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: scope document paragraph generation throughput.
+
+Builds a synthetic content.json with a fixed number of body paragraphs
+(headings, intro text, bullets, sprint labels) and times
+generate_body_content_xml() over it, reporting paragraphs per second.
+Pass a second copy of generate_scope_doc.py (or a git revision) to compare
+before and after a change.
+
+Usage:
+    python benchmarks/bench_scope_paragraphs.py [--paragraphs 5000]
+        [--baseline-ref HEAD~1 | --baseline <generate_scope_doc.py>]
+        [--write-content <content.json>]
+"""
+
+import argparse
+import gc
+import importlib.util
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SCOPE_SCRIPT = os.path.join(
+    "docs-generator", "skills", "scope-document-generator", "scripts", "generate_scope_doc.py"
+)
+# Shared helpers (docgen_trace, ...) that generate_scope_doc.py imports; a
+# copy written to a temp dir cannot find them relative to itself.
+PLUGIN_SCRIPTS = os.path.join(REPO_ROOT, "docs-generator", "scripts")
+
+WORDS = (
+    "ingest telemetry from plant historians & validate <raw> signals before the "
+    "forecasting service aggregates them per asset line and shift"
+).split()
+
+
+def _text(seed: int, length: int) -> str:
+    return " ".join(WORDS[(seed + i) % len(WORDS)] for i in range(length))
+
+
+def _full_section(index: int) -> Dict[str, Any]:
+    sprint = index % 5 == 0
+    return {
+        "number": str(index),
+        "title": f"Sprint plan {index}" if sprint else f"Workstream {index}",
+        "content": _text(index, 40),
+        "bullet_points": [_text(index + b, 12) for b in range(3)],
+        "subsections": [
+            {
+                "number": f"Sprint {s}" if sprint else f"{index}.{s}",
+                "title": _text(index + s, 6),
+                "content": _text(index * s, 30),
+                "bullet_points": [_text(index + s + b, 10) for b in range(4)],
+            }
+            for s in (1, 2)
+        ],
+    }
+
+
+def synthetic_content(paragraphs: int) -> Dict[str, Any]:
+    """
+    Build content.json data with exactly *paragraphs* body paragraphs.
+
+    Full sections hold 18 paragraphs (spacer, heading, intro, 3 bullets and
+    two subsections with heading, text and 4 bullets); every fifth one is a
+    sprint section. The remainder goes into a last section of bullets.
+    """
+    sections: List[Dict[str, Any]] = []
+    remaining = paragraphs - 1  # leading page break
+    while remaining >= 18 or (not sections and remaining >= 17):
+        sections.append(_full_section(len(sections) + 1))
+        remaining -= 18 if len(sections) > 1 else 17
+    overhead = 2 if sections else 1  # spacer + heading
+    if remaining >= overhead:
+        sections.append({
+            "number": str(len(sections) + 1),
+            "title": "Remaining items",
+            "bullet_points": [_text(b, 12) for b in range(remaining - overhead)],
+        })
+    elif remaining:
+        sections[-1]["bullet_points"].append(_text(0, 12))
+    return {"sections": sections}
+
+
+def load_module(path: str, name: str) -> ModuleType:
+    """Import a copy of generate_scope_doc.py under *name*."""
+    if PLUGIN_SCRIPTS not in sys.path:
+        sys.path.insert(0, PLUGIN_SCRIPTS)
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def module_from_ref(ref: str, tmp_dir: str) -> str:
+    """Write generate_scope_doc.py as of git *ref* to *tmp_dir*; returns its path."""
+    source = subprocess.run(
+        ["git", "-C", REPO_ROOT, "show", f"{ref}:{SCOPE_SCRIPT}"],
+        capture_output=True, check=True
+    ).stdout
+    path = os.path.join(tmp_dir, "generate_scope_doc_baseline.py")
+    with open(path, "wb") as f:
+        f.write(source)
+    return path
+
+
+def measure(
+    variants: List[Tuple[str, ModuleType]],
+    content: Dict[str, Any],
+    repeat: int
+) -> Dict[str, Dict[str, float]]:
+    """
+    Best-of-*repeat* timing of generate_body_content_xml() over *content*.
+
+    Variants are run alternately so machine noise hits them alike; the
+    garbage collector is paused while timing, as timeit does.
+    """
+    best = {label: float("inf") for label, _ in variants}
+    paragraphs = {}
+    for _ in range(repeat):
+        for label, module in variants:
+            # Revisions before the deterministic allocator have no reset
+            if hasattr(module, "reset_paragraph_ids"):
+                module.reset_paragraph_ids()
+            gc.disable()
+            try:
+                start = time.perf_counter()
+                xml = module.generate_body_content_xml(content, "en")
+                best[label] = min(best[label], time.perf_counter() - start)
+            finally:
+                gc.enable()
+            paragraphs[label] = xml.count("<w:p ") + xml.count("<w:p>")
+    return {
+        label: {"paragraphs": paragraphs[label], "seconds": best[label],
+                "per_second": paragraphs[label] / best[label]}
+        for label, _ in variants
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Scope document paragraph throughput")
+    parser.add_argument("--paragraphs", type=int, default=5000,
+                        help="Body paragraphs in the synthetic content.json (default 5000)")
+    parser.add_argument("--repeat", type=int, default=100, help="Runs per variant; best is kept")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument("--baseline", help="Another generate_scope_doc.py to compare against")
+    group.add_argument("--baseline-ref", help="Git revision whose generate_scope_doc.py to compare against")
+    parser.add_argument("--write-content", help="Also save the synthetic content.json here")
+    args = parser.parse_args(argv)
+
+    content = synthetic_content(args.paragraphs)
+    if args.write_content:
+        with open(args.write_content, "w", encoding="utf-8") as f:
+            json.dump(content, f, indent=2)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        variants = []
+        baseline = args.baseline
+        if args.baseline_ref:
+            baseline = module_from_ref(args.baseline_ref, tmp_dir)
+        if baseline:
+            variants.append(("before", load_module(baseline, "scope_doc_before")))
+        variants.append(("after" if baseline else "current",
+                         load_module(os.path.join(REPO_ROOT, SCOPE_SCRIPT), "scope_doc_current")))
+
+        results = measure(variants, content, args.repeat)
+        for label, r in results.items():
+            print(f"{label:8} {r['paragraphs']:6d} paragraphs  {r['seconds'] * 1000:8.1f} ms  "
+                  f"{r['per_second']:10.0f} paragraphs/s")
+
+    if "before" in results:
+        print(f"speedup  {results['after']['per_second'] / results['before']['per_second']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
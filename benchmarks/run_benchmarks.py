@@ -0,0 +1,513 @@
+#!/usr/bin/env python3
+"""
+Benchmark suite for every generator entry point.
+
+Each case builds a synthetic input at several scales (sections, bullets,
+slides, components, pages or images -- whatever the generator grows with),
+then runs the generator in a fresh Python process and records:
+
+    seconds       wall time of the generator call (best of --repeat)
+    peak_rss_kb   peak resident set size of that process
+    output_bytes  size of what the generator produced
+
+Results are compared against a JSON baseline; a metric that grows by more
+than --threshold (fractional, default 0.25) over the baseline is reported
+as a regression and the run exits with status 1.  Wall time must also grow
+by at least --min-seconds (default 0.05 s), so runs of a few milliseconds
+do not fail on timer noise.
+
+Cases:
+    scope_doc             generate_scope_doc.process_template
+    debrief_doc           DebriefDocxGenerator.generate
+    hackathon_pptx        generate_hackathon_pptx.generate_presentation
+    kickoff_pptx          generate_kickoff_pptx.generate_presentation
+    architecture_diagram  generate_architecture_diagram.generate_dot + rendering
+    extract_pdf           extract_architecture_diagram.extract_from_pdf
+    extract_docx          extract_architecture_diagram.extract_from_docx
+
+Usage:
+    python benchmarks/run_benchmarks.py [--cases scope_doc,debrief_doc]
+        [--scales 10,100,1000] [--repeat 3] [--threshold 0.25] [--min-seconds 0.05]
+        [--baseline benchmarks/baseline.json] [--update-baseline]
+        [--kickoff-template <ot-kickoff-template.pptx>]
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional
+
+from bench_scope_paragraphs import _full_section, _text
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SKILLS = os.path.join(REPO_ROOT, "docs-generator", "skills")
+SCOPE_SKILL = os.path.join(SKILLS, "scope-document-generator")
+
+SCRIPTS = {
+    "scope": os.path.join(SCOPE_SKILL, "scripts", "generate_scope_doc.py"),
+    "diagram": os.path.join(SCOPE_SKILL, "scripts", "generate_architecture_diagram.py"),
+    "extract": os.path.join(SCOPE_SKILL, "scripts", "extract_architecture_diagram.py"),
+    "debrief": os.path.join(SKILLS, "hackathon-debrief", "scripts", "generate_debrief_doc.py"),
+    "hackathon": os.path.join(SKILLS, "hackathon-presentation", "scripts", "generate_hackathon_pptx.py"),
+    "kickoff": os.path.join(SKILLS, "kick-off-presentation", "scripts", "generate_kickoff_pptx.py"),
+}
+
+SCOPE_TEMPLATE = os.path.join(SCOPE_SKILL, "assets", "templates", "scope-template")
+HACKATHON_TEMPLATE = os.path.join(
+    SKILLS, "hackathon-presentation", "assets", "templates", "ot-hackathon-template.pptx"
+)
+KICKOFF_TEMPLATE = os.path.join(
+    SKILLS, "kick-off-presentation", "assets", "templates", "ot-kickoff-template.pptx"
+)
+
+DEFAULT_BASELINE = os.path.join(REPO_ROOT, "benchmarks", "baseline.json")
+METRICS = ("seconds", "peak_rss_kb", "output_bytes")
+
+
+def _write_json(path: str, data: Any) -> str:
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    return path
+
+
+def _png(width: int, height: int, color: str) -> bytes:
+    from PIL import Image
+    buf = io.BytesIO()
+    Image.new("RGB", (width, height), color).save(buf, format="PNG")
+    return buf.getvalue()
+
+
+# ---------------------------------------------------------------------------
+# Synthetic inputs
+# ---------------------------------------------------------------------------
+# Each builder writes the inputs for one (case, scale) into a directory and
+# returns the keyword arguments its runner needs.  Inputs are built in the
+# parent process so they do not count towards the measured process.
+
+def build_scope_doc(scale: int, work: str) -> Dict[str, Any]:
+    """*scale* sections of 18 paragraphs each."""
+    return {
+        "variables": _write_json(os.path.join(work, "variables.json"), {
+            "language": "en", "client_name": "Benchmark GmbH",
+            "project_title": "Synthetic scope", "date": "01.01.2026",
+        }),
+        "content": _write_json(os.path.join(work, "content.json"), {
+            "sections": [_full_section(i + 1) for i in range(scale)],
+        }),
+    }
+
+
+def build_debrief_doc(scale: int, work: str) -> Dict[str, Any]:
+    """*scale* markdown blocks (heading, text, bullets, table) over the canonical sections."""
+    section_ids = _load("debrief").SECTION_ORDER
+    block = (
+        "## Finding {n}\n\n{text} **{bold}** {text}.\n\n"
+        "- {bullet}\n- {bullet}\n- {bullet}\n\n"
+        "| Metric | Before | After |\n|---|---|---|\n| Latency | 120 ms | 40 ms |\n"
+    )
+    blocks: Dict[str, List[str]] = {sid: [] for sid in section_ids}
+    for i in range(scale):
+        blocks[section_ids[i % len(section_ids)]].append(
+            block.format(n=i + 1, text=_text(i, 30), bold=_text(i, 3), bullet=_text(i, 10))
+        )
+    return {"content": _write_json(os.path.join(work, "content.json"), {
+        "language": "en",
+        "company": {"name": "Benchmark GmbH"},
+        "participants": {
+            "customer": [{"name": "Alex Client", "role": "CTO"}],
+            "oneThousand": [{"name": "Sam Consultant", "role": "Lead"}],
+        },
+        "metadata": {
+            "title": "Hackathon Debrief",
+            "dates": {"start": "2026-01-01", "end": "2026-01-02"},
+            "location": "Berlin",
+        },
+        "useCases": [{"title": "Forecasting"}],
+        "sections": [
+            {"id": sid, "title": sid.replace("_", " ").title(), "content": "\n".join(parts)}
+            for sid, parts in blocks.items() if parts
+        ],
+    })}
+
+
+def build_hackathon_pptx(scale: int, work: str) -> Dict[str, Any]:
+    """*scale* bullets spread over the deck's bullet lists."""
+    lists: Dict[str, List[str]] = {
+        name: [] for name in ("pain", "data", "approach", "challenges", "features", "next")
+    }
+    names = list(lists)
+    for i in range(scale):
+        lists[names[i % len(names)]].append(f"**{_text(i, 2)}** {_text(i, 10)}")
+    return {
+        "variables": _write_json(os.path.join(work, "variables.json"), {
+            "client_name": "Benchmark GmbH", "location": "Berlin",
+            "hackathon_dates": {"day1": "01.01.2026", "day2": "02.01.2026"},
+            "use_case_title": "Forecasting",
+            "team_members": {
+                "ot_team": ["Sam Consultant"],
+                "client_contacts": ["Alex Client"],
+            },
+        }),
+        "content": _write_json(os.path.join(work, "content.json"), {
+            "check_in": {"questions": ["What brings you here, {client_name}?"]},
+            "agenda": {"day1": [{"time": "09:00", "activity": "Kick-off"}],
+                       "day2": [{"time": "09:00", "activity": "Build"}]},
+            "use_case": {
+                "pain_points": lists["pain"],
+                "data_sources": [{"title": b.split("**")[1], "description": b}
+                                 for b in lists["data"]],
+                "approach_steps": lists["approach"],
+                "challenges": lists["challenges"],
+            },
+            "results": {
+                "business_value": {},
+                "poc_summary": {"features": lists["features"]},
+                "next_steps": lists["next"],
+            },
+        }),
+    }
+
+
+def build_kickoff_pptx(scale: int, work: str) -> Dict[str, Any]:
+    """*scale* use cases, i.e. *scale* Pain x Data slides."""
+    return {
+        "variables": _write_json(os.path.join(work, "variables.json"), {
+            "client_name": "Benchmark GmbH", "project_title": "Synthetic kick-off",
+            "copyright_year": "2019-2026",
+            "use_cases": [{"title": f"Use case {i + 1}"} for i in range(scale)],
+        }),
+        "content": _write_json(os.path.join(work, "content.json"), {
+            "use_cases": [
+                {
+                    "title": f"Use case {i + 1}",
+                    "pain_points": [_text(i, 8), _text(i + 1, 8)],
+                    "data_sources": [_text(i + 2, 6)],
+                    "solution": [_text(i + 3, 10)],
+                }
+                for i in range(scale)
+            ],
+        }),
+    }
+
+
+def build_architecture_diagram(scale: int, work: str) -> Dict[str, Any]:
+    """*scale* components in zones of ten, chained by flows."""
+    types = ("client", "service", "database", "queue", "external")
+    components = [
+        {"name": f"Component {i}", "type": types[i % len(types)], "description": _text(i, 4)}
+        for i in range(scale)
+    ]
+    return {"description": _write_json(os.path.join(work, "description.json"), {
+        "title": "Synthetic architecture",
+        "components": components,
+        "zones": [
+            {"name": f"Zone {z}", "components": [c["name"] for c in components[z:z + 10]]}
+            for z in range(0, scale, 10)
+        ],
+        "flows": [
+            {"from": components[i]["name"], "to": components[i + 1]["name"], "label": f"f{i}"}
+            for i in range(scale - 1)
+        ],
+    })}
+
+
+def build_extract_pdf(scale: int, work: str) -> Dict[str, Any]:
+    """*scale* pages, each with one small image; the diagram sits in the middle."""
+    from PIL import Image
+    pages = [Image.new("RGB", (160, 120), "white") for _ in range(scale)]
+    pages[scale // 2] = Image.new("RGB", (1200, 800), "#18A05A")
+    path = os.path.join(work, "input.pdf")
+    pages[0].save(path, format="PDF", save_all=True, append_images=pages[1:])
+    return {"path": path}
+
+
+def build_extract_docx(scale: int, work: str) -> Dict[str, Any]:
+    """A DOCX package with *scale* media images, one of them the diagram."""
+    path = os.path.join(work, "input.docx")
+    small = _png(160, 120, "white")
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("[Content_Types].xml", '<?xml version="1.0"?><Types/>')
+        zf.writestr("word/document.xml", '<?xml version="1.0"?><w:document/>')
+        for i in range(scale):
+            data = _png(1200, 800, "#18A05A") if i == scale // 2 else small
+            zf.writestr(f"word/media/image{i + 1}.png", data)
+    return {"path": path}
+
+
+# ---------------------------------------------------------------------------
+# Runners (executed in the measured child process)
+# ---------------------------------------------------------------------------
+
+def _load(key: str) -> ModuleType:
+    """Import a generator script by path (its CLI hand-off only runs as __main__)."""
+    spec = importlib.util.spec_from_file_location(f"bench_{key}", SCRIPTS[key])
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module  # dataclasses look their module up here
+    spec.loader.exec_module(module)
+    return module
+
+
+def _file_size(path: str) -> int:
+    return os.path.getsize(path) if os.path.exists(path) else 0
+
+
+def run_scope_doc(work: str, variables: str, content: str) -> Callable[[], int]:
+    module = _load("scope")
+    with open(variables, encoding="utf-8") as f:
+        variables_data = json.load(f)
+    with open(content, encoding="utf-8") as f:
+        content_data = json.load(f)
+    output = os.path.join(work, "output.docx")
+
+    def run() -> int:
+        if not module.process_template(SCOPE_TEMPLATE, variables_data, content_data, output):
+            raise RuntimeError("process_template failed")
+        return _file_size(output)
+    return run
+
+
+def run_debrief_doc(work: str, content: str) -> Callable[[], int]:
+    module = _load("debrief")
+    with open(content, encoding="utf-8") as f:
+        content_data = json.load(f)
+    output = os.path.join(work, "output.docx")
+
+    def run() -> int:
+        module.DebriefDocxGenerator(content_data).generate(output)
+        return _file_size(output)
+    return run
+
+
+def _presentation_runner(key: str, template: str, work: str,
+                         variables: str, content: str) -> Callable[[], int]:
+    module = _load(key)
+    output = os.path.join(work, "output.pptx")
+
+    def run() -> int:
+        module.generate_presentation(Path(template), Path(variables), Path(content), Path(output))
+        return _file_size(output)
+    return run
+
+
+def run_hackathon_pptx(work: str, variables: str, content: str) -> Callable[[], int]:
+    return _presentation_runner("hackathon", HACKATHON_TEMPLATE, work, variables, content)
+
+
+def run_kickoff_pptx(work: str, variables: str, content: str,
+                     template: str = KICKOFF_TEMPLATE) -> Callable[[], int]:
+    return _presentation_runner("kickoff", template, work, variables, content)
+
+
+def run_architecture_diagram(work: str, description: str) -> Callable[[], int]:
+    module = _load("diagram")
+    description_data = module.load_description(description)
+    output = os.path.join(work, "output.png")
+
+    def run() -> int:
+        dot_source = module.generate_dot(description_data)
+        if not module.render_with_graphviz(dot_source, output):
+            # No Graphviz here: time the fallback renderer instead
+            if not module.render_with_pillow(description_data, output):
+                raise RuntimeError("diagram rendering failed")
+        return _file_size(output)
+    return run
+
+
+def run_extract_pdf(work: str, path: str) -> Callable[[], int]:
+    module = _load("extract")
+
+    def run() -> int:
+        # Measure a full scan, not a lookup in the cached image index
+        return len(module.extract_from_pdf(path, use_index=False) or b"")
+    return run
+
+
+def run_extract_docx(work: str, path: str) -> Callable[[], int]:
+    module = _load("extract")
+
+    def run() -> int:
+        return len(module.extract_from_docx(path, use_index=False) or b"")
+    return run
+
+
+CASES = {
+    "scope_doc": (build_scope_doc, run_scope_doc),
+    "debrief_doc": (build_debrief_doc, run_debrief_doc),
+    "hackathon_pptx": (build_hackathon_pptx, run_hackathon_pptx),
+    "kickoff_pptx": (build_kickoff_pptx, run_kickoff_pptx),
+    "architecture_diagram": (build_architecture_diagram, run_architecture_diagram),
+    "extract_pdf": (build_extract_pdf, run_extract_pdf),
+    "extract_docx": (build_extract_docx, run_extract_docx),
+}
+
+
+def _peak_rss_kb() -> int:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+def child_main(case: str, work: str, result_path: str) -> int:
+    """Run one case in this (fresh) process and write its metrics."""
+    with open(os.path.join(work, "inputs.json"), encoding="utf-8") as f:
+        inputs = json.load(f)
+    # Generators log progress; keep it out of the benchmark report
+    with open(os.devnull, "w") as devnull, \
+            contextlib.redirect_stdout(devnull), contextlib.redirect_stderr(devnull):
+        import logging
+        logging.disable(logging.CRITICAL)
+        run = CASES[case][1](work, **inputs)
+        start = time.perf_counter()
+        output_bytes = run()
+        seconds = time.perf_counter() - start
+    _write_json(result_path, {
+        "seconds": seconds, "peak_rss_kb": _peak_rss_kb(), "output_bytes": output_bytes,
+    })
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def measure(case: str, scale: int, repeat: int, root: str,
+            extra_inputs: Dict[str, Any]) -> Dict[str, Any]:
+    """Build the inputs once, then run the case *repeat* times; best values win."""
+    work = os.path.join(root, f"{case}-{scale}")
+    os.makedirs(work, exist_ok=True)
+    inputs = CASES[case][0](scale, work)
+    inputs.update(extra_inputs)
+    _write_json(os.path.join(work, "inputs.json"), inputs)
+
+    best: Dict[str, Any] = {}
+    result_path = os.path.join(work, "result.json")
+    env = dict(os.environ, DOCGEN_NO_WORKER="1", DOCGEN_DIAGRAM_CACHE=os.path.join(root, "cache"))
+    for _ in range(repeat):
+        proc = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", case, work, result_path],
+            env=env, capture_output=True, text=True,
+        )
+        if proc.returncode != 0:
+            return {"error": (proc.stderr.strip().splitlines() or ["failed"])[-1]}
+        with open(result_path, encoding="utf-8") as f:
+            result = json.load(f)
+        for metric in METRICS:
+            best[metric] = min(best.get(metric, result[metric]), result[metric])
+    return best
+
+
+def compare(results: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]],
+            threshold: float, min_seconds: float = 0.0) -> List[str]:
+    """List every metric that grew by more than *threshold* over the baseline.
+
+    A ``seconds`` increase smaller than *min_seconds* is treated as noise.
+    """
+    regressions = []
+    for key, result in results.items():
+        before = baseline.get(key)
+        if not before or "error" in result or "error" in before:
+            continue
+        for metric in METRICS:
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None or new <= old * (1 + threshold):
+                continue
+            if metric == "seconds" and new - old < min_seconds:
+                continue
+            regressions.append(f"{key} {metric}: {old:g} -> {new:g} (+{(new / old - 1) * 100:.0f}%)")
+    return regressions
+
+
+def _parse_list(value: str) -> List[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["--child"]:
+        return child_main(*argv[1:4])
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark every generator entry point against a JSON baseline"
+    )
+    parser.add_argument("--cases", type=_parse_list, default=list(CASES),
+                        help=f"Comma list of cases (default: all of {', '.join(CASES)})")
+    parser.add_argument("--scales", type=lambda v: [int(s) for s in _parse_list(v)],
+                        default=[10, 100, 1000], help="Comma list of scales (default 10,100,1000)")
+    parser.add_argument("--repeat", type=int, default=3, help="Runs per case and scale; best is kept")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Allowed fractional growth per metric before failing (default 0.25)")
+    parser.add_argument("--min-seconds", type=float, default=0.05,
+                        help="Ignore wall-time growth below this many seconds (default 0.05)")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE,
+                        help="Baseline JSON file (default benchmarks/baseline.json)")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write this run's results as the new baseline")
+    parser.add_argument("--kickoff-template", default=KICKOFF_TEMPLATE,
+                        help="Kick-off template (the case is skipped if it does not exist)")
+    parser.add_argument("--output", help="Also write this run's results to a JSON file")
+    args = parser.parse_args(argv)
+
+    unknown = [c for c in args.cases if c not in CASES]
+    if unknown:
+        parser.error(f"unknown case(s): {', '.join(unknown)}")
+
+    results: Dict[str, Dict[str, Any]] = {}
+    with tempfile.TemporaryDirectory(prefix="docgen-bench-") as root:
+        for case in args.cases:
+            extra: Dict[str, Any] = {}
+            if case == "kickoff_pptx":
+                if not os.path.exists(args.kickoff_template):
+                    print(f"{case:22} skipped: template not found ({args.kickoff_template})")
+                    continue
+                extra["template"] = os.path.abspath(args.kickoff_template)
+            for scale in args.scales:
+                key = f"{case}@{scale}"
+                results[key] = result = measure(case, scale, args.repeat, root, extra)
+                if "error" in result:
+                    print(f"{key:27} ERROR {result['error']}")
+                else:
+                    print(f"{key:27} {result['seconds']:9.3f} s  {result['peak_rss_kb'] / 1024:8.1f} MB"
+                          f"  {result['output_bytes']:12d} B")
+
+    report = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "results": results,
+    }
+    if args.output:
+        _write_json(args.output, report)
+
+    failed = any("error" in r for r in results.values())
+    if args.update_baseline:
+        _write_json(args.baseline, report)
+        print(f"Baseline written: {args.baseline}")
+        return 1 if failed else 0
+
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; run with --update-baseline to record one")
+        return 1 if failed else 0
+
+    with open(args.baseline, encoding="utf-8") as f:
+        baseline = json.load(f).get("results", {})
+    regressions = compare(results, baseline, args.threshold, args.min_seconds)
+    for line in regressions:
+        print(f"REGRESSION {line}")
+    if not regressions:
+        print(f"No regressions beyond {args.threshold:.0%} (and {args.min_seconds:g} s) "
+              f"of {args.baseline}")
+    return 1 if regressions or failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Copyright footer engine shared by the PPTX generators.
+
+OT templates carry a "(c) <years> ONE THOUSAND" footer on slides and slide
+layouts, and the generated decks must show the project's copyright years.
+Instead of building ``text_frame.text`` for every shape, this module runs
+one XPath over the ``a:t`` nodes of each slide / layout part and only
+touches the text bodies that actually hold a footer:
+
+    from docgen_footer import copyright_text, rewrite_copyright_footers
+
+    rewrite_copyright_footers(prs, "2019-2025", color=OT_GRAY)            # slides
+    rewrite_copyright_footers(prs, "2019-2025", color=OT_GRAY,
+                              slides=False, layouts=True)                 # layouts
+
+A footer is either a footer placeholder whose text contains "ONE THOUSAND"
+or a copyright sign, or a shape with a paragraph that is nothing but a
+copyright line such as "(c) 2019-2024 ONE THOUSAND".  Content text that
+merely mentions the company or a copyright sign ("ONE THOUSAND" as a
+label, "Licences (c) vendor") is left alone.  The footer's first matching
+run keeps its own formatting (font, language) but gets the new text, 8pt
+size and the given colour; the other runs and paragraphs of that text body
+are dropped, so the footer ends up as a single line.  Table cells are never
+touched.
+"""
+
+import re
+from typing import Optional
+
+from lxml import etree
+from pptx.dml.color import RGBColor
+from pptx.opc.constants import CONTENT_TYPE as CT
+
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+
+FOOTER_MARKERS = ("ONE THOUSAND", "©")
+FOOTER_SIZE = 800  # hundredths of a point
+
+# A whole footer paragraph, e.g. "© 2019-2024 ONE THOUSAND".  It needs a
+# copyright sign or a year: a bare "ONE THOUSAND" is a company-name label.
+_YEARS = r"\d{4}(?:\s*[-–]\s*\d{4})?"
+_COPYRIGHT_LINE = re.compile(
+    rf"\s*(?:(?:©|\(c\))\s*(?:{_YEARS})?|{_YEARS})\s*ONE\s+THOUSAND\s*",
+    re.IGNORECASE,
+)
+
+# "THOUSAND" rather than "ONE THOUSAND" so footers split over runs as
+# "ONE " + "THOUSAND" are still found; the text body is checked in full below.
+_FOOTER_TEXT = etree.XPath(
+    ".//a:t[contains(., 'THOUSAND') or contains(., '©')]",
+    namespaces={"a": NS_A},
+)
+
+_FILL_TAGS = {f"{{{NS_A}}}{tag}" for tag in
+              ("noFill", "solidFill", "gradFill", "blipFill", "pattFill", "grpFill")}
+_RUN_TAGS = {f"{{{NS_A}}}{tag}" for tag in ("r", "br", "fld")}
+
+
+def copyright_text(years: str) -> str:
+    """Return the footer line for *years*, e.g. "2019-2025"."""
+    return f"© {years} ONE THOUSAND"
+
+
+def _is_footer_placeholder(tx_body) -> bool:
+    ph = tx_body.getparent().find(f"{{{NS_P}}}nvSpPr/{{{NS_P}}}nvPr/{{{NS_P}}}ph")
+    return ph is not None and ph.get("type") == "ftr"
+
+
+def _body_text(tx_body) -> str:
+    return "\n".join(
+        "".join(t.text or "" for t in p.iter(f"{{{NS_A}}}t"))
+        for p in tx_body.iterchildren(f"{{{NS_A}}}p")
+    )
+
+
+def _style_run(run, color: Optional[RGBColor]) -> None:
+    r_pr = run.find(f"{{{NS_A}}}rPr")
+    if r_pr is None:
+        r_pr = etree.Element(f"{{{NS_A}}}rPr")
+        run.insert(0, r_pr)
+    r_pr.set("sz", str(FOOTER_SIZE))
+    if color is None:
+        return
+    for child in list(r_pr):
+        if child.tag in _FILL_TAGS:
+            r_pr.remove(child)
+    fill = etree.Element(f"{{{NS_A}}}solidFill")
+    etree.SubElement(fill, f"{{{NS_A}}}srgbClr").set("val", str(color))
+    # The fill goes right after an outline (a:ln), if any, per the schema
+    has_ln = len(r_pr) > 0 and r_pr[0].tag == f"{{{NS_A}}}ln"
+    r_pr.insert(1 if has_ln else 0, fill)
+
+
+def rewrite_footers_in(root, text: str, color: Optional[RGBColor] = None) -> int:
+    """Rewrite the copyright footers under one slide / layout XML *root*.
+
+    Returns the number of text bodies rewritten.
+    """
+    done = set()
+    for t in _FOOTER_TEXT(root):
+        run = t.getparent()
+        para = run.getparent()
+        # Runs dropped from a footer rewritten earlier in this loop are detached
+        tx_body = para.getparent() if para is not None else None
+        if tx_body is None or tx_body.tag != f"{{{NS_P}}}txBody" or tx_body in done:
+            continue
+        body_text = _body_text(tx_body)
+        if _is_footer_placeholder(tx_body):
+            if not any(marker in body_text for marker in FOOTER_MARKERS):
+                continue
+        elif not any(_COPYRIGHT_LINE.fullmatch(line) for line in body_text.split("\n")):
+            continue
+        done.add(tx_body)
+
+        for other in tx_body.findall(f"{{{NS_A}}}p"):
+            if other is not para:
+                tx_body.remove(other)
+        for child in list(para):
+            if child.tag in _RUN_TAGS and child is not run:
+                para.remove(child)
+        t.text = text
+        _style_run(run, color)
+    return len(done)
+
+
+def rewrite_copyright_footers(
+    prs,
+    years: str,
+    color: Optional[RGBColor] = None,
+    slides: bool = True,
+    layouts: bool = False,
+) -> int:
+    """Point every copyright footer of *prs* at *years* in one package pass.
+
+    *slides* and *layouts* pick which parts are visited. Returns the number
+    of footers rewritten.
+    """
+    content_types = set()
+    if slides:
+        content_types.add(CT.PML_SLIDE)
+    if layouts:
+        content_types.add(CT.PML_SLIDE_LAYOUT)
+
+    text = copyright_text(years)
+    updated = 0
+    for part in prs.part.package.iter_parts():
+        if part.content_type in content_types:
+            updated += rewrite_footers_in(part._element, text, color)
+    return updated
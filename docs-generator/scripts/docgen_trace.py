@@ -0,0 +1,248 @@
+#!/usr/bin/env python3
+"""
+Lightweight per-stage tracing for the docs-generator scripts.
+
+Generators mark their stages with ``span("name")`` blocks or the
+``@traced()`` decorator.  Both are close to free unless tracing is switched
+on (one flag test per call); the CLIs switch it on with ``--profile``:
+
+    --profile                 span timings only
+    --profile cprofile        span timings + cProfile of the whole run
+    --profile tracemalloc     span timings + peak traced memory per span
+    --profile-json PATH       also write the breakdown as JSON
+
+The breakdown is printed to stderr as a table (nested spans indented,
+repeated spans aggregated).  cProfile stats are dumped next to the JSON
+file (or to ``<label>.prof``) for ``python -m pstats`` / snakeviz.
+
+Usage from a generator:
+
+    from docgen_trace import add_profile_arguments, profiled, span, traced
+
+    @traced()
+    def fill_cover(slide, ...): ...
+
+    def main(argv=None):
+        parser = argparse.ArgumentParser(...)
+        add_profile_arguments(parser)
+        args = parser.parse_args(argv)
+        with profiled(args, "generate_kickoff_pptx"):
+            ...
+"""
+
+import argparse
+import contextlib
+import functools
+import json
+import os
+import sys
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, TextIO
+
+PROFILE_MODES = ("spans", "cprofile", "tracemalloc")
+
+
+class _Stage:
+    """Aggregated timings of one span path (e.g. ``generate/fill_cover``)."""
+
+    __slots__ = ("path", "depth", "calls", "seconds", "peak_bytes")
+
+    def __init__(self, path: str, depth: int) -> None:
+        self.path = path
+        self.depth = depth
+        self.calls = 0
+        self.seconds = 0.0
+        self.peak_bytes = 0
+
+
+class Tracer:
+    """Collects nested span timings while enabled; does nothing otherwise."""
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.memory = False
+        self._stack: List[str] = []
+        self._memory_stack: List[List[int]] = []
+        self._stages: Dict[str, _Stage] = {}
+
+    def start(self, memory: bool = False) -> None:
+        self.enabled = True
+        self.memory = memory
+        self._stack = []
+        self._memory_stack = []
+        self._stages = {}
+
+    def stop(self) -> List[_Stage]:
+        self.enabled = False
+        return list(self._stages.values())
+
+    @contextlib.contextmanager
+    def _span(self, name: str) -> Iterator[None]:
+        path = "/".join(self._stack + [name])
+        stage = self._stages.get(path)
+        if stage is None:
+            stage = self._stages[path] = _Stage(path, len(self._stack))
+        if self.memory:
+            import tracemalloc
+            # [memory at entry, highest peak seen]; the peak counter is
+            # reset per span, so fold it into the enclosing span first
+            current, peak = tracemalloc.get_traced_memory()
+            if self._memory_stack:
+                self._memory_stack[-1][1] = max(self._memory_stack[-1][1], peak)
+            tracemalloc.reset_peak()
+            self._memory_stack.append([current, current])
+        self._stack.append(name)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stage.seconds += time.perf_counter() - start
+            stage.calls += 1
+            self._stack.pop()
+            if self.memory:
+                _, peak = tracemalloc.get_traced_memory()
+                entry, seen = self._memory_stack.pop()
+                seen = max(seen, peak)
+                stage.peak_bytes = max(stage.peak_bytes, seen - entry)
+                if self._memory_stack:
+                    self._memory_stack[-1][1] = max(self._memory_stack[-1][1], seen)
+
+
+TRACER = Tracer()
+_NULL_SPAN = contextlib.nullcontext()
+
+
+def span(name: str):
+    """Context manager timing the enclosed block as stage *name*."""
+    if not TRACER.enabled:
+        return _NULL_SPAN
+    return TRACER._span(name)
+
+
+def traced(name: Optional[str] = None) -> Callable[[Callable], Callable]:
+    """Decorator timing every call of the function as one stage."""
+    def decorate(fn: Callable) -> Callable:
+        stage = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return fn(*args, **kwargs)
+            with TRACER._span(stage):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add ``--profile [MODE]`` and ``--profile-json PATH`` to a CLI."""
+    parser.add_argument(
+        "--profile", nargs="?", const="spans", choices=PROFILE_MODES, default=None,
+        help="Print a per-stage timing breakdown to stderr; 'cprofile' also dumps "
+             "cProfile stats, 'tracemalloc' also reports peak memory per stage"
+    )
+    parser.add_argument(
+        "--profile-json", metavar="PATH",
+        help="Write the per-stage breakdown as JSON (implies --profile)"
+    )
+
+
+def format_table(report: Dict[str, Any]) -> str:
+    """Render a breakdown (see build_report) as an aligned text table."""
+    memory = any("peak_kb" in s for s in report["stages"])
+    width = max([len("stage")] + [2 * s["depth"] + len(s["name"]) for s in report["stages"]])
+    header = f"{'stage':<{width}}  {'calls':>5}  {'total ms':>10}  {'%':>6}"
+    if memory:
+        header += f"  {'peak KB':>10}"
+    lines = [f"Profile: {report['label']} ({report['total_seconds'] * 1000:.1f} ms)",
+             header, "-" * len(header)]
+    for s in report["stages"]:
+        line = (f"{'  ' * s['depth'] + s['name']:<{width}}  {s['calls']:>5}  "
+                f"{s['seconds'] * 1000:>10.1f}  {s['percent']:>6.1f}")
+        if memory:
+            line += f"  {s.get('peak_kb', 0):>10.1f}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def build_report(label: str, stages: List[_Stage], total: float, mode: str) -> Dict[str, Any]:
+    """JSON-serialisable breakdown; stages in first-entered order."""
+    rows = []
+    for stage in stages:
+        row = {
+            "name": stage.path.rsplit("/", 1)[-1],
+            "path": stage.path,
+            "depth": stage.depth,
+            "calls": stage.calls,
+            "seconds": round(stage.seconds, 6),
+            "percent": round(100.0 * stage.seconds / total, 1) if total else 0.0,
+        }
+        if mode == "tracemalloc":
+            row["peak_kb"] = round(stage.peak_bytes / 1024, 1)
+        rows.append(row)
+    return {"label": label, "mode": mode, "total_seconds": round(total, 6), "stages": rows}
+
+
+@contextlib.contextmanager
+def profiled(args: argparse.Namespace, label: str,
+             stream: Optional[TextIO] = None) -> Iterator[None]:
+    """
+    Trace the enclosed run when ``--profile``/``--profile-json`` was given.
+
+    The whole block becomes the root span *label*.  The report is emitted
+    even if the block exits early (``sys.exit``, exceptions).
+    """
+    mode = getattr(args, "profile", None)
+    json_path = getattr(args, "profile_json", None)
+    if mode is None and json_path:
+        mode = "spans"
+    if mode is None:
+        yield
+        return
+
+    profiler = None
+    if mode == "cprofile":
+        import cProfile
+        profiler = cProfile.Profile()
+    elif mode == "tracemalloc":
+        import tracemalloc
+        tracemalloc.start()
+
+    TRACER.start(memory=mode == "tracemalloc")
+    start = time.perf_counter()
+    if profiler:
+        profiler.enable()
+    try:
+        with TRACER._span(label):
+            yield
+    finally:
+        if profiler:
+            profiler.disable()
+        total = time.perf_counter() - start
+        stages = TRACER.stop()
+        report = build_report(label, stages, total, mode)
+        out = stream or sys.stderr
+
+        if mode == "tracemalloc":
+            import tracemalloc
+            snapshot = tracemalloc.take_snapshot()
+            tracemalloc.stop()
+            report["top_allocations"] = [
+                {"location": str(stat.traceback[0]), "kb": round(stat.size / 1024, 1)}
+                for stat in snapshot.statistics("lineno")[:10]
+            ]
+
+        print(format_table(report), file=out)
+
+        if profiler:
+            import pstats
+            prof_path = (os.path.splitext(json_path)[0] if json_path else label) + ".prof"
+            profiler.dump_stats(prof_path)
+            report["cprofile_stats"] = prof_path
+            print(f"cProfile stats: {prof_path}", file=out)
+            pstats.Stats(profiler, stream=out).sort_stats("cumulative").print_stats(15)
+
+        if json_path:
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"Profile written: {json_path}", file=out)
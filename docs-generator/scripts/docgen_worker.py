@@ -0,0 +1,427 @@
+#!/usr/bin/env python3
+"""
+Warm worker for the docs-generator scripts.
+
+Every skill normally runs a fresh ``python scripts/<generator>.py`` process and
+pays for importing python-docx, python-pptx, lxml and Pillow (and for
+re-reading its template) on each call.  This worker imports the generator
+modules once and keeps them -- including their in-process template caches --
+alive between calls.
+
+Protocol: newline-delimited JSON-RPC 2.0, served either on a Unix socket or
+on stdin/stdout.  Methods:
+
+    generate_scope_doc             -> process_template(...)
+    generate_debrief_doc           -> DebriefDocxGenerator(...).generate(...)
+    generate_hackathon_pptx        -> generate_presentation(...)
+    generate_kickoff_pptx          -> generate_presentation(...)
+    generate_architecture_diagram  -> generate_architecture_diagram(...)
+    ping, shutdown
+
+Each generator method accepts either ``{"argv": [...], "cwd": "..."}`` to run
+the script's CLI exactly as if it had been invoked from the shell, or the
+keyword arguments of the underlying function.  The result carries the
+captured ``stdout``/``stderr`` and an ``exit_code`` (CLI form) or the
+function's return value (keyword form).
+
+The generator CLIs are thin clients: when a worker is listening on the
+socket they forward their argv to it, otherwise they run in-process as
+before.  Set ``DOCGEN_NO_WORKER=1`` to force in-process execution.
+
+Usage:
+    python docgen_worker.py serve [--socket PATH | --stdio]
+    python docgen_worker.py status [--socket PATH]
+    python docgen_worker.py stop [--socket PATH]
+"""
+
+import argparse
+import contextlib
+import importlib.util
+import io
+import json
+import logging
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import traceback
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
+
+PLUGIN_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SKILLS_DIR = os.path.join(PLUGIN_ROOT, "skills")
+
+# RPC method -> generator script (relative to skills/)
+SCRIPTS = {
+    "generate_scope_doc":
+        "scope-document-generator/scripts/generate_scope_doc.py",
+    "generate_debrief_doc":
+        "hackathon-debrief/scripts/generate_debrief_doc.py",
+    "generate_hackathon_pptx":
+        "hackathon-presentation/scripts/generate_hackathon_pptx.py",
+    "generate_kickoff_pptx":
+        "kick-off-presentation/scripts/generate_kickoff_pptx.py",
+    "generate_architecture_diagram":
+        "scope-document-generator/scripts/generate_architecture_diagram.py",
+}
+
+# JSON-RPC error codes
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INTERNAL_ERROR = -32603
+
+CONNECT_TIMEOUT = 0.5
+
+
+def default_socket_path() -> str:
+    """Socket path from ``DOCGEN_WORKER_SOCKET`` or a per-user temp file."""
+    path = os.environ.get("DOCGEN_WORKER_SOCKET")
+    if path:
+        return path
+    uid = os.getuid() if hasattr(os, "getuid") else 0
+    return os.path.join(tempfile.gettempdir(), f"docgen-worker-{uid}.sock")
+
+
+# ---------------------------------------------------------------------------
+# Client
+# ---------------------------------------------------------------------------
+
+def call_worker(
+    method: str,
+    params: Optional[Dict[str, Any]] = None,
+    socket_path: Optional[str] = None,
+    timeout: Optional[float] = None,
+) -> Dict[str, Any]:
+    """Send one JSON-RPC request to a running worker and return the reply.
+
+    Raises:
+        OSError: if no worker is listening on the socket.
+    """
+    path = socket_path or default_socket_path()
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.settimeout(CONNECT_TIMEOUT)
+        sock.connect(path)
+        sock.settimeout(timeout)
+        request = {"jsonrpc": "2.0", "id": 1, "method": method,
+                   "params": params or {}}
+        sock.sendall(json.dumps(request).encode("utf-8") + b"\n")
+        with sock.makefile("rb") as reader:
+            line = reader.readline()
+    finally:
+        sock.close()
+    if not line:
+        raise ConnectionResetError("docgen worker closed the connection")
+    return json.loads(line)
+
+
+def forward_cli(method: str, argv: List[str]) -> Optional[int]:
+    """Run a generator CLI on the warm worker, if one is running.
+
+    Returns the CLI exit code, or ``None`` when no worker is reachable and
+    the caller should run in-process.
+    """
+    if os.environ.get("DOCGEN_NO_WORKER"):
+        return None
+    path = default_socket_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        reply = call_worker(method, {"argv": list(argv), "cwd": os.getcwd()},
+                            socket_path=path)
+    except (OSError, ValueError):
+        return None
+
+    if "error" in reply:
+        print(f"docgen worker error: {reply['error'].get('message')}",
+              file=sys.stderr)
+        return None
+    result = reply.get("result") or {}
+    sys.stdout.write(result.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(result.get("stderr", ""))
+    sys.stderr.flush()
+    return int(result.get("exit_code", 0))
+
+
+# ---------------------------------------------------------------------------
+# Worker
+# ---------------------------------------------------------------------------
+
+class RpcError(Exception):
+    """An error reported back to the client as a JSON-RPC error object."""
+
+    def __init__(self, code: int, message: str) -> None:
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+class GeneratorWorker:
+    """Holds the imported generator modules and dispatches RPC calls."""
+
+    def __init__(self) -> None:
+        self._modules: Dict[str, Tuple[int, Any]] = {}
+        self.stopping = False
+        self.handlers: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+            "ping": lambda params: {"pid": os.getpid(),
+                                    "loaded": sorted(self._modules)},
+            "shutdown": self._shutdown,
+            "generate_scope_doc": self._scope_doc,
+            "generate_debrief_doc": self._debrief_doc,
+            "generate_hackathon_pptx":
+                lambda params: self._presentation("generate_hackathon_pptx", params),
+            "generate_kickoff_pptx":
+                lambda params: self._presentation("generate_kickoff_pptx", params),
+            "generate_architecture_diagram": self._architecture_diagram,
+        }
+
+    # -- module loading ------------------------------------------------
+
+    def module(self, method: str) -> Any:
+        """Import (or re-import, if the file changed) the script for *method*."""
+        path = os.path.join(SKILLS_DIR, SCRIPTS[method])
+        mtime = os.stat(path).st_mtime_ns
+        cached = self._modules.get(method)
+        if cached and cached[0] == mtime:
+            return cached[1]
+
+        spec = importlib.util.spec_from_file_location(f"docgen_{method}", path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[spec.name] = module  # dataclasses resolve their module here
+        spec.loader.exec_module(module)
+        self._modules[method] = (mtime, module)
+        return module
+
+    def preload(self) -> None:
+        """Import every generator module up front."""
+        for method in SCRIPTS:
+            try:
+                self.module(method)
+            except Exception as e:
+                print(f"Warning: could not preload {method}: {e}",
+                      file=sys.stderr)
+
+    # -- dispatch ------------------------------------------------------
+
+    def dispatch(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        """Handle one decoded JSON-RPC request and build the response."""
+        req_id = request.get("id") if isinstance(request, dict) else None
+        try:
+            if not isinstance(request, dict) or "method" not in request:
+                raise RpcError(INVALID_REQUEST, "Invalid request")
+            handler = self.handlers.get(request["method"])
+            if handler is None:
+                raise RpcError(METHOD_NOT_FOUND,
+                               f"Unknown method: {request['method']}")
+            params = request.get("params") or {}
+            if not isinstance(params, dict):
+                raise RpcError(INVALID_REQUEST, "params must be an object")
+            result = handler(params)
+            return {"jsonrpc": "2.0", "id": req_id, "result": result}
+        except RpcError as e:
+            error = {"code": e.code, "message": e.message}
+        except Exception as e:
+            error = {"code": INTERNAL_ERROR, "message": str(e),
+                     "data": traceback.format_exc()}
+        return {"jsonrpc": "2.0", "id": req_id, "error": error}
+
+    def handle_line(self, line: bytes) -> bytes:
+        """Decode one request line and return the encoded response line."""
+        try:
+            request = json.loads(line)
+        except ValueError as e:
+            response = {"jsonrpc": "2.0", "id": None,
+                        "error": {"code": PARSE_ERROR, "message": str(e)}}
+        else:
+            response = self.dispatch(request)
+        return json.dumps(response).encode("utf-8") + b"\n"
+
+    # -- handlers ------------------------------------------------------
+
+    def _shutdown(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        self.stopping = True
+        return {"stopping": True}
+
+    def _run(self, method: str, params: Dict[str, Any],
+             call: Callable[[Any], Any]) -> Dict[str, Any]:
+        """Run *call* against the module for *method* with output captured."""
+        module = self.module(method)
+        with _captured_call(params.get("cwd")) as captured:
+            if "argv" in params:
+                try:
+                    code = module.main(list(params["argv"]))
+                except SystemExit as e:
+                    code = e.code
+                if code is None:
+                    code = 0
+                elif not isinstance(code, int):
+                    print(code, file=sys.stderr)
+                    code = 1
+                captured["exit_code"] = code
+            else:
+                captured["return"] = call(module)
+        return captured
+
+    def _scope_doc(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run("generate_scope_doc", params, lambda m: m.process_template(
+            params["template_dir"], params["variables"], params["content"],
+            params["output_path"], params.get("arch_diagram_path"),
+        ))
+
+    def _debrief_doc(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        def call(m: Any) -> None:
+            generator = m.DebriefDocxGenerator(params["content"],
+                                               logo_dir=params.get("logo_dir"))
+            generator.generate(params["output_path"])
+        return self._run("generate_debrief_doc", params, call)
+
+    def _presentation(self, method: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run(method, params, lambda m: m.generate_presentation(
+            params["template_path"], params["variables_path"],
+            params["content_path"], params["output_path"],
+            params.get("verbose", False),
+        ))
+
+    def _architecture_diagram(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return self._run("generate_architecture_diagram", params,
+                         lambda m: m.generate_architecture_diagram(
+                             params["description"], params["output_path"],
+                             style=params.get("style", "detailed"),
+                             dpi=params.get("dpi", 150),
+                         ))
+
+
+@contextlib.contextmanager
+def _captured_call(cwd: Optional[str]):
+    """Capture stdout/stderr/logging and restore cwd and logger levels."""
+    out, err = io.StringIO(), io.StringIO()
+    captured: Dict[str, Any] = {}
+    old_cwd = os.getcwd()
+    levels = {name: lg.level
+              for name, lg in logging.Logger.manager.loggerDict.items()
+              if isinstance(lg, logging.Logger)}
+    streams = []
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, logging.StreamHandler):
+            streams.append((handler, handler.setStream(err)))
+    try:
+        if cwd:
+            os.chdir(cwd)
+        with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            yield captured
+    finally:
+        os.chdir(old_cwd)
+        for handler, stream in streams:
+            handler.setStream(stream)
+        for name, level in levels.items():
+            logging.getLogger(name).setLevel(level)
+        captured["stdout"] = out.getvalue()
+        captured["stderr"] = err.getvalue()
+
+
+class _RpcHandler(socketserver.StreamRequestHandler):
+    """Reads request lines from one client connection until it closes."""
+
+    def handle(self) -> None:
+        worker: GeneratorWorker = self.server.worker
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            self.wfile.write(worker.handle_line(line))
+            self.wfile.flush()
+            if worker.stopping:
+                break
+
+
+def serve_socket(worker: GeneratorWorker, socket_path: str) -> None:
+    """Serve requests one at a time on a Unix socket until ``shutdown``."""
+    if os.path.exists(socket_path):
+        try:
+            call_worker("ping", socket_path=socket_path, timeout=2)
+        except (OSError, ValueError):
+            os.unlink(socket_path)  # stale socket from a dead worker
+        else:
+            print(f"Error: a worker is already listening on {socket_path}",
+                  file=sys.stderr)
+            sys.exit(1)
+
+    server = socketserver.UnixStreamServer(socket_path, _RpcHandler)
+    server.worker = worker
+    os.chmod(socket_path, 0o600)
+    print(f"docgen worker {os.getpid()} listening on {socket_path}",
+          file=sys.stderr)
+    try:
+        while not worker.stopping:
+            server.handle_request()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        with contextlib.suppress(OSError):
+            os.unlink(socket_path)
+
+
+def serve_stdio(worker: GeneratorWorker, stdin: TextIO, stdout: TextIO) -> None:
+    """Serve newline-delimited requests on stdin, replies on stdout."""
+    reader, writer = stdin.buffer, stdout.buffer
+    for line in reader:
+        if not line.strip():
+            continue
+        writer.write(worker.handle_line(line))
+        writer.flush()
+        if worker.stopping:
+            break
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Warm worker that keeps the docs-generator scripts loaded"
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    serve = sub.add_parser("serve", help="Run the worker in the foreground")
+    serve.add_argument("--socket", help="Unix socket path "
+                       "(default: $DOCGEN_WORKER_SOCKET or a per-user temp file)")
+    serve.add_argument("--stdio", action="store_true",
+                       help="Speak JSON-RPC on stdin/stdout instead of a socket")
+
+    for name, help_text in (("status", "Check whether a worker is running"),
+                            ("stop", "Ask a running worker to exit")):
+        cmd = sub.add_parser(name, help=help_text)
+        cmd.add_argument("--socket", help="Unix socket path")
+
+    args = parser.parse_args(argv)
+    socket_path = args.socket or default_socket_path()
+
+    if args.command == "serve":
+        worker = GeneratorWorker()
+        worker.preload()
+        if args.stdio:
+            serve_stdio(worker, sys.stdin, sys.stdout)
+        else:
+            serve_socket(worker, socket_path)
+        return 0
+
+    method = "ping" if args.command == "status" else "shutdown"
+    try:
+        reply = call_worker(method, socket_path=socket_path, timeout=5)
+    except (OSError, ValueError):
+        print(f"No docgen worker running on {socket_path}")
+        return 1
+    if args.command == "status":
+        result = reply.get("result", {})
+        print(f"docgen worker {result.get('pid')} on {socket_path}: "
+              f"{', '.join(result.get('loaded', [])) or 'no modules loaded'}")
+    else:
+        print(f"Stopped docgen worker on {socket_path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
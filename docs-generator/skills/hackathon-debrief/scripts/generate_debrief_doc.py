@@ -14,6 +14,12 @@ Usage:
         --content /tmp/debrief_content.json \\
         --logo-dir <path_to_logos_dir> \\
         --output /path/to/output.docx
+
+    # Many debriefs in parallel
+    python generate_debrief_doc.py \\
+        --batch /tmp/debriefs/*.json \\
+        --logo-dir <path_to_logos_dir> \\
+        --output-dir /path/to/out/ [--jobs 4]
 """
 
 from __future__ import annotations
@@ -26,9 +32,30 @@ import os
 import re
 import struct
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional, Tuple, Union
 
+# Shared helpers (docgen_trace, docgen_worker) live in <plugin>/scripts
+_PLUGIN_SCRIPTS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                "..", "..", "..", "scripts"))
+if _PLUGIN_SCRIPTS not in sys.path:
+    sys.path.insert(0, _PLUGIN_SCRIPTS)
+from docgen_trace import add_profile_arguments, profiled, span, traced
+
+if __name__ == "__main__":
+    # Hand off to a warm docgen worker (<plugin>/scripts/docgen_worker.py)
+    # when one is running; otherwise fall through and run in-process.
+    try:
+        from docgen_worker import forward_cli
+        _exit_code = forward_cli("generate_debrief_doc", sys.argv[1:])
+    except ImportError:
+        _exit_code = None
+    if _exit_code is not None:
+        sys.exit(_exit_code)
+
 from docx import Document
 from docx.enum.section import WD_SECTION_START
 from docx.enum.table import WD_CELL_VERTICAL_ALIGNMENT, WD_TABLE_ALIGNMENT
@@ -800,6 +827,10 @@ def _hp(val: int) -> Pt:
 class DebriefDocxGenerator:
     """Generate a branded hackathon debrief DOCX from structured JSON content."""
 
+    # Compat settings, doc defaults and styles, built once per process and
+    # deep-copied for every document (see base_document()).
+    _base_document = None
+
     def __init__(
         self,
         content: Dict[str, Any],
@@ -814,18 +845,32 @@ class DebriefDocxGenerator:
     # Public API
     # ------------------------------------------------------------------
 
-    def generate(self, output_path: str) -> None:
-        """Build the document and save to *output_path*."""
-        doc = Document()
+    @classmethod
+    def base_document(cls) -> Document:
+        """Return a fresh copy of the pre-configured base document.
+
+        The compat fix, document defaults and brand styles are identical for
+        every debrief, so they are applied once per process and each
+        document starts from a deep copy of that base.
+        """
+        if cls._base_document is None:
+            doc = Document()
 
-        # Fix compatibility mode: python-docx defaults to Word 2010 (mode 14)
-        # which doesn't properly honour cell-level tcMar margins.
-        # Mode 15 (Word 2013+) renders them correctly.
-        self._fix_compat_settings(doc)
+            # Fix compatibility mode: python-docx defaults to Word 2010 (mode 14)
+            # which doesn't properly honour cell-level tcMar margins.
+            # Mode 15 (Word 2013+) renders them correctly.
+            cls._fix_compat_settings(doc)
 
-        # Configure document-level defaults and styles to match brand
-        self._configure_document_defaults(doc)
-        self._configure_styles(doc)
+            # Configure document-level defaults and styles to match brand
+            cls._configure_document_defaults(doc)
+            cls._configure_styles(doc)
+            cls._base_document = doc
+        return deepcopy(cls._base_document)
+
+    def generate(self, output_path: str) -> None:
+        """Build the document and save to *output_path*."""
+        with span("base_document"):
+            doc = self.base_document()
 
         # ---- Section 1: Title page ----
         self._setup_title_section(doc)
@@ -886,7 +931,8 @@ class DebriefDocxGenerator:
 
         # Save
         os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
-        doc.save(output_path)
+        with span("save"):
+            doc.save(output_path)
         print(f'Successfully generated: {output_path}')
 
     # ------------------------------------------------------------------
@@ -1152,6 +1198,7 @@ class DebriefDocxGenerator:
     # Section 1: Title page
     # ------------------------------------------------------------------
 
+    @traced()
     def _setup_title_section(self, doc: Document) -> None:
         """Configure the first section for the full-bleed title page."""
         section = doc.sections[0]
@@ -1162,6 +1209,7 @@ class DebriefDocxGenerator:
         section.left_margin = Twips(0)
         section.right_margin = Twips(0)
 
+    @traced()
     def _build_title_page_table(self, doc: Document) -> None:
         """Create the single-cell green table that forms the cover page.
 
@@ -1411,6 +1459,7 @@ class DebriefDocxGenerator:
     # Section 2: TOC
     # ------------------------------------------------------------------
 
+    @traced()
     def _add_toc_title(self, doc: Document) -> None:
         """Add the TOC heading.
 
@@ -1426,6 +1475,7 @@ class DebriefDocxGenerator:
                          size_hp=56, size_cs_hp=56,
                          color=BRAND_COLORS['sharpGreen'], bold=True)
 
+    @traced()
     def _add_static_toc(self, doc: Document) -> None:
         """Build clickable TOC entries with dotted tab leaders."""
         data = self.content.get('structuredData', self.content)
@@ -1476,6 +1526,7 @@ class DebriefDocxGenerator:
     # Section 2: Content sections
     # ------------------------------------------------------------------
 
+    @traced()
     def _add_content_sections(self, doc: Document) -> None:
         """Add all content sections in canonical order."""
         data = self.content.get('structuredData', self.content)
@@ -1503,6 +1554,7 @@ class DebriefDocxGenerator:
             cleaned = _strip_code_blocks(_strip_redundant_heading(title, content_text))
             self._convert_markdown(doc, cleaned)
 
+    @traced()
     def _convert_markdown(self, doc: Document, markdown: str) -> None:
         """Convert markdown text into document paragraphs and tables."""
         blocks = _parse_markdown_blocks(markdown)
@@ -1589,6 +1641,7 @@ class DebriefDocxGenerator:
             if r.italic:
                 run.italic = True
 
+    @traced()
     def _add_image_block(self, doc: Document, url: str, alt: str) -> None:
         """Embed a base64 data-URL image or add a placeholder."""
         decoded = _decode_data_url(url)
@@ -1629,6 +1682,7 @@ class DebriefDocxGenerator:
             _add_run(cap_para, alt.strip(), FONT_FAMILIES['body'], Pt(9),
                      BRAND_COLORS['ceruleanBlue'], italic=True)
 
+    @traced()
     def _add_table_block(self, doc: Document, block: MdTable) -> None:
         """Render a markdown table with header shading and thin borders."""
         col_count = max(len(block.headers), 1)
@@ -1722,14 +1776,88 @@ class DebriefDocxGenerator:
 # CLI
 # ---------------------------------------------------------------------------
 
-def main() -> int:
+def _collect_batch_inputs(paths: List[str]) -> List[str]:
+    """Expand ``--batch`` arguments: JSON files as-is, directories to their *.json."""
+    files: List[str] = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, name) for name in sorted(os.listdir(path))
+                if name.lower().endswith('.json')
+            )
+        else:
+            files.append(path)
+    return files
+
+
+def _generate_one(content_path: str, output_path: str,
+                  logo_dir: Optional[str]) -> Tuple[str, float, Optional[str]]:
+    """Build one debrief document; returns (output, seconds, error)."""
+    start = time.perf_counter()
+    try:
+        with open(content_path, 'r', encoding='utf-8') as f:
+            content = json.load(f)
+        DebriefDocxGenerator(content, logo_dir=logo_dir).generate(output_path)
+        error = None
+    except Exception as exc:
+        error = f'{type(exc).__name__}: {exc}'
+    return output_path, time.perf_counter() - start, error
+
+
+def _init_batch_worker() -> None:
+    """Build the shared base document once per worker process."""
+    DebriefDocxGenerator.base_document()
+
+
+def generate_batch(
+    content_paths: List[str],
+    output_dir: str,
+    logo_dir: Optional[str] = None,
+    jobs: int = 0,
+) -> List[Tuple[str, str, float, Optional[str]]]:
+    """Generate one debrief per content JSON across a process pool.
+
+    Each document is written to ``<output_dir>/<content stem>.docx``; inputs
+    from different folders that share a stem get ``<stem>-2.docx``,
+    ``<stem>-3.docx``, ... in input order.  A failing document is reported
+    in the result instead of stopping the batch.  Returns ``(content_path,
+    output_path, seconds, error)`` tuples in input order.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    outputs = []
+    used_stems = set()
+    for path in content_paths:
+        stem = base = os.path.splitext(os.path.basename(path))[0]
+        n = 1
+        while stem in used_stems:
+            n += 1
+            stem = f'{base}-{n}'
+        used_stems.add(stem)
+        outputs.append(os.path.join(output_dir, stem + '.docx'))
+
+    # Built before the pool starts so forked workers inherit it
+    _init_batch_worker()
+
+    jobs = jobs or min(len(content_paths), os.cpu_count() or 1)
+    if jobs <= 1:
+        results = [_generate_one(c, o, logo_dir)
+                   for c, o in zip(content_paths, outputs)]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs,
+                                 initializer=_init_batch_worker) as pool:
+            futures = [pool.submit(_generate_one, c, o, logo_dir)
+                       for c, o in zip(content_paths, outputs)]
+            results = [f.result() for f in futures]
+    return [(c,) + r for c, r in zip(content_paths, results)]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """Entry point for CLI invocation."""
     parser = argparse.ArgumentParser(
         description='Generate branded hackathon debrief DOCX from JSON content',
     )
     parser.add_argument(
         '--content',
-        required=True,
         help='Path to the JSON content file',
     )
     parser.add_argument(
@@ -1739,11 +1867,58 @@ def main() -> int:
     )
     parser.add_argument(
         '--output',
-        required=True,
         help='Output DOCX file path',
     )
+    parser.add_argument(
+        '--batch',
+        nargs='+',
+        metavar='PATH',
+        help='Content JSON files and/or directories of them; one DOCX each',
+    )
+    parser.add_argument(
+        '--output-dir',
+        help='Batch mode: directory for the generated DOCX files',
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=0,
+        help='Batch mode: worker processes (default: one per CPU)',
+    )
+    add_profile_arguments(parser)
+
+    args = parser.parse_args(argv)
 
-    args = parser.parse_args()
+    if args.logo_dir and not os.path.isdir(args.logo_dir):
+        print(f'Warning: Logo directory not found: {args.logo_dir}', file=sys.stderr)
+
+    if args.batch:
+        if not args.output_dir:
+            parser.error('--output-dir is required with --batch')
+        content_paths = _collect_batch_inputs(args.batch)
+        if not content_paths:
+            print('Error: No content JSON files found for --batch', file=sys.stderr)
+            return 1
+
+        print(f'Generating {len(content_paths)} debrief documents...')
+        start = time.perf_counter()
+        with profiled(args, 'generate_debrief_doc --batch'):
+            results = generate_batch(content_paths, args.output_dir,
+                                     logo_dir=args.logo_dir, jobs=args.jobs)
+        failed = 0
+        for content_path, output_path, seconds, error in results:
+            if error:
+                failed += 1
+                print(f'  FAILED {content_path} ({seconds:.2f}s): {error}',
+                      file=sys.stderr)
+            else:
+                print(f'  {output_path} ({seconds:.2f}s)')
+        print(f'{len(results) - failed}/{len(results)} documents generated '
+              f'in {time.perf_counter() - start:.2f}s')
+        return 1 if failed else 0
+
+    if not args.content or not args.output:
+        parser.error('--content and --output are required unless --batch is given')
 
     # Validate inputs
     if not os.path.isfile(args.content):
@@ -1759,13 +1934,11 @@ def main() -> int:
         print(f'Error parsing JSON: {exc}', file=sys.stderr)
         return 1
 
-    if args.logo_dir and not os.path.isdir(args.logo_dir):
-        print(f'Warning: Logo directory not found: {args.logo_dir}', file=sys.stderr)
-
     # Generate
     try:
         generator = DebriefDocxGenerator(content, logo_dir=args.logo_dir)
-        generator.generate(args.output)
+        with profiled(args, 'generate_debrief_doc'):
+            generator.generate(args.output)
         return 0
     except Exception as exc:
         print(f'Error generating document: {exc}', file=sys.stderr)
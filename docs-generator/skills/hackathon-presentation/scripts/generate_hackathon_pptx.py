@@ -23,14 +23,34 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import os
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
 from copy import deepcopy
 
+# Shared helpers (docgen_trace, docgen_worker, docgen_footer) live in <plugin>/scripts
+_PLUGIN_SCRIPTS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                "..", "..", "..", "scripts"))
+if _PLUGIN_SCRIPTS not in sys.path:
+    sys.path.insert(0, _PLUGIN_SCRIPTS)
+from docgen_trace import add_profile_arguments, profiled, span, traced
+
+if __name__ == "__main__":
+    # Hand off to a warm docgen worker (<plugin>/scripts/docgen_worker.py)
+    # when one is running; otherwise fall through and run in-process.
+    try:
+        from docgen_worker import forward_cli
+        _exit_code = forward_cli("generate_hackathon_pptx", sys.argv[1:])
+    except ImportError:
+        _exit_code = None
+    if _exit_code is not None:
+        sys.exit(_exit_code)
+
 from pptx import Presentation
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
@@ -40,6 +60,8 @@ from pptx.oxml import parse_xml
 from pptx.oxml.ns import nsdecls
 from lxml import etree
 
+from docgen_footer import copyright_text, rewrite_copyright_footers
+
 # ---------------------------------------------------------------------------
 # Brand Colors (from original PPTX XML analysis)
 # ---------------------------------------------------------------------------
@@ -61,6 +83,9 @@ NS_A = 'http://schemas.openxmlformats.org/drawingml/2006/main'
 NS_P = 'http://schemas.openxmlformats.org/presentationml/2006/main'
 NS_R = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
 
+# Default copyright years; variables.json can override them via "copyright_year"
+COPYRIGHT_YEARS = "2019-2026"
+
 # ---------------------------------------------------------------------------
 # Rich Text Parsing — **bold** and <<green>>
 # ---------------------------------------------------------------------------
@@ -137,19 +162,141 @@ def load_json(path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
+# Resolved template path -> (mtime_ns, size, sha256) of the file last seen there
+_TEMPLATE_DIGESTS: Dict[str, Tuple[int, int, str]] = {}
+
+# sha256 of template bytes -> parsed Presentation (never handed out directly)
+_TEMPLATE_CACHE: Dict[str, Any] = {}
+
+# sha256 of template bytes -> LayoutTable of that template
+_LAYOUT_TABLES: Dict[str, "LayoutTable"] = {}
+
+
+def _template_digest(template_path: Path) -> str:
+    """sha256 of the template, re-hashed only when its mtime or size changes."""
+    path = str(Path(template_path).resolve())
+    st = os.stat(path)
+    cached = _TEMPLATE_DIGESTS.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(path, 'rb') as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if cached and cached[2] != digest:
+        _TEMPLATE_CACHE.pop(cached[2], None)
+        _LAYOUT_TABLES.pop(cached[2], None)
+    _TEMPLATE_DIGESTS[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+class LayoutTable(NamedTuple):
+    """Layout lookups of one template, independent of any Presentation copy.
+
+    positions maps a layout name to its index in ``prs.slide_layouts`` (the
+    first layout of that name wins, as with a linear scan); placeholders
+    maps a layout name to the idx values of the placeholders add_slide()
+    clones onto a new slide.
+    """
+    positions: Dict[str, int]
+    placeholders: Dict[str, FrozenSet[int]]
+
+    @classmethod
+    def build(cls, prs) -> "LayoutTable":
+        positions: Dict[str, int] = {}
+        placeholders: Dict[str, FrozenSet[int]] = {}
+        for i, layout in enumerate(prs.slide_layouts):
+            if layout.name in positions:
+                continue
+            positions[layout.name] = i
+            placeholders[layout.name] = frozenset(
+                ph.placeholder_format.idx for ph in layout.iter_cloneable_placeholders()
+            )
+        return cls(positions, placeholders)
+
+
+class LayoutRegistry:
+    """Name -> layout lookups for one Presentation, backed by a LayoutTable."""
+
+    def __init__(self, prs, table: LayoutTable):
+        self._prs = prs
+        self.table = table
+        self._layouts: Dict[str, Any] = {}
+
+    def layout(self, name: str):
+        """Return the layout called *name*, or None (with a warning)."""
+        layout = self._layouts.get(name)
+        if layout is None:
+            pos = self.table.positions.get(name)
+            if pos is None:
+                logger.warning(f"Layout not found: {name}")
+                return None
+            layout = self._layouts[name] = self._prs.slide_layouts[pos]
+        return layout
+
+
+def layout_registry(prs) -> LayoutRegistry:
+    """Return the LayoutRegistry of *prs*, building one if it has none yet."""
+    registry = getattr(prs, "_layout_registry", None)
+    if registry is None:
+        registry = prs._layout_registry = LayoutRegistry(prs, LayoutTable.build(prs))
+    return registry
+
+
+@traced()
+def load_template(template_path: Path):
+    """Return a private copy of the parsed template (parsed once per content).
+
+    The copy comes with its LayoutRegistry attached; the layout table behind
+    it is built once per template content as well.
+    """
+    digest = _template_digest(template_path)
+    prs = _TEMPLATE_CACHE.get(digest)
+    if prs is None:
+        with span("parse_template"):
+            prs = Presentation(str(template_path))
+        _TEMPLATE_CACHE[digest] = prs
+    with span("copy_template"):
+        copy = deepcopy(prs)
+    # Built from the copy: lazily created python-pptx collections on the
+    # cached Presentation would come out of deepcopy detached from its XML.
+    table = _LAYOUT_TABLES.get(digest)
+    if table is None:
+        with span("layout_table"):
+            table = _LAYOUT_TABLES[digest] = LayoutTable.build(copy)
+    copy._layout_registry = LayoutRegistry(copy, table)
+    return copy
+
+
 def find_layout(prs, name: str):
-    for layout in prs.slide_layouts:
-        if layout.name == name:
-            return layout
-    logger.warning(f"Layout not found: {name}")
-    return None
+    return layout_registry(prs).layout(name)
 
 
 def ph_by_idx(slide, idx: int):
-    for ph in slide.placeholders:
-        if ph.placeholder_format.idx == idx:
+    """Return the placeholder *idx* of *slide*, or None.
+
+    Placeholders are mapped once per slide. The map is rebuilt on a miss or
+    when the mapped placeholder has left the slide (insert_picture() and
+    insert_table() swap in a new element with the same idx). Slides here
+    only carry the placeholders cloned from their layout, so an idx the
+    layout lacks is answered from the registry without touching the slide.
+    """
+    phs = getattr(slide, "_ph_by_idx", None)
+    if phs is not None:
+        ph = phs.get(idx)
+        # A replaced placeholder proxy drops its element
+        element = ph._element if ph is not None else None
+        if element is not None and element.getparent() is not None:
             return ph
-    return None
+
+    table = layout_registry(slide.part.package.presentation_part.presentation).table
+    layout_idx = table.placeholders.get(slide.slide_layout.name)
+    if layout_idx is not None and idx not in layout_idx:
+        return None
+    phs = {}
+    for ph in slide.placeholders:
+        phs.setdefault(ph.placeholder_format.idx, ph)
+    slide._ph_by_idx = phs
+    return phs.get(idx)
 
 
 def set_ph_text_theme(ph, text: str, size: int = None, bold: bool = False):
@@ -311,9 +458,13 @@ def add_speaker_notes(slide, text):
     tf.text = text
 
 
-def set_footer_textbox(slide, slide_num, copyright_text="© 2019-2026 ONE THOUSAND"):
-    """Add footer as textbox matching original format: center-aligned at bottom."""
-    add_textbox(slide, 4.62, 7.05, 4.09, 0.20, copyright_text,
+def set_footer_textbox(slide, slide_num, text=copyright_text(COPYRIGHT_YEARS)):
+    """Add footer as textbox matching original format: center-aligned at bottom.
+
+    The years are set for the whole deck by rewrite_copyright_footers()
+    before saving.
+    """
+    add_textbox(slide, 4.62, 7.05, 4.09, 0.20, text,
                 font_size=8, text_color=OT_MID_GRAY,
                 alignment=PP_ALIGN.CENTER,
                 vertical_anchor=MSO_ANCHOR.TOP)
@@ -347,6 +498,7 @@ def remove_shape_by_ph_idx(slide, idx):
 # Slide creation functions — EXACT match to original PPTX
 # ---------------------------------------------------------------------------
 
+@traced()
 def make_cover(prs, client_name, location, date, use_case_title, day=1, verbose=False):
     """Cover slide — 'Title Lime + one Logo' layout.
 
@@ -411,6 +563,7 @@ def make_cover(prs, client_name, location, date, use_case_title, day=1, verbose=
         logger.info(f"Created Day {day} cover slide")
 
 
+@traced()
 def make_checkin(prs, questions, client_name, verbose=False):
     """Check-in slide — 'Bullet Points Ash' layout.
 
@@ -472,6 +625,7 @@ def make_checkin(prs, questions, client_name, verbose=False):
         logger.info("Created Check-in slide")
 
 
+@traced()
 def make_agenda(prs, agenda_data, verbose=False):
     """Agenda slide — 'Dayline Lime' layout."""
     layout = find_layout(prs, "Dayline Lime")
@@ -521,6 +675,7 @@ def make_agenda(prs, agenda_data, verbose=False):
         logger.info("Created Agenda slide")
 
 
+@traced()
 def make_toc(prs, verbose=False):
     """Table of Contents — 'Table of Contents large' layout.
 
@@ -556,6 +711,7 @@ def make_toc(prs, verbose=False):
         logger.info("Created TOC slide")
 
 
+@traced()
 def make_pain(prs, bullets, verbose=False):
     """Pain slide — 'Chapter Divider Ash + Text' layout.
 
@@ -602,6 +758,7 @@ def make_pain(prs, bullets, verbose=False):
         logger.info("Created Pain slide")
 
 
+@traced()
 def make_data(prs, bullets, verbose=False):
     """Data slide — 'Chapter Divider Ash + Text' layout.
 
@@ -656,6 +813,7 @@ def make_data(prs, bullets, verbose=False):
         logger.info("Created Data slide")
 
 
+@traced()
 def make_data_screenshots(prs, verbose=False):
     """Data screenshots slide — 'Title Ash + small Image' layout."""
     layout = find_layout(prs, "Title Ash + small Image")
@@ -672,6 +830,7 @@ def make_data_screenshots(prs, verbose=False):
         logger.info("Created Data Screenshots slide")
 
 
+@traced()
 def make_approach(prs, bullets, verbose=False):
     """Approach slide — 'Chapter Divider Ash + Text' layout.
 
@@ -734,6 +893,7 @@ def make_approach(prs, bullets, verbose=False):
         logger.info("Created Approach slide")
 
 
+@traced()
 def make_challenges(prs, bullets, verbose=False):
     """Challenges slide — 'Chapter Divider Ash + Text' layout.
 
@@ -785,6 +945,7 @@ def make_challenges(prs, bullets, verbose=False):
         logger.info("Created Challenges slide")
 
 
+@traced()
 def make_divider(prs, title, verbose=False):
     """Green chapter divider — 'Chapter Divider Lime' layout."""
     layout = find_layout(prs, "Chapter Divider Lime")
@@ -800,6 +961,7 @@ def make_divider(prs, title, verbose=False):
         logger.info(f"Created divider: {title}")
 
 
+@traced()
 def make_process_flow(prs, verbose=False):
     """Process Flow slide — DEFAULT layout.
 
@@ -828,6 +990,7 @@ def make_process_flow(prs, verbose=False):
         logger.info("Created Process Flow slide")
 
 
+@traced()
 def make_architecture(prs, verbose=False):
     """Architecture slide — DEFAULT layout.
 
@@ -856,6 +1019,7 @@ def make_architecture(prs, verbose=False):
         logger.info("Created Architecture slide")
 
 
+@traced()
 def make_business_value(prs, bv_data, verbose=False):
     """Business value slide — 'Table of Contents small' layout.
 
@@ -974,6 +1138,7 @@ def _set_run_scheme_color(run, scheme_val="tx1"):
     schemeClr.set('val', scheme_val)
 
 
+@traced()
 def make_poc_summary(prs, intro, features, verbose=False):
     """PoC Summary slide — DEFAULT layout.
 
@@ -1030,6 +1195,7 @@ def make_poc_summary(prs, intro, features, verbose=False):
         logger.info("Created PoC Summary slide")
 
 
+@traced()
 def make_image_slide_blank(prs, image_desc, verbose=False):
     """Blank image slide for team photos — DEFAULT layout."""
     layout = find_layout(prs, "DEFAULT")
@@ -1043,6 +1209,7 @@ def make_image_slide_blank(prs, image_desc, verbose=False):
         logger.info(f"Created blank image slide: {image_desc}")
 
 
+@traced()
 def make_whats_next(prs, next_steps, verbose=False):
     """What's Next slide — 'Chapter Divider Ash + Text' layout.
 
@@ -1111,6 +1278,7 @@ def make_whats_next(prs, next_steps, verbose=False):
         logger.info("Created What's Next slide")
 
 
+@traced()
 def make_thanks(prs, ot_team, client_contacts, client_name, verbose=False):
     """Thanks slide — 'Bullet Points Ash' layout.
 
@@ -1127,13 +1295,7 @@ def make_thanks(prs, ot_team, client_contacts, client_name, verbose=False):
 
     # Clear all default placeholders from this layout
     for idx in [0, 1, 27, 36, 42, 44, 45, 46, 47]:
-        ph = ph_by_idx(slide, idx)
-        if ph:
-            try:
-                sp = ph._element
-                sp.getparent().remove(sp)
-            except Exception:
-                pass
+        remove_shape_by_ph_idx(slide, idx)
 
     # Bottom dark rectangle bar (like original Rechteck 27)
     rect = slide.shapes.add_shape(
@@ -1200,7 +1362,7 @@ def generate_presentation(template_path, variables_path, content_path,
                           output_path, verbose=False):
     variables = load_json(variables_path)
     content = load_json(content_path)
-    prs = Presentation(str(template_path))
+    prs = load_template(template_path)
 
     client = variables.get("client_name", "Client")
     location = variables.get("location", "Location")
@@ -1277,25 +1439,35 @@ def generate_presentation(template_path, variables_path, content_path,
 
     make_thanks(prs, ot_team, client_contacts, client, verbose=verbose)
 
-    prs.save(str(output_path))
+    # One pass over slides and layouts: the footers added above plus any
+    # template footer text the slides inherit from their layouts. No colour,
+    # so layout footers keep their theme colour on dark and light covers.
+    copyright_year = variables.get("copyright_year", COPYRIGHT_YEARS)
+    with span("copyright_footers"):
+        rewrite_copyright_footers(prs, copyright_year, layouts=True)
+
+    with span("save"):
+        prs.save(str(output_path))
     logger.info(f"Saved {slide_count(prs)} slides → {output_path}")
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(description="Generate OT hackathon presentation v2")
     parser.add_argument("--template", type=Path, required=True)
     parser.add_argument("--variables", type=Path, required=True)
     parser.add_argument("--content", type=Path, required=True)
     parser.add_argument("--output", type=Path, required=True)
     parser.add_argument("--verbose", action="store_true")
-    args = parser.parse_args()
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
 
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
     try:
-        generate_presentation(args.template, args.variables, args.content,
-                              args.output, args.verbose)
+        with profiled(args, "generate_hackathon_pptx"):
+            generate_presentation(args.template, args.variables, args.content,
+                                  args.output, args.verbose)
     except Exception as e:
         logger.error(f"Error: {e}")
         if args.verbose:
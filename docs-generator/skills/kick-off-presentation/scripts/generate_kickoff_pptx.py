@@ -21,27 +21,58 @@ Usage:
         --content content.json \\
         --output output.pptx \\
         [--verbose]
+
+    # Many decks at once (manifest / JSONL / directory of client folders)
+    python generate_kickoff_pptx.py \\
+        --template assets/templates/ot-kickoff-template.pptx \\
+        --batch clients/ --output-dir decks/ [--jobs 4]
 """
 
 import argparse
+import hashlib
+import io
 import json
 import logging
+import math
 import os
 import re
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Shared helpers (docgen_trace, docgen_worker, docgen_footer) live in <plugin>/scripts
+_PLUGIN_SCRIPTS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                "..", "..", "..", "scripts"))
+if _PLUGIN_SCRIPTS not in sys.path:
+    sys.path.insert(0, _PLUGIN_SCRIPTS)
+from docgen_trace import add_profile_arguments, profiled, span, traced
+
+if __name__ == "__main__":
+    # Hand off to a warm docgen worker (<plugin>/scripts/docgen_worker.py)
+    # when one is running; otherwise fall through and run in-process.
+    try:
+        from docgen_worker import forward_cli
+        _exit_code = forward_cli("generate_kickoff_pptx", sys.argv[1:])
+    except ImportError:
+        _exit_code = None
+    if _exit_code is not None:
+        sys.exit(_exit_code)
 
 from lxml import etree
 from pptx import Presentation
 from pptx.dml.color import RGBColor
 from pptx.enum.shapes import MSO_SHAPE
 from pptx.enum.text import MSO_ANCHOR, PP_ALIGN
+from pptx.opc.packuri import PackURI
 from pptx.oxml import parse_xml
 from pptx.oxml.ns import nsdecls
 from pptx.util import Emu, Inches, Pt
 
+from docgen_footer import rewrite_copyright_footers
+
 # ---------------------------------------------------------------------------
 # Brand Colors (from OT PPTX theme analysis)
 # ---------------------------------------------------------------------------
@@ -169,12 +200,185 @@ def find_layout(prs, name: str):
     return None
 
 
+class IndexedShape(NamedTuple):
+    """A shape plus the geometry (in inches) recorded when it was indexed."""
+    shape: Any
+    order: int
+    left: float
+    top: float
+    width: float
+    height: float
+    is_placeholder: bool
+    has_text_frame: bool
+
+
+class SlideIndex:
+    """Placeholder, name and position lookups for one slide or slide layout.
+
+    Built in a single pass over the shape tree. Placeholders are keyed by
+    idx and shapes by name (first one in z-order wins, as with a linear
+    scan), and every shape is bucketed into a grid of GRID_SIZE-inch cells
+    by its top-left corner so position queries only look at nearby shapes.
+
+    The index notices shapes being added or removed (see ``stale``), but
+    not shapes being moved: call ``invalidate`` after repositioning shapes
+    that later position queries depend on.
+    """
+
+    GRID_SIZE = 1.0
+
+    def __init__(self, owner):
+        self._owner = owner
+        self._tree = owner.shapes._spTree
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Rebuild every lookup from the current shape tree."""
+        self.placeholders: Dict[int, Any] = {}
+        self.names: Dict[str, Any] = {}
+        self.entries: List[IndexedShape] = []
+        self._grid: Dict[Tuple[int, int], List[IndexedShape]] = {}
+
+        for order, shape in enumerate(self._owner.shapes):
+            is_placeholder = shape.is_placeholder
+            if is_placeholder:
+                self.placeholders.setdefault(shape.placeholder_format.idx, shape)
+            self.names.setdefault(shape.name, shape)
+
+            entry = IndexedShape(
+                shape, order,
+                (shape.left or 0) / 914400, (shape.top or 0) / 914400,
+                (shape.width or 0) / 914400, (shape.height or 0) / 914400,
+                is_placeholder, shape.has_text_frame,
+            )
+            self.entries.append(entry)
+            self._grid.setdefault(self._cell(entry.left, entry.top), []).append(entry)
+
+        self._signature = self._current_signature()
+
+    def _current_signature(self):
+        # Adding appends to the tree and removing shortens it, so the child
+        # count plus the last child catch both without walking the shapes.
+        tree = self._tree
+        return (len(tree), tree[-1] if len(tree) else None)
+
+    @property
+    def stale(self) -> bool:
+        """True once shapes were added to or removed from the shape tree."""
+        count, last = self._current_signature()
+        return count != self._signature[0] or last is not self._signature[1]
+
+    def _cell(self, left: float, top: float) -> Tuple[int, int]:
+        return (math.floor(left / self.GRID_SIZE), math.floor(top / self.GRID_SIZE))
+
+    def placeholder(self, idx: int):
+        """Return the placeholder with *idx*, or None."""
+        return self.placeholders.get(idx)
+
+    def by_name(self, name: str):
+        """Return the shape called *name*, or None."""
+        return self.names.get(name)
+
+    def within(
+        self,
+        left: Optional[Tuple[float, float]] = None,
+        top: Optional[Tuple[float, float]] = None,
+        text_only: bool = True,
+        include_placeholders: bool = False,
+    ) -> List[IndexedShape]:
+        """Return shapes whose top-left corner lies inside the given ranges.
+
+        *left* and *top* are exclusive ``(low, high)`` bounds in inches; None
+        leaves that axis unbounded. By default only non-placeholder shapes
+        with a text frame are returned. Results are in z-order, so the first
+        hit is the one a linear scan of ``slide.shapes`` would have found.
+        """
+        cols = self._cell_span(left, 0)
+        rows = self._cell_span(top, 1)
+        hits = []
+        for col in cols:
+            for row in rows:
+                for entry in self._grid.get((col, row), ()):
+                    if text_only and not entry.has_text_frame:
+                        continue
+                    if entry.is_placeholder and not include_placeholders:
+                        continue
+                    if left and not left[0] < entry.left < left[1]:
+                        continue
+                    if top and not top[0] < entry.top < top[1]:
+                        continue
+                    hits.append(entry)
+        hits.sort(key=lambda e: e.order)
+        return hits
+
+    def nearest(
+        self,
+        anchors: List[Tuple[float, float]],
+        tolerance: float = 1.0,
+        accept: Optional[Callable[[IndexedShape], bool]] = None,
+        text_only: bool = True,
+        include_placeholders: bool = False,
+    ) -> List[Any]:
+        """Match every ``(left, top)`` anchor to its closest shape in one pass.
+
+        Distance is the Manhattan distance between top-left corners in
+        inches, and only shapes closer than *tolerance* qualify; *accept*
+        can narrow the candidates further. Only the grid cells around the
+        anchors are visited, and each candidate is measured against every
+        anchor at once. Returns one shape (or None) per anchor; ties go to
+        the shape earlier in z-order, and anchors are matched independently.
+        """
+        reach = math.ceil(tolerance / self.GRID_SIZE)
+        cells = set()
+        for left, top in anchors:
+            col, row = self._cell(left, top)
+            for dc in range(-reach, reach + 1):
+                for dr in range(-reach, reach + 1):
+                    cells.add((col + dc, row + dr))
+
+        candidates = [
+            entry
+            for cell in cells
+            for entry in self._grid.get(cell, ())
+            if (entry.has_text_frame or not text_only)
+            and (include_placeholders or not entry.is_placeholder)
+            and (accept is None or accept(entry))
+        ]
+        candidates.sort(key=lambda e: e.order)
+
+        best: List[Any] = [None] * len(anchors)
+        best_dist = [tolerance] * len(anchors)
+        for entry in candidates:
+            for i, (left, top) in enumerate(anchors):
+                dist = abs(entry.left - left) + abs(entry.top - top)
+                if dist < best_dist[i]:
+                    best_dist[i] = dist
+                    best[i] = entry.shape
+        return best
+
+    def _cell_span(self, bounds: Optional[Tuple[float, float]], axis: int) -> Iterable[int]:
+        if bounds is None:
+            return sorted({key[axis] for key in self._grid})
+        low, high = (math.floor(b / self.GRID_SIZE) for b in bounds)
+        return range(low, high + 1)
+
+
+def get_slide_index(owner) -> SlideIndex:
+    """Return the cached SlideIndex of a slide or layout, rebuilding it if stale.
+
+    python-pptx hands out the same Slide / SlideLayout object for a part on
+    every access, so the index lives on that object and is dropped with it.
+    """
+    index = getattr(owner, "_slide_index", None)
+    if index is None or index.stale:
+        index = SlideIndex(owner)
+        owner._slide_index = index
+    return index
+
+
 def _find_placeholder(slide, idx: int):
     """Find a placeholder on a slide by its idx. Returns None if not found."""
-    for ph in slide.placeholders:
-        if ph.placeholder_format.idx == idx:
-            return ph
-    return None
+    return get_slide_index(slide).placeholder(idx)
 
 
 def _set_placeholder_text(
@@ -228,6 +432,7 @@ def _set_placeholder_text_theme(
                           font_name=font_name)
 
 
+@traced()
 def _add_image_to_slide(
     slide,
     image_path: str,
@@ -417,12 +622,7 @@ def _promote_layout_fill_to_slide(slide_ph, layout):
     in both PowerPoint and LibreOffice.
     """
     ph_idx = slide_ph.placeholder_format.idx
-    # Find matching layout placeholder
-    layout_ph = None
-    for lph in layout.placeholders:
-        if lph.placeholder_format.idx == ph_idx:
-            layout_ph = lph
-            break
+    layout_ph = get_slide_index(layout).placeholder(ph_idx)
     if layout_ph is None:
         return
 
@@ -553,32 +753,30 @@ DIVIDER_HIGHLIGHT_MAP = {
     18: 6,  # Check Out
 }
 
+# Top-left corners (inches) of the pain, data and solution text boxes on
+# the Pain x Data slide
+PAIN_DATA_ANCHORS = [(0.25, 4.72), (4.97, 4.72), (9.37, 4.71)]
+
 
-def _compute_page_numbers(total_slides: int, extra_uc_slides: int = 0) -> Dict[int, str]:
-    """Compute page references for each section based on slide positions.
+def _compute_page_numbers(deck_positions: Dict[int, int]) -> Dict[int, str]:
+    """Compute page references for each section from real slide positions.
 
-    Base slide positions (0-indexed):
-      Section 1 (Check In):      slide 2  (divider), content starts slide 3
-      Section 2 (Use-case):      slide 4  (divider), content starts slide 5
-      Section 3 (Timeline):      slide 9  (divider) + extra_uc_slides offset
-      Section 4 (Collaboration): slide 13 + extra_uc_slides offset
-      Section 5 (Other Topics):  slide 16 + extra_uc_slides offset
-      Section 6 (Check Out):     slide 18 + extra_uc_slides offset
+    Each section's page is the 1-indexed deck position of its divider slide
+    (template slides 2, 4, 9, 13, 16 and 18, see DIVIDER_HIGHLIGHT_MAP).
+    *deck_positions* maps a template slide index to its index in the deck,
+    which differs once Pain x Data clones are inserted; template slides
+    missing from it keep their own index.
 
     Returns dict mapping section number to two-digit page string.
-    Page numbers shown in the ToC represent the divider slide position (1-indexed).
     """
-    offset = extra_uc_slides
     return {
-        1: f"{3:02d}",
-        2: f"{5:02d}",
-        3: f"{10 + offset:02d}",
-        4: f"{14 + offset:02d}",
-        5: f"{17 + offset:02d}",
-        6: f"{19 + offset:02d}",
+        section: f"{deck_positions.get(template_index, template_index) + 1:02d}"
+        for template_index, section in DIVIDER_HIGHLIGHT_MAP.items()
+        if section
     }
 
 
+@traced()
 def _fill_agenda_slide(
     slide,
     sections: List[Dict[str, str]],
@@ -629,6 +827,7 @@ def _fill_agenda_slide(
 # ---------------------------------------------------------------------------
 
 
+@traced()
 def fill_cover(slide, variables: Dict, content: Dict, verbose: bool = False):
     """Fill cover slide (slide 0) -- Title Lime + one Logo layout.
 
@@ -690,6 +889,7 @@ def fill_cover(slide, variables: Dict, content: Dict, verbose: bool = False):
         logger.info("Filled cover slide")
 
 
+@traced()
 def fill_agenda(
     slide,
     sections: List[Dict[str, str]],
@@ -714,6 +914,7 @@ def fill_agenda(
         logger.info(f"Filled slide {slide_index}: {label}")
 
 
+@traced()
 def fill_checkin(slide, content: Dict, variables: Dict, images: Dict,
                  verbose: bool = False):
     """Fill check-in slide (slide 3) -- Bullet Points Lime layout.
@@ -739,21 +940,10 @@ def fill_checkin(slide, content: Dict, variables: Dict, images: Dict,
 
     # Find the existing question textbox by position (id=6, near 0.38, 3.09)
     question_box = None
-    for shape in slide.shapes:
-        if not shape.has_text_frame:
-            continue
-        try:
-            if shape.placeholder_format is not None:
-                continue
-        except:
-            pass
-        l = (shape.left or 0) / 914400
-        t = (shape.top or 0) / 914400
-        w = (shape.width or 0) / 914400
-        h = (shape.height or 0) / 914400
-        # Match the template textbox: near left edge, mid-slide vertically, ~6" wide
-        if 0.0 < l < 1.0 and 2.5 < t < 4.0 and w > 4.0 and h > 0.8:
-            question_box = shape
+    # Match the template textbox: near left edge, mid-slide vertically, ~6" wide
+    for entry in get_slide_index(slide).within(left=(0.0, 1.0), top=(2.5, 4.0)):
+        if entry.width > 4.0 and entry.height > 0.8:
+            question_box = entry.shape
             break
 
     if question_box and questions:
@@ -825,6 +1015,7 @@ def _checkin_gif_placeholder(slide, left, top, width, height):
     fill.fore_color.rgb = RGBColor(0xE0, 0xE0, 0xE0)
 
 
+@traced()
 def fill_pain_data(
     slide,
     uc_data: Dict,
@@ -855,36 +1046,11 @@ def fill_pain_data(
 
     # Find existing template textboxes by position
     # Template has: pain box ~(0.25, 4.72), data box ~(4.97, 4.72), solution box ~(9.37, 4.71)
-    def _is_placeholder(shape):
-        try:
-            return shape.placeholder_format is not None
-        except Exception:
-            return False
-
-    def _find_content_box(shapes, target_left, target_top, tolerance=1.0):
-        best = None
-        best_dist = float('inf')
-        for shape in shapes:
-            if not shape.has_text_frame:
-                continue
-            if _is_placeholder(shape):
-                continue
-            l = (shape.left or 0) / 914400
-            t = (shape.top or 0) / 914400
-            w = (shape.width or 0) / 914400
-            h = (shape.height or 0) / 914400
-            # Only consider reasonably sized text boxes (not the giant P/D watermarks or tiny copyright)
-            if w < 1.5 or h < 1.0 or w > 5.0:
-                continue
-            dist = abs(l - target_left) + abs(t - target_top)
-            if dist < best_dist and dist < tolerance:
-                best_dist = dist
-                best = shape
-        return best
-
-    pain_box = _find_content_box(slide.shapes, 0.25, 4.72)
-    data_box = _find_content_box(slide.shapes, 4.97, 4.72)
-    solution_box = _find_content_box(slide.shapes, 9.37, 4.71)
+    pain_box, data_box, solution_box = get_slide_index(slide).nearest(
+        PAIN_DATA_ANCHORS,
+        # Only reasonably sized text boxes (not the giant P/D watermarks or tiny copyright)
+        accept=lambda e: 1.5 <= e.width <= 5.0 and e.height >= 1.0,
+    )
 
     # Fill pain box
     if pain_box and pain_points:
@@ -934,6 +1100,7 @@ def fill_pain_data(
         logger.info("Filled Pain x Data slide")
 
 
+@traced()
 def fill_hackathon(slide, content: Dict, images: Dict, verbose: bool = False):
     """Fill hackathon validation slide (slide 6) -- DEFAULT layout.
 
@@ -997,6 +1164,7 @@ def fill_hackathon(slide, content: Dict, images: Dict, verbose: bool = False):
         logger.info("Filled hackathon validation slide")
 
 
+@traced()
 def fill_step_by_step(slide, content: Dict, images: Dict, verbose: bool = False):
     """Fill step-by-step slide (slide 7) -- Bullet Points Lime layout.
 
@@ -1021,21 +1189,10 @@ def fill_step_by_step(slide, content: Dict, images: Dict, verbose: bool = False)
 
     # Find the 4 phase label textboxes sorted by left position
     phase_boxes = []
-    for shape in slide.shapes:
-        if not shape.has_text_frame:
-            continue
-        try:
-            if shape.placeholder_format is not None:
-                continue
-        except:
-            pass
-        l = (shape.left or 0) / 914400
-        t = (shape.top or 0) / 914400
-        w = (shape.width or 0) / 914400
-        h = (shape.height or 0) / 914400
-        # Phase labels are along the bottom (y ~5.2-5.5), 2-3" wide
-        if 4.8 < t < 6.0 and w > 1.5 and w < 4.0 and h < 1.0:
-            phase_boxes.append((l, shape))
+    # Phase labels are along the bottom (y ~5.2-5.5), 2-3" wide
+    for entry in get_slide_index(slide).within(top=(4.8, 6.0)):
+        if 1.5 < entry.width < 4.0 and entry.height < 1.0:
+            phase_boxes.append((entry.left, entry.shape))
 
     phase_boxes.sort(key=lambda x: x[0])
 
@@ -1074,6 +1231,7 @@ def fill_step_by_step(slide, content: Dict, images: Dict, verbose: bool = False)
         logger.info("Filled step-by-step slide")
 
 
+@traced()
 def fill_architecture(slide, content: Dict, images: Dict, verbose: bool = False):
     """Fill architecture slide (slide 8) -- Bullet Points Lime layout.
 
@@ -1105,18 +1263,9 @@ def fill_architecture(slide, content: Dict, images: Dict, verbose: bool = False)
 
     # Find the capabilities autoshape (rounded rect at ~9.28, 2.05, ~3.76x3.77)
     cap_shape = None
-    for shape in slide.shapes:
-        l = (shape.left or 0) / 914400
-        t = (shape.top or 0) / 914400
-        w = (shape.width or 0) / 914400
-        h = (shape.height or 0) / 914400
-        if shape.has_text_frame and 8.5 < l < 10.5 and 1.5 < t < 3.0 and w > 2.5 and h > 2.5:
-            try:
-                if shape.placeholder_format is not None:
-                    continue
-            except:
-                pass
-            cap_shape = shape
+    for entry in get_slide_index(slide).within(left=(8.5, 10.5), top=(1.5, 3.0)):
+        if entry.width > 2.5 and entry.height > 2.5:
+            cap_shape = entry.shape
             break
 
     if cap_shape and capabilities:
@@ -1163,6 +1312,7 @@ def fill_architecture(slide, content: Dict, images: Dict, verbose: bool = False)
         logger.info("Filled architecture slide")
 
 
+@traced()
 def fill_sprint_goals(slide, content: Dict, verbose: bool = False):
     """Fill sprint goals slide (slide 10) -- 1_Bullet Points Lime layout.
 
@@ -1251,6 +1401,7 @@ def fill_sprint_goals(slide, content: Dict, verbose: bool = False):
         logger.info("Filled sprint goals slide")
 
 
+@traced()
 def fill_timeline(slide, content: Dict, verbose: bool = False):
     """Fill timeline/Gantt slide (slide 11) -- Calendar Lime w/o lines layout.
 
@@ -1371,6 +1522,7 @@ def fill_timeline(slide, content: Dict, verbose: bool = False):
         logger.info("Filled timeline/Gantt slide")
 
 
+@traced()
 def fill_risks(slide, content: Dict, verbose: bool = False):
     """Fill progress/risks slide (slide 12) -- Bullet Points Lime layout.
 
@@ -1444,6 +1596,7 @@ def fill_risks(slide, content: Dict, verbose: bool = False):
         logger.info("Filled progress/risks slide")
 
 
+@traced()
 def fill_participants(slide, content: Dict, verbose: bool = False):
     """Fill participants slide (slide 14) -- Bullet Points Lime layout.
 
@@ -1514,6 +1667,7 @@ def fill_participants(slide, content: Dict, verbose: bool = False):
         logger.info("Filled participants slide")
 
 
+@traced()
 def fill_meetings(slide, content: Dict, verbose: bool = False):
     """Fill meetings slide (slide 15) -- Bullet Points Lime layout.
 
@@ -1617,20 +1771,9 @@ def fill_meetings(slide, content: Dict, verbose: bool = False):
 
         # Right content is textbox id=7 at (6.80, 3.67)
         right_box = None
-        for shape in slide.shapes:
-            if not shape.has_text_frame:
-                continue
-            try:
-                if shape.placeholder_format is not None:
-                    continue
-            except:
-                pass
-            l = (shape.left or 0) / 914400
-            t = (shape.top or 0) / 914400
-            w = (shape.width or 0) / 914400
-            h = (shape.height or 0) / 914400
-            if 6.0 < l < 7.5 and 3.0 < t < 4.5 and w > 4.0 and h > 2.0:
-                right_box = shape
+        for entry in get_slide_index(slide).within(left=(6.0, 7.5), top=(3.0, 4.5)):
+            if entry.width > 4.0 and entry.height > 2.0:
+                right_box = entry.shape
                 break
 
         if right_box:
@@ -1654,6 +1797,7 @@ def fill_meetings(slide, content: Dict, verbose: bool = False):
         logger.info("Filled meetings slide")
 
 
+@traced()
 def fill_discussion(slide, content: Dict, verbose: bool = False):
     """Fill discussion slide (slide 17) -- Bullet Points Lime layout.
 
@@ -1677,19 +1821,9 @@ def fill_discussion(slide, content: Dict, verbose: bool = False):
         _enable_autofit(sub_ph.text_frame)
 
     # Enable autofit on the existing discussion prompt text box (id=3 at ~(3.82, 3.27))
-    for shape in slide.shapes:
-        if not shape.has_text_frame:
-            continue
-        try:
-            if shape.placeholder_format is not None:
-                continue
-        except Exception:
-            pass
-        l = (shape.left or 0) / 914400
-        t = (shape.top or 0) / 914400
-        w = (shape.width or 0) / 914400
-        h = (shape.height or 0) / 914400
-        if 3.0 < l < 5.0 and 2.5 < t < 4.0 and w > 5.0 and h > 1.0:
+    for entry in get_slide_index(slide).within(left=(3.0, 5.0), top=(2.5, 4.0)):
+        if entry.width > 5.0 and entry.height > 1.0:
+            shape = entry.shape
             _enable_autofit(shape.text_frame)
             # Reduce font size on the existing text to fit
             for para in shape.text_frame.paragraphs:
@@ -1702,6 +1836,7 @@ def fill_discussion(slide, content: Dict, verbose: bool = False):
         logger.info("Filled discussion slide")
 
 
+@traced()
 def fill_thankyou(slide, content: Dict, verbose: bool = False):
     """Fill thank-you slide (slide 19) -- Bullet Points Lime layout.
 
@@ -1725,18 +1860,9 @@ def fill_thankyou(slide, content: Dict, verbose: bool = False):
 
     # Find and update the existing question text box (id=3 at ~(2.04, 3.45))
     if question:
-        for shape in slide.shapes:
-            if not shape.has_text_frame:
-                continue
-            try:
-                if shape.placeholder_format is not None:
-                    continue
-            except Exception:
-                pass
-            l = (shape.left or 0) / 914400
-            t = (shape.top or 0) / 914400
-            w = (shape.width or 0) / 914400
-            if 1.5 < l < 3.0 and 3.0 < t < 4.5 and w > 3.0:
+        for entry in get_slide_index(slide).within(left=(1.5, 3.0), top=(3.0, 4.5)):
+            if entry.width > 3.0:
+                shape = entry.shape
                 # Resize to give enough room for question text
                 shape.height = Inches(0.80)
                 tf = shape.text_frame
@@ -1755,6 +1881,7 @@ def fill_thankyou(slide, content: Dict, verbose: bool = False):
         logger.info("Filled thank-you slide")
 
 
+@traced()
 def _clear_layout_headline_prompts(prs):
     """Clear ALL custom prompt text from slide layout placeholders.
 
@@ -1834,29 +1961,19 @@ def _clear_layout_headline_prompts(prs):
         logger.debug(f"Cleared {cleared_count} layout custom prompts")
 
 
-def update_copyright_footer(slide, copyright_year: str):
-    """Update copyright footer textbox on a slide if it exists.
+@traced()
+def update_copyright_footers(prs, copyright_year: str) -> int:
+    """Point the copyright footer text on every slide at *copyright_year*.
 
-    Searches for ALL text boxes containing "ONE THOUSAND" and updates them.
+    One XPath pass over the slide parts; see docgen_footer for what counts
+    as a footer and how it is rewritten.
     """
-    copyright_text = f"\u00a9 {copyright_year} ONE THOUSAND"
-    updated = False
-    for shape in slide.shapes:
-        if shape.has_text_frame:
-            full_text = shape.text_frame.text.strip()
-            if "ONE THOUSAND" in full_text or "\u00a9" in full_text:
-                tf = shape.text_frame
-                tf.clear()
-                p = tf.paragraphs[0]
-                r = p.add_run()
-                r.text = copyright_text
-                r.font.size = Pt(8)
-                r.font.color.rgb = OT_GRAY
-                logger.debug(f"Updated copyright footer on slide")
-                updated = True
+    updated = rewrite_copyright_footers(prs, copyright_year, color=OT_GRAY)
+    logger.debug(f"Updated {updated} slide copyright footers")
     return updated
 
 
+@traced()
 def _update_layout_copyright(prs, copyright_year: str):
     """Update copyright footer in ALL slide layouts.
 
@@ -1864,49 +1981,132 @@ def _update_layout_copyright(prs, copyright_year: str):
     and instead inherit from the layout. This ensures all layouts show the
     correct copyright year.
     """
-    copyright_text = f"\u00a9 {copyright_year} ONE THOUSAND"
-    updated = 0
-    for layout in prs.slide_layouts:
-        for shape in layout.shapes:
-            if shape.has_text_frame:
-                full_text = shape.text_frame.text.strip()
-                if "ONE THOUSAND" in full_text or "\u00a9" in full_text:
-                    tf = shape.text_frame
-                    tf.clear()
-                    p = tf.paragraphs[0]
-                    r = p.add_run()
-                    r.text = copyright_text
-                    r.font.size = Pt(8)
-                    r.font.color.rgb = OT_GRAY
-                    updated += 1
+    updated = rewrite_copyright_footers(prs, copyright_year, color=OT_GRAY,
+                                        slides=False, layouts=True)
     if updated:
         logger.debug(f"Updated {updated} layout copyright footers")
 
 
 # ---------------------------------------------------------------------------
-# Multi-UC Handling
+# Template Cache
 # ---------------------------------------------------------------------------
 
+# Resolved template path -> (mtime_ns, size, sha256) of the file last seen there
+_TEMPLATE_DIGESTS: Dict[str, Tuple[int, int, str]] = {}
 
-def _duplicate_slide(prs, slide_index: int) -> int:
-    """Duplicate a slide by copying its XML and relationships.
+# (sha256, copyright_year) -> parsed template with layouts already cleaned
+_TEMPLATE_CACHE: Dict[Tuple[str, str], Any] = {}
 
-    Returns the index of the new slide (inserted right after the original).
+
+def _template_digest(template_path: Path) -> str:
+    """Return the sha256 of *template_path*, re-hashing only when it changed."""
+    path = str(Path(template_path).resolve())
+    st = os.stat(path)
+    cached = _TEMPLATE_DIGESTS.get(path)
+    if cached and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+
+    with open(path, "rb") as f:
+        digest = hashlib.sha256(f.read()).hexdigest()
+    if cached and cached[2] != digest:
+        # Template was replaced on disk: drop the stale parsed copies
+        for key in [k for k in _TEMPLATE_CACHE if k[0] == cached[2]]:
+            del _TEMPLATE_CACHE[key]
+    _TEMPLATE_DIGESTS[path] = (st.st_mtime_ns, st.st_size, digest)
+    return digest
+
+
+@traced()
+def load_template(template_path: Path, copyright_year: str):
+    """Return a fresh, pre-cleaned copy of the kick-off template.
+
+    The template is parsed, its layout prompts cleared and its layout
+    copyright set once per (template content, copyright year); later calls
+    deep-copy that cached presentation instead of re-parsing the PPTX.
     """
-    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
-    from copy import deepcopy
+    key = (_template_digest(template_path), copyright_year)
+    prs = _TEMPLATE_CACHE.get(key)
+    if prs is None:
+        logger.info(f"Loading template: {template_path}")
+        with span("parse_template"):
+            prs = Presentation(str(template_path))
+
+        # Clear "Headline" prompt text from slide layouts to prevent bleed-through
+        _clear_layout_headline_prompts(prs)
+
+        # Update copyright in slide layouts (some slides inherit from layout)
+        _update_layout_copyright(prs, copyright_year)
+
+        # Re-read the cleaned template so the cached copy holds no lazily
+        # built shape collections or slide indexes: deepcopy would give those
+        # detached copies of the XML, and edits made through them are lost.
+        buf = io.BytesIO()
+        prs.save(buf)
+        buf.seek(0)
+        prs = Presentation(buf)
+
+        _TEMPLATE_CACHE[key] = prs
+    else:
+        logger.debug(f"Using cached template: {template_path}")
+    with span("copy_template"):
+        return deepcopy(prs)
 
-    template_slide = prs.slides[slide_index]
-    slide_layout = template_slide.slide_layout
 
-    # Add a new slide with the same layout
-    new_slide = prs.slides.add_slide(slide_layout)
+# ---------------------------------------------------------------------------
+# Multi-UC Handling
+# ---------------------------------------------------------------------------
+
+
+def _duplicate_slide(prs, slide_index: int, copies: int = 1,
+                     position: Optional[int] = None) -> List[int]:
+    """Clone a slide *copies* times, keeping its shapes, text and media.
+
+    Each copy gets a deep copy of the source slide XML and the same
+    relationships (layout, images, hyperlinks), re-pointed from the copy's
+    own rIds; media parts are shared rather than duplicated. Speaker notes
+    are not cloned. The copies are inserted into the slide list as one
+    block at *position* (default: right after the source slide).
+
+    Returns the indices of the new slides in deck order.
+    """
+    from pptx.opc.constants import RELATIONSHIP_TYPE as RT
+    from pptx.parts.slide import SlidePart
+
+    prs_part = prs.part
+    sld_id_lst = prs_part._element.get_or_add_sldIdLst()
+    source = prs.slides[slide_index].part
+    if position is None:
+        position = slide_index + 1
+
+    new_ids = []
+    for n in range(copies):
+        sld = deepcopy(source._element)
+        part = SlidePart(
+            PackURI(f"/ppt/slides/slide{len(sld_id_lst) + 1}.xml"),
+            source.content_type, source.package, sld,
+        )
+        rid_map = {}
+        for rel in source.rels.values():
+            if rel.reltype == RT.NOTES_SLIDE:
+                continue
+            if rel.is_external:
+                rid_map[rel.rId] = part.relate_to(rel.target_ref, rel.reltype, is_external=True)
+            else:
+                rid_map[rel.rId] = part.relate_to(rel.target_part, rel.reltype)
+        # r:id / r:embed / r:link attributes must follow the copy's own rIds
+        for el in sld.iter():
+            for attr, value in el.attrib.items():
+                if attr.startswith(f"{{{NS_R}}}") and value in rid_map:
+                    el.set(attr, rid_map[value])
 
-    # Copy all shapes from template to new slide
-    # This is a simplified approach; for complex cases, XML-level copy is needed
-    # For our purposes, the new slide gets filled by fill_pain_data separately
+        sld_id = sld_id_lst.add_sldId(prs_part.relate_to(part, RT.SLIDE))
+        sld_id_lst.remove(sld_id)
+        sld_id_lst.insert(position + n, sld_id)
+        new_ids.append(sld_id)
 
-    return len(prs.slides) - 1
+    # Keep slideN.xml part names in deck order, as python-pptx does on load
+    prs_part.rename_slide_parts([sld_id.rId for sld_id in sld_id_lst])
+    return [sld_id_lst.index(sld_id) for sld_id in new_ids]
 
 
 # ---------------------------------------------------------------------------
@@ -1930,16 +2130,10 @@ def generate_presentation(
     variables = load_json(variables_path)
     content = load_json(content_path)
 
-    logger.info(f"Loading template: {template_path}")
-    prs = Presentation(str(template_path))
-
-    # Clear "Headline" prompt text from slide layouts to prevent bleed-through
-    _clear_layout_headline_prompts(prs)
-
     copyright_year = variables.get("copyright_year", "2019-2025")
 
-    # Update copyright in slide layouts (some slides inherit from layout)
-    _update_layout_copyright(prs, copyright_year)
+    # Parsed once per template + copyright year, with layouts already cleaned
+    prs = load_template(template_path, copyright_year)
 
     client_name = variables.get("client_name", "Client")
     project_title = variables.get("project_title", "Project")
@@ -1961,13 +2155,25 @@ def generate_presentation(
     uc_content_list = content.get("use_cases", [])
     extra_uc_slides = max(0, len(uc_content_list) - 1)
 
-    # Compute page numbers for agenda references
-    page_numbers = _compute_page_numbers(len(prs.slides), extra_uc_slides)
-
     slides = list(prs.slides)
     num_slides = len(slides)
     logger.info(f"Template has {num_slides} slides")
 
+    # Multi-UC: clone the untouched Pain x Data slide (slide 5) once per extra
+    # use-case, right after it, before anything is filled. `slides` keeps
+    # addressing the template slides; the clones are only in `uc_slides`.
+    uc_slides = slides[5:6]
+    if extra_uc_slides > 0 and num_slides > 5:
+        logger.info(f"Adding {extra_uc_slides} extra Pain x Data slide(s)")
+        clone_indices = _duplicate_slide(prs, 5, copies=extra_uc_slides)
+        uc_slides += [prs.slides[i] for i in clone_indices]
+
+    # Page numbers for agenda references, from the final slide order
+    deck_index = {slide.slide_id: i for i, slide in enumerate(prs.slides)}
+    page_numbers = _compute_page_numbers(
+        {i: deck_index[slide.slide_id] for i, slide in enumerate(slides)}
+    )
+
     if num_slides < 20:
         logger.warning(
             f"Template has only {num_slides} slides, expected 20. "
@@ -2024,35 +2230,10 @@ def generate_presentation(
             fill_pain_data(slides[5], uc_fallback, images, verbose=verbose)
 
     # -----------------------------------------------------------------------
-    # Multi-UC: Duplicate slide 5 for additional use-cases
+    # Multi-UC: cloned Pain x Data slides for additional use-cases
     # -----------------------------------------------------------------------
-    if extra_uc_slides > 0 and num_slides > 5:
-        for uc_idx in range(1, len(uc_content_list)):
-            logger.info(f"Adding extra Pain x Data slide for UC {uc_idx + 1}")
-            # Duplicate slide 5 layout by adding a new slide after current position
-            layout_name = "Bullet Points Lime"
-            layout = find_layout(prs, layout_name)
-            if layout:
-                new_slide = prs.slides.add_slide(layout)
-                fill_pain_data(new_slide, uc_content_list[uc_idx], images,
-                               verbose=verbose)
-            else:
-                logger.warning(f"Cannot duplicate Pain x Data: layout '{layout_name}' not found")
-
-        # Recalculate page numbers after adding slides
-        page_numbers = _compute_page_numbers(len(prs.slides), extra_uc_slides)
-
-        # Re-fill all agenda slides with updated page numbers
-        # (Only the original 20 slides are updated; extra UC slides are appended)
-        slides = list(prs.slides)
-        num_slides = len(slides)
-
-        # Re-fill agenda slides
-        agenda_slide_indices = [1, 2, 4]
-        for si in agenda_slide_indices:
-            if si < num_slides:
-                active = DIVIDER_HIGHLIGHT_MAP.get(si, 0)
-                _fill_agenda_slide(slides[si], sections, page_numbers, active)
+    for uc_slide, uc_data in zip(uc_slides[1:], uc_content_list[1:]):
+        fill_pain_data(uc_slide, uc_data, images, verbose=verbose)
 
     # -----------------------------------------------------------------------
     # Slide 6: Hackathon Validation
@@ -2145,23 +2326,160 @@ def generate_presentation(
     # -----------------------------------------------------------------------
     # Copyright footer update on all slides
     # -----------------------------------------------------------------------
-    for slide in prs.slides:
-        update_copyright_footer(slide, copyright_year)
+    update_copyright_footers(prs, copyright_year)
 
     # -----------------------------------------------------------------------
     # Save output
     # -----------------------------------------------------------------------
-    prs.save(str(output_path))
+    with span("save"):
+        prs.save(str(output_path))
     total_slides = len(prs.slides)
     logger.info(f"Saved {total_slides} slides -> {output_path}")
 
 
+# ---------------------------------------------------------------------------
+# Batch Generation
+# ---------------------------------------------------------------------------
+
+
+def load_batch_entries(source: Path, output_dir: Optional[Path]) -> List[Dict[str, Any]]:
+    """Expand a batch source into ``{name, variables, content, output}`` entries.
+
+    *source* may be:
+      - a directory whose sub-directories each hold ``variables.json`` and
+        ``content.json`` (the sub-directory name becomes the deck name);
+      - a ``.jsonl`` file with one ``{"variables", "content", "output"?,
+        "name"?}`` object per line;
+      - a JSON manifest: a list of such objects, or ``{"entries": [...]}``.
+
+    Relative paths in a manifest are resolved against the manifest's folder.
+    Entries without a ``name`` are named after their variables file (or its
+    folder, for a plain ``variables.json``).  Entries without an ``output``
+    are written to ``<output_dir>/<name>_Kick_Off_Presentation.pptx``; an
+    output path already used by an earlier entry gets a ``-2``, ``-3``, ...
+    suffix.
+    """
+    source = Path(source)
+    if source.is_dir():
+        # Sub-directory paths already include *source*
+        base = Path()
+        raw = [
+            {"name": d.name, "variables": d / "variables.json",
+             "content": d / "content.json"}
+            for d in sorted(source.iterdir())
+            if (d / "variables.json").is_file() and (d / "content.json").is_file()
+        ]
+    else:
+        base = source.parent
+        with open(source, "r", encoding="utf-8") as f:
+            if source.suffix.lower() == ".jsonl":
+                raw = [json.loads(line) for line in f if line.strip()]
+            else:
+                raw = json.load(f)
+        if isinstance(raw, dict):
+            raw = raw.get("entries", [])
+
+    entries = []
+    used_outputs = set()
+    for i, item in enumerate(raw, start=1):
+        variables = base / Path(item["variables"])
+        content = base / Path(item["content"])
+        # clients/acme_vars.json -> "acme_vars"; clients/acme/variables.json -> "acme"
+        stem = variables.stem if variables.stem != "variables" else variables.parent.name
+        name = item.get("name") or stem or f"deck_{i}"
+        if item.get("output"):
+            output = base / Path(item["output"])
+        elif output_dir is not None:
+            output = Path(output_dir) / f"{name}_Kick_Off_Presentation.pptx"
+        else:
+            raise ValueError(f"Batch entry {i} ({name}) has no output "
+                             f"and no --output-dir was given")
+
+        # Decks are built concurrently: two entries must never share a file
+        unique, n = output, 1
+        while os.path.abspath(unique) in used_outputs:
+            n += 1
+            unique = output.with_name(f"{output.stem}-{n}{output.suffix}")
+        if unique != output:
+            logger.warning(f"Batch entry {i} ({name}): {output} is already used, "
+                           f"writing {unique}")
+            name = f"{name}-{n}"
+        used_outputs.add(os.path.abspath(unique))
+        entries.append({"name": name, "variables": variables,
+                        "content": content, "output": unique})
+    return entries
+
+
+def _generate_batch_entry(template_path: Path, entry: Dict[str, Any],
+                          verbose: bool) -> Dict[str, Any]:
+    """Build one deck of a batch; failures are reported, not raised."""
+    start = time.perf_counter()
+    result = {"name": entry["name"], "output": str(entry["output"]), "error": None}
+    try:
+        entry["output"].parent.mkdir(parents=True, exist_ok=True)
+        generate_presentation(template_path, entry["variables"], entry["content"],
+                              entry["output"], verbose)
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def _init_batch_worker(verbose: bool) -> None:
+    logger.setLevel(logging.DEBUG if verbose else logging.WARNING)
+
+
+def generate_batch(
+    template_path: Path,
+    entries: List[Dict[str, Any]],
+    jobs: int = 0,
+    verbose: bool = False,
+) -> List[Dict[str, Any]]:
+    """Generate one deck per entry across a process pool.
+
+    The template is parsed and cleaned once per copyright year in this
+    process before the pool starts, so forked workers inherit the cache
+    instead of re-reading the PPTX.  Returns one result dict per entry
+    (``name``, ``output``, ``seconds``, ``error``), in input order.
+    """
+    years = set()
+    for e in entries:
+        try:
+            years.add(load_json(e["variables"]).get("copyright_year", "2019-2025"))
+        except (OSError, ValueError, AttributeError):
+            pass  # reported when the entry itself is generated
+    for year in sorted(years):
+        load_template(template_path, year)
+
+    jobs = jobs or min(len(entries), os.cpu_count() or 1)
+    if jobs <= 1:
+        return [_generate_batch_entry(template_path, e, verbose) for e in entries]
+
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_batch_worker,
+                             initargs=(verbose,)) as pool:
+        futures = [pool.submit(_generate_batch_entry, template_path, e, verbose)
+                   for e in entries]
+        return [f.result() for f in futures]
+
+
+def print_batch_summary(results: List[Dict[str, Any]], wall_seconds: float) -> None:
+    """Print per-deck timings and failures for a batch run."""
+    width = max([len(r["name"]) for r in results] + [4])
+    print(f"\n{'Deck':<{width}}  {'Time':>7}  Result")
+    for r in results:
+        status = f"FAILED: {r['error']}" if r["error"] else r["output"]
+        print(f"{r['name']:<{width}}  {r['seconds']:>6.2f}s  {status}")
+    failed = sum(1 for r in results if r["error"])
+    print(f"\n{len(results) - failed}/{len(results)} decks generated, "
+          f"{failed} failed, {wall_seconds:.2f}s total")
+
+
 # ---------------------------------------------------------------------------
 # CLI Entry Point
 # ---------------------------------------------------------------------------
 
 
-def main():
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="Generate OT kick-off presentation from template + JSON inputs"
     )
@@ -2170,30 +2488,70 @@ def main():
         help="Path to the kick-off template PPTX file"
     )
     parser.add_argument(
-        "--variables", type=Path, required=True,
+        "--variables", type=Path,
         help="Path to variables.json (client info, dates, images)"
     )
     parser.add_argument(
-        "--content", type=Path, required=True,
+        "--content", type=Path,
         help="Path to content.json (slide content, agenda, bullets)"
     )
     parser.add_argument(
-        "--output", type=Path, required=True,
+        "--output", type=Path,
         help="Path to write the output PPTX"
     )
+    parser.add_argument(
+        "--batch", type=Path,
+        help="Generate many decks: a JSON manifest, a JSONL file, or a directory "
+             "of <client>/variables.json + content.json folders"
+    )
+    parser.add_argument(
+        "--output-dir", type=Path,
+        help="Batch mode: folder for decks whose entry has no explicit output"
+    )
+    parser.add_argument(
+        "--jobs", type=int, default=0,
+        help="Batch mode: worker processes (default: one per CPU)"
+    )
     parser.add_argument(
         "--verbose", action="store_true",
         help="Enable verbose logging"
     )
-    args = parser.parse_args()
+    add_profile_arguments(parser)
+    args = parser.parse_args(argv)
 
     if args.verbose:
         logger.setLevel(logging.DEBUG)
 
-    # Validate inputs
     if not args.template.exists():
         logger.error(f"Template not found: {args.template}")
         sys.exit(1)
+
+    if args.batch:
+        if not args.batch.exists():
+            logger.error(f"Batch source not found: {args.batch}")
+            sys.exit(1)
+        try:
+            entries = load_batch_entries(args.batch, args.output_dir)
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Invalid batch source {args.batch}: {e}")
+            sys.exit(1)
+        if not entries:
+            logger.error(f"No batch entries found in {args.batch}")
+            sys.exit(1)
+
+        logger.info(f"Generating {len(entries)} decks from {args.batch}")
+        start = time.perf_counter()
+        with profiled(args, "generate_kickoff_pptx --batch"):
+            results = generate_batch(args.template, entries, args.jobs, args.verbose)
+        print_batch_summary(results, time.perf_counter() - start)
+        if any(r["error"] for r in results):
+            sys.exit(1)
+        return
+
+    # Validate inputs
+    for flag in ("variables", "content", "output"):
+        if getattr(args, flag) is None:
+            parser.error(f"--{flag} is required unless --batch is given")
     if not args.variables.exists():
         logger.error(f"Variables file not found: {args.variables}")
         sys.exit(1)
@@ -2208,10 +2566,11 @@ def main():
         logger.info(f"Created output directory: {output_dir}")
 
     try:
-        generate_presentation(
-            args.template, args.variables, args.content,
-            args.output, args.verbose,
-        )
+        with profiled(args, "generate_kickoff_pptx"):
+            generate_presentation(
+                args.template, args.variables, args.content,
+                args.output, args.verbose,
+            )
     except Exception as e:
         logger.error(f"Generation failed: {e}")
         if args.verbose:
@@ -4,6 +4,7 @@ Extract architecture diagram images from hackathon documents (PDF or DOCX).
 
 Usage:
     python extract_architecture_diagram.py --input <file.pdf|file.docx> --output <image.png> [--page <page_num>]
+    python extract_architecture_diagram.py --input <files, dirs or globs>... --output-dir <dir> [--top N]
 
 Examples:
     # Extract from PDF (auto-detect best image)
@@ -12,58 +13,558 @@ Examples:
     # Extract from specific PDF page
     python extract_architecture_diagram.py --input hackathon.pdf --output diagram.png --page 5
 
+    # Only scan slides 10-40, giving up after 2 seconds
+    python extract_architecture_diagram.py --input hackathon.pdf --output diagram.png --pages 10-40 --time-budget 2
+
     # Extract from DOCX
     python extract_architecture_diagram.py --input proposal.docx --output diagram.png
+
+    # Batch: top 3 candidates of every past hackathon deck, plus a manifest
+    python extract_architecture_diagram.py --input 'archive/**/*.pdf' proposals/ --top 3 --output-dir candidates/
 """
 
 import argparse
+import glob
+import hashlib
 import io
+import json
+import multiprocessing
 import os
+import posixpath
+import re
 import sys
-import tempfile
+import threading
+import time
 import zipfile
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 
+# Shared helpers (docgen_trace) live in <plugin>/scripts
+_PLUGIN_SCRIPTS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                "..", "..", "..", "scripts"))
+if _PLUGIN_SCRIPTS not in sys.path:
+    sys.path.insert(0, _PLUGIN_SCRIPTS)
+from docgen_trace import add_profile_arguments, profiled, traced
 
-def extract_from_pdf_pdfplumber(pdf_path: str, page_num: int = None) -> bytes:
-    """Extract images from PDF using pdfplumber."""
+
+def parse_page_range(spec: str) -> Tuple[int, Optional[int]]:
+    """Parse a 1-based page range hint: "5", "3-20" or "10-" (to the end)."""
+    start, sep, end = spec.partition('-')
+    try:
+        first = int(start)
+        last = (int(end) if end else None) if sep else first
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid page range: {spec!r} (use N, N-M or N-)")
+    if first < 1 or (last is not None and last < first):
+        raise argparse.ArgumentTypeError(f"invalid page range: {spec!r}")
+    return first, last
+
+
+def pages_to_search(total_pages: int, page_num: int = None,
+                    page_range: Tuple[int, Optional[int]] = None) -> Optional[List[int]]:
+    """
+    0-based page indices to scan for the diagram.
+
+    An explicit page wins over a range hint; without either, the first two
+    pages (cover and agenda) are skipped. Returns None when out of range.
+    """
+    if page_num is not None:
+        if page_num < 1 or page_num > total_pages:
+            print(f"Error: Page {page_num} out of range (1-{total_pages})")
+            return None
+        return [page_num - 1]
+    if page_range is not None:
+        first, last = page_range
+        last = total_pages if last is None else min(last, total_pages)
+        if first > last:
+            print(f"Error: Page range {first}-{last} out of range (1-{total_pages})")
+            return None
+        return list(range(first - 1, last))
+    # Skip first 2 pages, search from page 3 onwards
+    return list(range(2, total_pages)) if total_pages > 2 else list(range(total_pages))
+
+
+def _iter_image_streams(resources, seen: dict, depth: int = 0):
+    """
+    Yield ``(objid, stream)`` for the image XObjects reachable from a page.
+
+    Only the object dictionaries are read; stream data stays undecoded.
+    Form XObjects are followed (a few levels deep) since slide exports often
+    wrap pictures in them. Images already seen on an earlier page (logos,
+    footers) are yielded as ``(objid, None)`` without being resolved again.
+    """
+    from pdfminer.pdftypes import PDFStream, resolve1
+
+    resources = resolve1(resources)
+    if not isinstance(resources, dict):
+        return
+    xobjects = resolve1(resources.get('XObject'))
+    if not isinstance(xobjects, dict):
+        return
+    for ref in xobjects.values():
+        objid = getattr(ref, 'objid', None)
+        if objid in seen:
+            if seen[objid]:
+                yield objid, None
+            continue
+        stream = resolve1(ref)
+        if not isinstance(stream, PDFStream):
+            continue
+        objid = stream.objid if objid is None else objid
+        subtype = getattr(resolve1(stream.get('Subtype')), 'name', None)
+        seen[objid] = subtype == 'Image'
+        if subtype == 'Image':
+            yield objid, stream
+        elif subtype == 'Form' and depth < 4:
+            yield from _iter_image_streams(stream.get('Resources'), seen, depth + 1)
+
+
+def _declared_image_size(stream) -> Tuple[int, int, int]:
+    """(encoded stream length, width, height) taken from the image dictionary."""
+    from pdfminer.pdftypes import resolve1
+
+    length = resolve1(stream.get('Length'))
+    if not isinstance(length, int):
+        length = len(stream.rawdata or b'')
+    width = resolve1(stream.get('Width'))
+    height = resolve1(stream.get('Height'))
+    if not (isinstance(width, int) and isinstance(height, int)):
+        width = height = 0
+    return length, width, height
+
+
+def _image_entry(ref, page_idx: Optional[int], length: int, width: int, height: int) -> dict:
+    """Index record for one candidate image (see ImageIndex)."""
+    return {
+        "ref": ref,
+        "pages": [] if page_idx is None else [page_idx],
+        "bytes": length,
+        "width": width,
+        "height": height,
+        "aspect": round(width / height, 3) if width and height else None,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Image index
+# ---------------------------------------------------------------------------
+# Scanning a large PDF is the expensive part of every run, and the same source
+# document is usually processed several times (different --page, a second
+# opinion with --strategy largest, ...).  The metadata of every image found is
+# therefore kept in a JSON index keyed by the SHA-256 of the document, so
+# re-runs only scan pages that were never scanned before and pick from the
+# index.  Refs are PDF object numbers (usable by pdfplumber and PyMuPDF
+# alike) or DOCX part names.
+
+IMAGE_INDEX_VERSION = 1
+
+# Candidates (largest by bytes and by pixels) that get a colour count and caption
+INDEX_ENRICH_TOP = 8
+
+# Vertical distance (points) within which text counts as an image's caption
+CAPTION_GAP = 48
+
+CAPTION_KEYWORDS = (
+    "architecture", "architektur", "arquitectura", "diagram", "diagrama",
+    "solution", "system", "overview", "components", "data flow", "integration",
+)
+
+STRATEGIES = ("score", "largest")
+
+
+def image_index_dir() -> Path:
+    """Index folder: $DOCGEN_IMAGE_INDEX, else ~/.cache/docs-generator/image-index."""
+    env = os.environ.get("DOCGEN_IMAGE_INDEX")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "docs-generator" / "image-index"
+
+
+@traced()
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class ImageIndex:
+    """
+    Metadata of the images in one source document.
+
+    Each image record holds its ref, the (0-based) pages it appears on,
+    encoded byte size, pixel dimensions and aspect ratio; the top candidates
+    also get ``colors`` (distinct colours in a 64px thumbnail, capped at
+    4096) and ``caption`` (text next to the image). ``scanned_pages`` tells
+    which pages the records are complete for.
+    """
+
+    def __init__(self, path: Optional[Path], kind: str, source: str) -> None:
+        self.path = path
+        self.kind = kind
+        self.source = source
+        self.images: List[dict] = []
+        self.scanned_pages = set()
+        self.complete = False
+        self.changed = False
+
+    @classmethod
+    def load(cls, source_path: str, kind: str, enabled: bool = True) -> "ImageIndex":
+        """The saved index for *source_path*, or an empty one (not persisted unless *enabled*)."""
+        path = image_index_dir() / f"{file_digest(source_path)}.json" if enabled else None
+        index = cls(path, kind, os.path.basename(source_path))
+        if path is None:
+            return index
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return index
+        if data.get("version") == IMAGE_INDEX_VERSION and data.get("kind") == kind:
+            index.images = data.get("images", [])
+            index.scanned_pages = set(data.get("scanned_pages", []))
+            index.complete = data.get("complete", False)
+        return index
+
+    def missing_pages(self, page_indices: List[int]) -> List[int]:
+        return [p for p in page_indices if p not in self.scanned_pages]
+
+    def add(self, entries: List[dict], scanned_pages: List[int]) -> None:
+        """Merge freshly scanned records; pages of known refs are combined."""
+        by_ref = {entry["ref"]: entry for entry in self.images}
+        for entry in entries:
+            known = by_ref.get(entry["ref"])
+            if known is None:
+                by_ref[entry["ref"]] = entry
+                self.images.append(entry)
+            else:
+                known["pages"] = sorted(set(known["pages"]) | set(entry["pages"]))
+        self.scanned_pages.update(scanned_pages)
+        self.changed = True
+
+    def candidates(self, page_indices: Optional[List[int]] = None) -> List[dict]:
+        """Records on any of *page_indices* (all records when None), in page order."""
+        if page_indices is None:
+            return list(self.images)
+        wanted = set(page_indices)
+        found = [e for e in self.images if wanted.intersection(e["pages"])]
+        return sorted(found, key=lambda e: min(p for p in e["pages"] if p in wanted))
+
+    def save(self) -> None:
+        if self.path is None or not self.changed:
+            return
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump({
+                    "version": IMAGE_INDEX_VERSION,
+                    "kind": self.kind,
+                    "source": self.source,
+                    "complete": self.complete,
+                    "scanned_pages": sorted(self.scanned_pages),
+                    "images": self.images,
+                }, f)
+            os.replace(tmp_path, self.path)
+            self.changed = False
+        except OSError as e:
+            print(f"Warning: Could not save image index: {e}")
+
+
+def _thumbnail_colors(image) -> Optional[int]:
+    """Distinct colours in a 64px thumbnail of a PIL image (capped at 4096)."""
+    if image is None:
+        return None
+    image.thumbnail((64, 64))
+    colors = image.convert("RGB").getcolors(maxcolors=4096)
+    return len(colors) if colors is not None else 4096
+
+
+def _nearby_text(words: List[tuple], bbox: Optional[tuple]) -> str:
+    """
+    Caption-like text for an image: words just above or below *bbox*.
+
+    *words* are ``(x0, top, x1, bottom, text)`` in reading order and *bbox*
+    is ``(x0, top, x1, bottom)`` in the same coordinates. Falls back to the
+    first words of the page (usually the slide title).
+    """
+    if bbox:
+        x0, top, x1, bottom = bbox
+        near = [w[4] for w in words
+                if w[2] >= x0 and w[0] <= x1
+                and (0 <= w[1] - bottom <= CAPTION_GAP or 0 <= top - w[3] <= CAPTION_GAP)]
+        if near:
+            return " ".join(near)[:200]
+    return " ".join(w[4] for w in words[:12])[:200]
+
+
+def score_image(entry: dict, largest_bytes: int, largest_area: int) -> float:
+    """
+    How likely an indexed image is the architecture diagram.
+
+    Pixel area and byte size relative to the largest candidate give the
+    base score; area weighs more, since flat diagrams compress far better
+    than photos of the same size. A caption mentioning architecture/diagram,
+    a landscape shape and a flat palette add points; strips and icons lose
+    some.
+    """
+    width, height = entry.get("width") or 0, entry.get("height") or 0
+    score = 25.0 * entry["bytes"] / largest_bytes if largest_bytes else 0.0
+    if largest_area:
+        score += 35.0 * width * height / largest_area
+
+    aspect = entry.get("aspect")
+    if aspect:
+        if 1.2 <= aspect <= 2.5:
+            score += 10
+        elif aspect < 0.4 or aspect > 4:
+            score -= 15
+    if width and height and min(width, height) < 200:
+        score -= 25
+
+    colors = entry.get("colors")
+    if colors is not None and colors <= 512:
+        score += 10
+
+    caption = (entry.get("caption") or "").lower()
+    if any(keyword in caption for keyword in CAPTION_KEYWORDS):
+        score += 40
+    return score
+
+
+def rank_images(candidates: List[dict], strategy: str = "score") -> List[dict]:
+    """Index records best first; earlier records win ties."""
+    if not candidates:
+        return []
+    if strategy == "largest":
+        key = lambda e: (e["bytes"], (e.get("width") or 0) * (e.get("height") or 0))
+    else:
+        largest_bytes = max(e["bytes"] for e in candidates)
+        largest_area = max((e.get("width") or 0) * (e.get("height") or 0) for e in candidates)
+        key = lambda e: score_image(e, largest_bytes, largest_area)
+    return sorted(candidates, key=key, reverse=True)
+
+
+def choose_image(candidates: List[dict], strategy: str = "score") -> Optional[dict]:
+    """Pick the diagram among index records."""
+    ranked = rank_images(candidates, strategy)
+    return ranked[0] if ranked else None
+
+
+def _to_enrich(candidates: List[dict]) -> List[dict]:
+    """The largest candidates (by bytes or by pixels) without colour count / caption yet."""
+    by_bytes = sorted(candidates, key=lambda e: e["bytes"], reverse=True)
+    by_area = sorted(candidates, key=lambda e: (e.get("width") or 0) * (e.get("height") or 0),
+                     reverse=True)
+    top = {id(e): e for e in by_bytes[:INDEX_ENRICH_TOP] + by_area[:INDEX_ENRICH_TOP]}
+    return [e for e in top.values() if "colors" not in e]
+
+
+# ---------------------------------------------------------------------------
+# PDF scanning
+# ---------------------------------------------------------------------------
+
+# Fewest pages worth a worker process of their own; smaller scans stay serial
+MIN_PAGES_PER_WORKER = 16
+
+
+def _page_chunks(page_indices: List[int], jobs: int) -> List[List[int]]:
+    """Split the pages into at most *jobs* contiguous, near-equal chunks."""
+    jobs = max(1, min(jobs, len(page_indices) // MIN_PAGES_PER_WORKER))
+    size, extra = divmod(len(page_indices), jobs)
+    chunks, start = [], 0
+    for i in range(jobs):
+        end = start + size + (1 if i < extra else 0)
+        chunks.append(page_indices[start:end])
+        start = end
+    return chunks
+
+
+def scan_pages(scan, pdf_path: str, page_indices: List[int], jobs: int = 0,
+               deadline: float = None) -> Tuple[List[dict], List[int], bool]:
+    """
+    Run *scan* over the pages, split across worker processes.
+
+    *scan(pdf_path, pages, deadline)* opens its own handle on the PDF and
+    returns ``(entries, scanned_pages, budget_hit)`` with one index record
+    per image on its pages. Only that metadata crosses the process boundary;
+    the caller materialises the winner. *jobs* 0 means one per CPU.
+    """
+    jobs = jobs or (os.cpu_count() or 1)
+    chunks = _page_chunks(page_indices, jobs)
+    if len(chunks) == 1:
+        results = [scan(pdf_path, chunks[0], deadline)]
+    else:
+        # Forking while other threads run (batch-mode writers) can leave the
+        # children with a held lock; start them from a clean server instead
+        context = None
+        if threading.active_count() > 1 and "forkserver" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("forkserver")
+        with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as pool:
+            futures = [pool.submit(scan, pdf_path, chunk, deadline) for chunk in chunks]
+            results = [f.result() for f in futures]
+
+    entries, scanned = [], []
+    for chunk_entries, chunk_scanned, _ in results:
+        entries.extend(chunk_entries)
+        scanned.extend(chunk_scanned)
+    return entries, scanned, any(budget_hit for _, _, budget_hit in results)
+
+
+def _pick_from_pdf(pdf_path: str, page_indices: List[int], scan, enrich,
+                   index: ImageIndex, time_budget: float, jobs: int,
+                   strategy: str, top: int = 1) -> List[dict]:
+    """
+    The *top* diagram candidates among the images on *page_indices*, best first.
+
+    Pages the index does not cover yet are scanned with *scan* (see
+    scan_pages) and added to it; ``enrich(entries)`` fills in colour counts
+    and captions for the top candidates when scoring needs them.
+    """
+    deadline = time.monotonic() + time_budget if time_budget else None
+    missing = index.missing_pages(page_indices)
+    if missing:
+        entries, scanned, budget_hit = scan_pages(scan, pdf_path, missing, jobs, deadline)
+        index.add(entries, scanned)
+        if budget_hit:
+            print(f"Time budget of {time_budget}s reached, using best image so far")
+    else:
+        print(f"Using image index ({len(index.images)} images)")
+
+    candidates = index.candidates(page_indices)
+    if strategy == "score" and (deadline is None or time.monotonic() < deadline):
+        pending = _to_enrich(candidates)
+        if pending:
+            try:
+                enrich(pending)
+            except Exception as e:
+                print(f"Warning: Could not read image captions/colours: {e}")
+            index.changed = True
+    return rank_images(candidates, strategy)[:top]
+
+
+def _found_page(entry: dict, page_indices: List[int]) -> int:
+    """1-based page the chosen image was found on within the searched pages."""
+    wanted = set(page_indices)
+    return min(p for p in entry["pages"] if p in wanted) + 1
+
+
+def _report_found(found: List[Tuple[dict, bytes]]) -> None:
+    """Print what was extracted: the diagram, or the ranked candidates."""
+    for rank, (info, data) in enumerate(found, 1):
+        where = f" on page {info['page']}" if info.get("page") else f": {posixpath.basename(str(info['ref']))}"
+        if len(found) == 1:
+            print(f"Found architecture diagram{where} ({len(data)} bytes)")
+        else:
+            print(f"Candidate {rank}{where} ({len(data)} bytes)")
+
+
+def _scan_pdfplumber_pages(pdf_path: str, page_indices: List[int],
+                           deadline: float = None) -> Tuple[List[dict], List[int], bool]:
+    """Index records for the images on the given pages, read from their dictionaries."""
+    import pdfplumber
+
+    entries = {}
+    seen = {}
+    scanned = []
+    with pdfplumber.open(pdf_path) as pdf:
+        pages = pdf.pages
+        for page_idx in page_indices:
+            for objid, stream in _iter_image_streams(pages[page_idx].page_obj.resources, seen):
+                if stream is None:
+                    if page_idx not in entries[objid]["pages"]:
+                        entries[objid]["pages"].append(page_idx)
+                    continue
+                length, width, height = _declared_image_size(stream)
+                if length or width:
+                    entries[objid] = _image_entry(objid, page_idx, length, width, height)
+                else:
+                    seen[objid] = False
+            scanned.append(page_idx)
+            if deadline is not None and time.monotonic() > deadline:
+                return list(entries.values()), scanned, True
+    return list(entries.values()), scanned, False
+
+
+def _pdf_stream_image(stream):
+    """PIL image of a pdfminer image stream (JPEG or 8-bit Gray/RGB only)."""
+    from PIL import Image
+    from pdfminer.pdftypes import LITERALS_DCT_DECODE, resolve1
+
+    filters = [f for f, _ in stream.get_filters()]
+    if filters and filters[-1] in LITERALS_DCT_DECODE:
+        image = Image.open(io.BytesIO(stream.get_data()))
+        image.draft("RGB", (128, 128))
+        return image
+    colorspace = getattr(resolve1(stream.get('ColorSpace')), 'name', None)
+    mode = {"DeviceRGB": "RGB", "DeviceGray": "L"}.get(colorspace)
+    if mode is None or resolve1(stream.get('BitsPerComponent')) != 8:
+        return None
+    _, width, height = _declared_image_size(stream)
+    return Image.frombytes(mode, (width, height), stream.get_data())
+
+
+def _enrich_pdfplumber(pdf, entries: List[dict]) -> None:
+    """Thumbnail colour counts and captions for the given PDF index records."""
+    words_by_page = {}
+    for entry in entries:
+        try:
+            entry["colors"] = _thumbnail_colors(_pdf_stream_image(pdf.doc.getobj(entry["ref"])))
+        except Exception:
+            entry["colors"] = None
+
+        page_idx = entry["pages"][0]
+        page = pdf.pages[page_idx]
+        if page_idx not in words_by_page:
+            words_by_page[page_idx] = [(w["x0"], w["top"], w["x1"], w["bottom"], w["text"])
+                                       for w in page.extract_words()]
+        bbox = next(((img["x0"], img["top"], img["x1"], img["bottom"]) for img in page.images
+                     if getattr(img.get("stream"), "objid", None) == entry["ref"]), None)
+        entry["caption"] = _nearby_text(words_by_page[page_idx], bbox)
+
+
+@traced()
+def extract_from_pdf_pdfplumber(pdf_path: str, page_num: int = None,
+                                page_range: Tuple[int, Optional[int]] = None,
+                                time_budget: float = None, jobs: int = 0,
+                                strategy: str = "score", index: ImageIndex = None,
+                                top: int = 1) -> Optional[List[Tuple[dict, bytes]]]:
+    """
+    Extract images from PDF using pdfplumber.
+
+    Returns the *top* candidates, best first, as ``(record, bytes)`` pairs
+    where the record is the index entry plus the 1-based ``page``.
+
+    Candidates are read from their image dictionaries (declared stream
+    length, width, height) without decoding or running page layout, and
+    large page ranges are scanned by *jobs* worker processes. Once
+    *time_budget* seconds have passed, scanning stops and the best image
+    found so far is used. Only the chosen image is decoded.
+    """
     try:
         import pdfplumber
     except ImportError:
         return None
 
+    index = index or ImageIndex(None, "pdf", os.path.basename(pdf_path))
     try:
         with pdfplumber.open(pdf_path) as pdf:
-            total_pages = len(pdf.pages)
-
-            # Determine which pages to search
-            if page_num is not None:
-                if page_num < 1 or page_num > total_pages:
-                    print(f"Error: Page {page_num} out of range (1-{total_pages})")
-                    return None
-                pages_to_search = [pdf.pages[page_num - 1]]
-            else:
-                # Skip first 2 pages, search from page 3 onwards
-                pages_to_search = pdf.pages[2:] if len(pdf.pages) > 2 else pdf.pages
-
-            largest_image = None
-            largest_size = 0
-
-            for page_idx, page in enumerate(pages_to_search):
-                for image in page.images:
-                    if image:
-                        # Get image size
-                        img_bytes = image['stream'].get_data()
-                        img_size = len(img_bytes)
-
-                        if img_size > largest_size:
-                            largest_size = img_size
-                            largest_image = img_bytes
-                            page_found = (page_idx + (3 if page_num is None else page_num))
-
-            if largest_image:
-                print(f"Found architecture diagram ({largest_size} bytes)")
-                return largest_image
+            page_indices = pages_to_search(len(pdf.pages), page_num, page_range)
+            if page_indices is None:
+                return None
+
+            ranked = _pick_from_pdf(pdf_path, page_indices, _scan_pdfplumber_pages,
+                                    lambda entries: _enrich_pdfplumber(pdf, entries),
+                                    index, time_budget, jobs, strategy, top)
+            if ranked:
+                found = [(dict(entry, page=_found_page(entry, page_indices)),
+                          pdf.doc.getobj(entry["ref"]).get_data()) for entry in ranked]
+                _report_found(found)
+                return found
             else:
                 print("No images found in PDF")
                 return None
@@ -73,52 +574,123 @@ def extract_from_pdf_pdfplumber(pdf_path: str, page_num: int = None) -> bytes:
         return None
 
 
-def extract_from_pdf_fitz(pdf_path: str, page_num: int = None) -> bytes:
-    """Extract images from PDF using PyMuPDF (fitz)."""
+def _fitz_png(doc, xref: int) -> bytes:
+    """Render image *xref* as PNG bytes (CMYK converted to RGB)."""
+    import fitz
+
+    pix = fitz.Pixmap(doc, xref)
+    if pix.n - pix.alpha >= 4:  # CMYK
+        pix = fitz.Pixmap(fitz.csRGB, pix)
+    return pix.tobytes("png")
+
+
+def _fitz_image_bytes(doc, xref: int) -> bytes:
+    """
+    Bytes of image *xref*, transcoding only when needed.
+
+    Plain JPEG and PNG images are returned as stored in the PDF. Images with
+    a soft mask or a CMYK colour space are rendered to PNG instead, since
+    their raw stream would not show as it does in the document.
+    """
+    image = doc.extract_image(xref)
+    if image and image.get("ext") in ("jpeg", "png") and not image.get("smask") \
+            and image.get("colorspace", 3) <= 3:
+        return image["image"]
+    return _fitz_png(doc, xref)
+
+
+def _scan_fitz_pages(pdf_path: str, page_indices: List[int],
+                     deadline: float = None) -> Tuple[List[dict], List[int], bool]:
+    """
+    Index records for the images on the given pages.
+
+    Read like the pdfplumber path: raw stream /Length from the xref
+    dictionary, width and height from get_images(full=True). Nothing is
+    decoded; xrefs repeated across pages only have the page recorded.
+    """
+    import fitz
+
+    entries = {}
+    scanned = []
+    doc = fitz.open(pdf_path)
+    try:
+        for page_idx in page_indices:
+            for xref, _, width, height, *_ in doc[page_idx].get_images(full=True):
+                if xref in entries:
+                    if page_idx not in entries[xref]["pages"]:
+                        entries[xref]["pages"].append(page_idx)
+                    continue
+                kind, length = doc.xref_get_key(xref, "Length")
+                # An indirect /Length means reading the raw (still encoded) stream
+                length = int(length) if kind == "int" else len(doc.xref_stream_raw(xref) or b"")
+                entries[xref] = _image_entry(xref, page_idx, length, width, height)
+            scanned.append(page_idx)
+            if deadline is not None and time.monotonic() > deadline:
+                return list(entries.values()), scanned, True
+    finally:
+        doc.close()
+    return list(entries.values()), scanned, False
+
+
+def _enrich_fitz(doc, entries: List[dict]) -> None:
+    """Thumbnail colour counts and captions for the given PDF index records."""
+    import fitz
+
+    for entry in entries:
+        xref = entry["ref"]
+        try:
+            from PIL import Image
+            pix = fitz.Pixmap(doc, xref)
+            if pix.n - pix.alpha >= 4:  # CMYK
+                pix = fitz.Pixmap(fitz.csRGB, pix)
+            if pix.alpha:
+                pix = fitz.Pixmap(pix, 0)
+            mode = "RGB" if pix.n == 3 else "L"
+            entry["colors"] = _thumbnail_colors(
+                Image.frombytes(mode, (pix.width, pix.height), pix.samples))
+        except Exception:
+            entry["colors"] = None
+
+        page = doc[entry["pages"][0]]
+        words = [tuple(w[:5]) for w in page.get_text("words")]
+        rects = page.get_image_rects(xref)
+        bbox = (rects[0].x0, rects[0].y0, rects[0].x1, rects[0].y1) if rects else None
+        entry["caption"] = _nearby_text(words, bbox)
+
+
+@traced()
+def extract_from_pdf_fitz(pdf_path: str, page_num: int = None,
+                          page_range: Tuple[int, Optional[int]] = None,
+                          time_budget: float = None, jobs: int = 0,
+                          strategy: str = "score", index: ImageIndex = None,
+                          top: int = 1) -> Optional[List[Tuple[dict, bytes]]]:
+    """
+    Extract images from PDF using PyMuPDF (fitz).
+
+    Candidates are read from xref metadata alone; only the *top* ones are
+    extracted, and a plain JPEG/PNG comes back exactly as stored. Returns
+    ``(record, bytes)`` pairs like extract_from_pdf_pdfplumber.
+    """
     try:
         import fitz
     except ImportError:
         return None
 
+    index = index or ImageIndex(None, "pdf", os.path.basename(pdf_path))
     try:
         doc = fitz.open(pdf_path)
-        total_pages = len(doc)
+        page_indices = pages_to_search(len(doc), page_num, page_range)
+        if page_indices is None:
+            return None
 
-        # Determine which pages to search
-        if page_num is not None:
-            if page_num < 1 or page_num > total_pages:
-                print(f"Error: Page {page_num} out of range (1-{total_pages})")
-                return None
-            pages_to_search = [page_num - 1]
-        else:
-            # Skip first 2 pages, search from page 3 onwards
-            pages_to_search = list(range(2, total_pages)) if total_pages > 2 else list(range(total_pages))
-
-        largest_image = None
-        largest_size = 0
-
-        for page_idx in pages_to_search:
-            page = doc[page_idx]
-            image_list = page.get_images()
-
-            for img_index in image_list:
-                xref = img_index[0]
-                pix = fitz.Pixmap(doc, xref)
-
-                if pix.n - pix.alpha < 4:  # GRAY or RGB
-                    img_data = pix.tobytes("png")
-                else:  # CMYK
-                    pix = fitz.Pixmap(fitz.csRGB, pix)
-                    img_data = pix.tobytes("png")
-
-                img_size = len(img_data)
-                if img_size > largest_size:
-                    largest_size = img_size
-                    largest_image = img_data
-
-        if largest_image:
-            print(f"Found architecture diagram ({largest_size} bytes)")
-            return largest_image
+        ranked = _pick_from_pdf(pdf_path, page_indices, _scan_fitz_pages,
+                                lambda entries: _enrich_fitz(doc, entries),
+                                index, time_budget, jobs, strategy, top)
+        if ranked:
+            found = [(dict(entry, page=_found_page(entry, page_indices)),
+                      _fitz_image_bytes(doc, entry["ref"])) for entry in ranked]
+            _report_found(found)
+            return found
         else:
             print("No images found in PDF")
             return None
@@ -128,6 +700,7 @@ def extract_from_pdf_fitz(pdf_path: str, page_num: int = None) -> bytes:
         return None
 
 
+@traced()
 def extract_from_pdf_zipmethod(pdf_path: str, page_num: int = None) -> bytes:
     """Fallback: Extract images from PDF by treating it as a ZIP archive."""
     try:
@@ -148,80 +721,195 @@ def extract_from_pdf_zipmethod(pdf_path: str, page_num: int = None) -> bytes:
     return None
 
 
-def extract_from_pdf(pdf_path: str, page_num: int = None) -> bytes:
-    """Extract images from PDF with fallback mechanisms."""
+def extract_images_from_pdf(pdf_path: str, page_num: int = None,
+                            page_range: Tuple[int, Optional[int]] = None,
+                            time_budget: float = None, jobs: int = 0,
+                            strategy: str = "score", use_index: bool = True,
+                            top: int = 1) -> List[Tuple[dict, bytes]]:
+    """Top diagram candidates of a PDF, best first, with fallback mechanisms."""
     print(f"Extracting from PDF: {pdf_path}")
+    index = ImageIndex.load(pdf_path, "pdf", enabled=use_index)
 
-    # Try pdfplumber first
-    result = extract_from_pdf_pdfplumber(pdf_path, page_num)
-    if result:
-        return result
-
-    print("pdfplumber not available, trying PyMuPDF...")
-
-    # Try PyMuPDF
-    result = extract_from_pdf_fitz(pdf_path, page_num)
-    if result:
-        return result
+    try:
+        # Try pdfplumber first
+        result = extract_from_pdf_pdfplumber(pdf_path, page_num, page_range, time_budget, jobs,
+                                             strategy, index, top)
+        if result:
+            return result
+
+        print("pdfplumber not available, trying PyMuPDF...")
+
+        # Try PyMuPDF
+        result = extract_from_pdf_fitz(pdf_path, page_num, page_range, time_budget, jobs,
+                                       strategy, index, top)
+        if result:
+            return result
+    finally:
+        index.save()
 
     print("PyMuPDF not available, trying ZIP-based extraction...")
 
     # Try ZIP method
     result = extract_from_pdf_zipmethod(pdf_path, page_num)
     if result:
-        return result
+        return [({"ref": None, "page": None}, result)]
 
-    return None
+    return []
 
 
-def extract_from_docx(docx_path: str) -> bytes:
-    """Extract images from DOCX file."""
+def extract_from_pdf(pdf_path: str, page_num: int = None,
+                     page_range: Tuple[int, Optional[int]] = None,
+                     time_budget: float = None, jobs: int = 0,
+                     strategy: str = "score", use_index: bool = True) -> bytes:
+    """Extract images from PDF with fallback mechanisms."""
+    found = extract_images_from_pdf(pdf_path, page_num, page_range, time_budget, jobs,
+                                    strategy, use_index)
+    return found[0][1] if found else None
+
+
+DOCX_DOCUMENT_PART = "word/document.xml"
+DOCX_DOCUMENT_RELS = "word/_rels/document.xml.rels"
+IMAGE_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/image"
+RELATIONSHIP_PATTERN = re.compile(r'<Relationship\b[^>]*>')
+ATTRIBUTE_PATTERN = re.compile(r'(\w+)="([^"]*)"')
+REL_REFERENCE_PATTERN = re.compile(r'r:(?:embed|link|id)="([^"]+)"')
+TEXT_RUN_PATTERN = re.compile(r'<w:t(?:\s[^>]*)?>([^<]*)</w:t>')
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tif', '.tiff', '.emf', '.wmf', '.svg')
+
+
+def _docx_body_images(docx_zip: zipfile.ZipFile, members: dict) -> Dict[str, List[str]]:
+    """
+    Media parts referenced from the document body, with their relationship ids.
+
+    Resolved through word/_rels/document.xml.rels, so images that only
+    appear in headers and footers (the customer logo) are never candidates,
+    nor are relationships the body does not use.
+    """
+    if DOCX_DOCUMENT_RELS not in members or DOCX_DOCUMENT_PART not in members:
+        return {}
+    rels_xml = docx_zip.read(DOCX_DOCUMENT_RELS).decode("utf-8", errors="replace")
+    targets = {}
+    for tag in RELATIONSHIP_PATTERN.findall(rels_xml):
+        attrs = dict(ATTRIBUTE_PATTERN.findall(tag))
+        if attrs.get("Type") != IMAGE_REL_TYPE or attrs.get("TargetMode") == "External":
+            continue
+        target = attrs.get("Target", "")
+        part = target.lstrip("/") if target.startswith("/") else posixpath.normpath(
+            posixpath.join("word", target))
+        if part in members:
+            targets[attrs.get("Id")] = part
+
+    body_xml = docx_zip.read(DOCX_DOCUMENT_PART).decode("utf-8", errors="replace")
+    used = set(REL_REFERENCE_PATTERN.findall(body_xml))
+    parts: Dict[str, List[str]] = {}
+    for rel_id, part in targets.items():
+        if rel_id in used:
+            parts.setdefault(part, []).append(rel_id)
+    return dict(sorted(parts.items()))
+
+
+def _index_docx(docx_zip: zipfile.ZipFile, index: ImageIndex) -> None:
+    """Fill an empty index with the DOCX's candidate media parts."""
+    members = {info.filename: info for info in docx_zip.infolist()}
+    body_images = _docx_body_images(docx_zip, members)
+    if not body_images:
+        # No usable relationships: fall back to the images in word/media/
+        # (sorted by name), skipping the first one (usually the logo)
+        image_files = sorted(name for name in members
+                             if name.startswith("word/media/")
+                             and name.lower().endswith(IMAGE_EXTENSIONS))
+        candidates = image_files[1:] if len(image_files) > 1 else image_files
+        body_images = {name: [] for name in candidates}
+
+    entries = []
+    for part, rel_ids in body_images.items():
+        entry = _image_entry(part, None, members[part].file_size, 0, 0)
+        entry["rel_ids"] = rel_ids
+        entries.append(entry)
+    index.add(entries, [])
+    index.complete = True
+
+
+def _enrich_docx(docx_zip: zipfile.ZipFile, entries: List[dict]) -> None:
+    """Dimensions, thumbnail colour counts and captions for DOCX index records."""
+    paragraphs = None
+    for entry in entries:
+        try:
+            from PIL import Image
+            image = Image.open(io.BytesIO(docx_zip.read(entry["ref"])))
+            entry["width"], entry["height"] = image.size
+            entry["aspect"] = round(image.width / image.height, 3) if image.height else None
+            if image.format == "JPEG":
+                image.draft("RGB", (128, 128))
+            entry["colors"] = _thumbnail_colors(image)
+        except Exception:
+            entry["colors"] = None
+
+        caption = ""
+        if entry.get("rel_ids"):
+            if paragraphs is None:
+                body_xml = docx_zip.read(DOCX_DOCUMENT_PART).decode("utf-8", errors="replace")
+                paragraphs = body_xml.split("</w:p>")
+            needles = [f'"{rel_id}"' for rel_id in entry["rel_ids"]]
+            for i, paragraph in enumerate(paragraphs):
+                if any(needle in paragraph for needle in needles):
+                    caption = " ".join(" ".join(TEXT_RUN_PATTERN.findall(p)).strip()
+                                       for p in paragraphs[max(0, i - 1):i + 2]).strip()
+                    break
+        entry["caption"] = caption[:200]
+
+
+@traced()
+def extract_images_from_docx(docx_path: str, strategy: str = "score", use_index: bool = True,
+                             top: int = 1) -> List[Tuple[dict, bytes]]:
+    """
+    Top diagram candidates of a DOCX file, best first.
+
+    Candidates come from the ZIP central directory (ZipInfo.file_size) and
+    the image index; only the chosen members are read and nothing is
+    unpacked to disk.
+    """
     print(f"Extracting from DOCX: {docx_path}")
 
     try:
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # DOCX is a ZIP archive
-            with zipfile.ZipFile(docx_path, 'r') as docx_zip:
-                # Extract all files
-                docx_zip.extractall(tmpdir)
-
-                # Look for images in word/media/
-                media_dir = Path(tmpdir) / "word" / "media"
-
-                if not media_dir.exists():
-                    print("No word/media directory found in DOCX")
-                    return None
-
-                # Get all images, sorted by name (natural order)
-                image_files = sorted([f for f in media_dir.iterdir() if f.is_file()])
-
-                if not image_files:
-                    print("No images found in word/media/")
-                    return None
-
-                # Skip first image (usually logo), take largest remaining
-                if len(image_files) > 1:
-                    candidates = image_files[1:]
-                else:
-                    candidates = image_files
-
-                # Find largest image
-                largest_file = max(candidates, key=lambda f: f.stat().st_size)
-
-                with open(largest_file, 'rb') as f:
-                    img_data = f.read()
-
-                print(f"Found architecture diagram: {largest_file.name} ({len(img_data)} bytes)")
-                return img_data
+        index = ImageIndex.load(docx_path, "docx", enabled=use_index)
+        with zipfile.ZipFile(docx_path, 'r') as docx_zip:
+            if index.complete:
+                print(f"Using image index ({len(index.images)} images)")
+            else:
+                _index_docx(docx_zip, index)
+
+            candidates = index.candidates()
+            if not candidates:
+                print("No images found in word/media/")
+                return []
+            if strategy == "score":
+                pending = _to_enrich(candidates)
+                if pending:
+                    _enrich_docx(docx_zip, pending)
+                    index.changed = True
+            index.save()
+
+            found = [(dict(entry, page=None), docx_zip.read(entry["ref"]))
+                     for entry in rank_images(candidates, strategy)[:top]]
+            _report_found(found)
+            return found
 
     except zipfile.BadZipFile:
         print("Error: Invalid DOCX file (not a valid ZIP archive)")
-        return None
+        return []
     except Exception as e:
         print(f"Error extracting from DOCX: {e}")
-        return None
+        return []
+
+
+def extract_from_docx(docx_path: str, strategy: str = "score", use_index: bool = True) -> bytes:
+    """Extract images from DOCX file."""
+    found = extract_images_from_docx(docx_path, strategy, use_index)
+    return found[0][1] if found else None
 
 
+@traced()
 def save_image(image_data: bytes, output_path: str) -> bool:
     """Save image data to file."""
     try:
@@ -238,6 +926,135 @@ def save_image(image_data: bytes, output_path: str) -> bool:
         return False
 
 
+# ---------------------------------------------------------------------------
+# Batch mode
+# ---------------------------------------------------------------------------
+
+SUPPORTED_TYPES = ('.pdf', '.docx')
+
+IMAGE_SIGNATURES = (
+    (b'\x89PNG\r\n\x1a\n', '.png'),
+    (b'\xff\xd8\xff', '.jpg'),
+    (b'GIF8', '.gif'),
+    (b'BM', '.bmp'),
+    (b'II*\x00', '.tif'),
+    (b'MM\x00*', '.tif'),
+)
+
+
+def collect_inputs(patterns: List[str]) -> List[str]:
+    """
+    Expand ``--input`` arguments: files as-is, directories to their PDF/DOCX
+    files, and glob patterns (``'decks/**/*.pdf'``) to their matches.
+    """
+    files: List[str] = []
+    for pattern in patterns:
+        if os.path.isdir(pattern):
+            files.extend(
+                os.path.join(pattern, name) for name in sorted(os.listdir(pattern))
+                if name.lower().endswith(SUPPORTED_TYPES)
+            )
+        elif glob.has_magic(pattern):
+            files.extend(sorted(glob.glob(pattern, recursive=True)))
+        else:
+            files.append(pattern)
+    return list(dict.fromkeys(files))
+
+
+def image_extension(data: bytes) -> str:
+    """File extension matching the image data (".png" when unrecognised)."""
+    for signature, ext in IMAGE_SIGNATURES:
+        if data.startswith(signature):
+            return ext
+    return '.png'
+
+
+def extract_images(input_path: str, top: int = 1, page_num: int = None,
+                   page_range: Tuple[int, Optional[int]] = None, time_budget: float = None,
+                   jobs: int = 0, strategy: str = "score",
+                   use_index: bool = True) -> List[Tuple[dict, bytes]]:
+    """Top diagram candidates of a PDF or DOCX, best first."""
+    file_ext = Path(input_path).suffix.lower()
+    if file_ext == '.pdf':
+        return extract_images_from_pdf(input_path, page_num, page_range, time_budget, jobs,
+                                       strategy, use_index, top)
+    if file_ext == '.docx':
+        return extract_images_from_docx(input_path, strategy, use_index, top)
+    raise ValueError(f"Unsupported file type: {file_ext} (supported: .pdf, .docx)")
+
+
+@traced()
+def extract_batch(inputs: List[str], output_dir: str, top: int = 1, io_workers: int = 4,
+                  manifest_path: str = None, **options) -> Dict:
+    """
+    Extract the *top* diagram candidates of every input into *output_dir*.
+
+    Documents are scanned one after another (large PDFs still use the page
+    scanning pool), while a thread pool writes the extracted images so disk
+    I/O overlaps the next document. Files are named ``<stem>.<ext>``, or
+    ``<stem>-<rank>.<ext>`` with *top* > 1. A failing document is recorded in
+    the manifest instead of stopping the batch. The manifest is returned and
+    written to *manifest_path* (default ``<output_dir>/manifest.json``).
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    manifest_path = manifest_path or os.path.join(output_dir, "manifest.json")
+    documents = []
+    used_stems = set()
+    writes = []
+
+    with ThreadPoolExecutor(max_workers=max(1, io_workers)) as writer:
+        for input_path in inputs:
+            start = time.perf_counter()
+            record = {"input": input_path, "images": [], "error": None}
+            try:
+                if not os.path.isfile(input_path):
+                    raise FileNotFoundError(f"Input file not found: {input_path}")
+                found = extract_images(input_path, top, **options)
+                if not found:
+                    record["error"] = "No images found"
+            except Exception as e:
+                found = []
+                record["error"] = f"{type(e).__name__}: {e}"
+            record["seconds"] = round(time.perf_counter() - start, 3)
+
+            stem = base = Path(input_path).stem
+            n = 1
+            while stem in used_stems:
+                n += 1
+                stem = f"{base}-{n}"
+            used_stems.add(stem)
+
+            for rank, (info, data) in enumerate(found, 1):
+                name = stem if top == 1 else f"{stem}-{rank}"
+                output = os.path.join(output_dir, name + image_extension(data))
+                image = {
+                    "rank": rank,
+                    "output": output,
+                    "bytes": len(data),
+                    "page": info.get("page"),
+                    "ref": info.get("ref"),
+                    "width": info.get("width"),
+                    "height": info.get("height"),
+                    "caption": info.get("caption"),
+                }
+                record["images"].append(image)
+                writes.append((image, writer.submit(save_image, data, output)))
+            documents.append(record)
+
+        for image, future in writes:
+            image["written"] = future.result()
+
+    manifest = {
+        "strategy": options.get("strategy", "score"),
+        "top": top,
+        "documents": documents,
+    }
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+    print(f"Manifest written: {manifest_path}")
+    return manifest
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Extract architecture diagram images from hackathon documents",
@@ -250,20 +1067,47 @@ Examples:
   # Extract from specific PDF page
   %(prog)s --input hackathon.pdf --output diagram.png --page 5
 
+  # Only scan slides 10-40, giving up after 2 seconds
+  %(prog)s --input hackathon.pdf --output diagram.png --pages 10-40 --time-budget 2
+
   # Extract from DOCX
   %(prog)s --input proposal.docx --output diagram.png
+
+  # Batch: top 3 candidates of every past hackathon deck, plus a manifest
+  %(prog)s --input 'archive/**/*.pdf' proposals/ --top 3 --output-dir candidates/
         """
     )
 
     parser.add_argument(
         '--input', '-i',
         required=True,
-        help='Input file (PDF or DOCX)'
+        nargs='+',
+        help='Input file(s) (PDF or DOCX); directories and quoted glob patterns are expanded'
     )
     parser.add_argument(
         '--output', '-o',
-        required=True,
-        help='Output image file (PNG)'
+        help='Output image file (PNG) for a single input'
+    )
+    parser.add_argument(
+        '--output-dir',
+        help='Batch mode: directory for the extracted images and manifest.json '
+             '(required with several inputs or --top)'
+    )
+    parser.add_argument(
+        '--top',
+        type=int,
+        default=1,
+        help='Batch mode: extract the N best candidates per document (default 1)'
+    )
+    parser.add_argument(
+        '--manifest',
+        help='Batch mode: where to write the JSON manifest (default <output-dir>/manifest.json)'
+    )
+    parser.add_argument(
+        '--io-workers',
+        type=int,
+        default=4,
+        help='Batch mode: threads writing the extracted images (default 4)'
     )
     parser.add_argument(
         '--page', '-p',
@@ -271,37 +1115,101 @@ Examples:
         default=None,
         help='Specific page number to extract from (PDF only)'
     )
+    parser.add_argument(
+        '--pages',
+        type=parse_page_range,
+        default=None,
+        metavar='RANGE',
+        help='Only scan this page range, e.g. 3-20 or 10- (PDF only; ignored with --page)'
+    )
+    parser.add_argument(
+        '--time-budget',
+        type=float,
+        default=None,
+        metavar='SECONDS',
+        help='Stop scanning PDF pages after this many seconds and use the best image so far'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=0,
+        help='Worker processes for scanning large PDFs (default: one per CPU)'
+    )
+    parser.add_argument(
+        '--strategy',
+        choices=STRATEGIES,
+        default='score',
+        help="How to pick the diagram: 'score' weighs size, shape, palette and caption "
+             "text (default); 'largest' takes the largest image"
+    )
+    parser.add_argument(
+        '--no-index',
+        action='store_true',
+        help='Neither read nor update the cached image index for this document'
+    )
+    add_profile_arguments(parser)
 
     args = parser.parse_args()
 
+    inputs = collect_inputs(args.input)
+    if args.top < 1:
+        parser.error('--top must be at least 1')
+
+    if len(inputs) > 1 or args.top > 1 or args.output_dir:
+        if not args.output_dir:
+            parser.error('--output-dir is required with several inputs or --top')
+        if not inputs:
+            print(f"Error: No input files match: {' '.join(args.input)}")
+            sys.exit(1)
+
+        with profiled(args, "extract_architecture_diagram"):
+            manifest = extract_batch(
+                inputs, args.output_dir, top=args.top, io_workers=args.io_workers,
+                manifest_path=args.manifest, page_num=args.page, page_range=args.pages,
+                time_budget=args.time_budget, jobs=args.jobs, strategy=args.strategy,
+                use_index=not args.no_index
+            )
+        failed = [doc for doc in manifest["documents"]
+                  if doc["error"] or not all(image["written"] for image in doc["images"])]
+        extracted = sum(len(doc["images"]) for doc in manifest["documents"])
+        print(f"Extracted {extracted} image(s) from {len(inputs) - len(failed)}/{len(inputs)} document(s)")
+        for doc in failed:
+            print(f"  FAILED {doc['input']}: {doc['error'] or 'could not write image'}")
+        sys.exit(1 if failed else 0)
+
+    if not args.output:
+        parser.error('--output is required for a single input (or use --output-dir)')
+
     # Validate input file
-    input_path = Path(args.input)
+    input_path = Path(inputs[0]) if inputs else Path(args.input[0])
     if not input_path.exists():
-        print(f"Error: Input file not found: {args.input}")
+        print(f"Error: Input file not found: {input_path}")
         sys.exit(1)
 
     file_ext = input_path.suffix.lower()
 
-    # Extract based on file type
-    if file_ext == '.pdf':
-        image_data = extract_from_pdf(str(input_path), args.page)
-    elif file_ext == '.docx':
-        if args.page is not None:
-            print("Warning: --page argument ignored for DOCX files")
-        image_data = extract_from_docx(str(input_path))
-    else:
-        print(f"Error: Unsupported file type: {file_ext}")
-        print("Supported types: .pdf, .docx")
-        sys.exit(1)
-
-    # Check if extraction was successful
-    if not image_data:
-        print("Error: Could not extract architecture diagram from document")
-        sys.exit(1)
-
-    # Save the image
-    if not save_image(image_data, args.output):
-        sys.exit(1)
+    with profiled(args, "extract_architecture_diagram"):
+        # Extract based on file type
+        if file_ext == '.pdf':
+            image_data = extract_from_pdf(str(input_path), args.page, args.pages, args.time_budget,
+                                          args.jobs, args.strategy, not args.no_index)
+        elif file_ext == '.docx':
+            if args.page is not None or args.pages is not None:
+                print("Warning: --page/--pages arguments ignored for DOCX files")
+            image_data = extract_from_docx(str(input_path), args.strategy, not args.no_index)
+        else:
+            print(f"Error: Unsupported file type: {file_ext}")
+            print("Supported types: .pdf, .docx")
+            sys.exit(1)
+
+        # Check if extraction was successful
+        if not image_data:
+            print("Error: Could not extract architecture diagram from document")
+            sys.exit(1)
+
+        # Save the image
+        if not save_image(image_data, args.output):
+            sys.exit(1)
 
     print("Success!")
     sys.exit(0)
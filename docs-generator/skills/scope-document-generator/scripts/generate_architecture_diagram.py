@@ -8,11 +8,21 @@ quality of hand-crafted architecture diagrams.
 
 Rendering pipeline (automatic fallback):
   1. Graphviz ``dot``  (best quality — zones, shapes, arrow routing)
-  2. Pillow PNG         (basic grid if Graphviz is missing)
+  2. Pillow PNG         (basic grid if Graphviz is missing; other formats
+                         are written as ``<stem>.png`` and extra DPI
+                         variants are skipped)
+
+Several outputs (``-o a.png -o a.svg --dpi 150,300``) share a single
+Graphviz layout pass; DOT is piped to Graphviz over stdin.
+
+Graphviz renders are cached on disk, keyed by a hash of the DOT source,
+format and DPI, so re-rendering an unchanged diagram skips Graphviz
+(``--no-cache`` forces a fresh render).
 
 Usage:
     python generate_architecture_diagram.py \\
         --description <desc.json> --output <diagram.png> [--style detailed]
+        [--output <diagram.svg>] [--dpi 150,300]
 
 Example description.json:
 {
@@ -62,15 +72,33 @@ Component types → Graphviz shapes:
 """
 
 import argparse
+import hashlib
 import json
 import os
 import re
 import shutil
 import subprocess
 import sys
-import tempfile
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# Shared helpers (docgen_trace, docgen_worker) live in <plugin>/scripts
+_PLUGIN_SCRIPTS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                "..", "..", "..", "scripts"))
+if _PLUGIN_SCRIPTS not in sys.path:
+    sys.path.insert(0, _PLUGIN_SCRIPTS)
+from docgen_trace import add_profile_arguments, profiled, span, traced
+
+if __name__ == "__main__":
+    # Hand off to a warm docgen worker (<plugin>/scripts/docgen_worker.py)
+    # when one is running; otherwise fall through and run in-process.
+    try:
+        from docgen_worker import forward_cli
+        _exit_code = forward_cli("generate_architecture_diagram", sys.argv[1:])
+    except ImportError:
+        _exit_code = None
+    if _exit_code is not None:
+        sys.exit(_exit_code)
 
 # ---------------------------------------------------------------------------
 # Graphviz shape / colour mappings
@@ -130,6 +158,7 @@ def _escape_label(text: str) -> str:
 # Graphviz DOT generation
 # ---------------------------------------------------------------------------
 
+@traced()
 def generate_dot(description: Dict[str, Any], style: str = "detailed") -> str:
     """Build a Graphviz DOT string from an architecture description dict."""
 
@@ -273,40 +302,216 @@ def _lighten(hex_color: str) -> str:
 # Rendering
 # ---------------------------------------------------------------------------
 
-def render_with_graphviz(dot_source: str, output_path: str, dpi: int = 150) -> bool:
-    """Render a DOT string to PNG using the ``dot`` command."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".dot", delete=False) as f:
-        f.write(dot_source)
-        dot_file = f.name
+# Output extension -> Graphviz -T format
+GRAPHVIZ_FORMATS = {
+    ".png": "png",
+    ".jpg": "jpg",
+    ".jpeg": "jpg",
+    ".gif": "gif",
+    ".svg": "svg",
+    ".pdf": "pdf",
+    ".eps": "eps",
+}
 
+# Formats whose pixel size depends on the DPI (one file per requested DPI)
+RASTER_FORMATS = {"png", "jpg", "gif"}
+
+# A render target: (output path, Graphviz format, dpi)
+Target = Tuple[str, str, int]
+
+
+def plan_targets(outputs: List[str], dpis: List[int]) -> List[Target]:
+    """Expand output paths x DPIs into render targets.
+
+    Raster outputs are rendered once per DPI: the first DPI writes to the
+    path as given, each further DPI to ``<stem>@<dpi>dpi<ext>``.  Vector
+    outputs (SVG, PDF, EPS) are resolution-independent and rendered once.
+    """
+    targets: List[Target] = []
+    for output in outputs:
+        root, ext = os.path.splitext(output)
+        fmt = GRAPHVIZ_FORMATS[ext.lower()]
+        if fmt not in RASTER_FORMATS:
+            targets.append((output, fmt, dpis[0]))
+            continue
+        for i, dpi in enumerate(dpis):
+            path = output if i == 0 else f"{root}@{dpi}dpi{ext}"
+            targets.append((path, fmt, dpi))
+    return targets
+
+
+def plan_fallback_targets(targets: List[Target], dpis: List[int]) -> List[str]:
+    """Map render targets onto the PNG files the Pillow fallback can write.
+
+    The fallback draws one fixed-size PNG, so non-PNG outputs are renamed
+    to ``<stem>.png`` and the extra ``@<dpi>dpi`` raster variants, which it
+    cannot honour, are skipped.  Both are reported as warnings.
+    """
+    paths: List[str] = []
+    for path, fmt, target_dpi in targets:
+        if fmt in RASTER_FORMATS and target_dpi != dpis[0]:
+            print(f"Warning: Pillow fallback cannot render at {target_dpi} DPI; skipping {path}")
+            continue
+        if fmt != "png":
+            png_path = os.path.splitext(path)[0] + ".png"
+            print(f"Warning: Pillow fallback only writes PNG; writing {png_path} instead of {path}")
+            path = png_path
+        if path not in paths:
+            paths.append(path)
+    return paths
+
+
+def _run_graphviz(cmd: List[str], stdin: str) -> Optional[str]:
+    """Run a Graphviz command with *stdin* piped in; returns stdout or None."""
     try:
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-        cmd = ["dot", f"-Gdpi={dpi}", "-Tpng", dot_file, "-o", output_path]
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=30)
-
-        if result.returncode != 0:
-            print(f"Graphviz error: {result.stderr}")
-            return False
-
-        print(f"Generated diagram with Graphviz: {output_path}")
-        return True
-
+        result = subprocess.run(cmd, input=stdin, capture_output=True,
+                                text=True, timeout=30)
     except FileNotFoundError:
-        print("Graphviz 'dot' command not found")
-        return False
+        print(f"Graphviz '{cmd[0]}' command not found")
+        return None
     except subprocess.TimeoutExpired:
         print("Graphviz rendering timed out")
-        return False
+        return None
     except Exception as e:
         print(f"Graphviz error: {e}")
+        return None
+
+    if result.returncode != 0:
+        print(f"Graphviz error: {result.stderr}")
+        return None
+    return result.stdout
+
+
+@traced()
+def render_targets_with_graphviz(dot_source: str, targets: List[Target]) -> bool:
+    """Render every target from a single Graphviz layout pass.
+
+    DOT is piped over stdin.  Targets sharing one DPI are written by a single
+    ``dot`` run with repeated ``-T<fmt> -o <path>`` pairs (Graphviz lays the
+    graph out once per run).  With several DPIs the layout is computed once
+    with ``dot -Tdot`` and each DPI is rendered from that positioned graph
+    by ``neato -n2``, which skips layout entirely.
+    """
+    if not targets:
+        return True
+    for path, _, _ in targets:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+
+    by_dpi: Dict[int, List[Target]] = {}
+    for target in targets:
+        by_dpi.setdefault(target[2], []).append(target)
+
+    if len(by_dpi) == 1:
+        layout, engine = dot_source, ["dot"]
+    else:
+        layout = _run_graphviz(["dot", "-Tdot"], dot_source)
+        if layout is None:
+            return False
+        engine = ["neato", "-n2"]
+
+    for dpi, group in by_dpi.items():
+        cmd = engine + [f"-Gdpi={dpi}"]
+        for path, fmt, _ in group:
+            cmd += [f"-T{fmt}", "-o", path]
+        if _run_graphviz(cmd, layout) is None:
+            return False
+        for path, _, _ in group:
+            print(f"Generated diagram with Graphviz: {path}")
+    return True
+
+
+def render_with_graphviz(dot_source: str, output_path: str, dpi: int = 150) -> bool:
+    """Render a DOT string to a single file using the ``dot`` command."""
+    fmt = GRAPHVIZ_FORMATS.get(os.path.splitext(output_path)[1].lower(), "png")
+    return render_targets_with_graphviz(dot_source, [(output_path, fmt, dpi)])
+
+
+# ---------------------------------------------------------------------------
+# Render cache
+# ---------------------------------------------------------------------------
+# Graphviz output is a pure function of the DOT source, format and DPI, so
+# rendered files are cached on disk under a hash of all three.  Review loops that
+# re-render an unchanged diagram copy the cached file instead of running
+# ``dot`` again.  The cache is trimmed least-recently-used first once it
+# exceeds DOCGEN_DIAGRAM_CACHE_MB (default 64 MB).
+
+DEFAULT_CACHE_MB = 64
+
+
+def diagram_cache_dir() -> Path:
+    """Cache folder: $DOCGEN_DIAGRAM_CACHE, else ~/.cache/docs-generator/diagrams."""
+    env = os.environ.get("DOCGEN_DIAGRAM_CACHE")
+    if env:
+        return Path(env)
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(Path.home(), ".cache")
+    return Path(base) / "docs-generator" / "diagrams"
+
+
+def _cache_file(cache_dir: Path, dot_source: str, fmt: str, dpi: int) -> Path:
+    key = hashlib.sha256(f"{fmt}:{dpi}\n{dot_source}".encode("utf-8")).hexdigest()
+    return cache_dir / f"{key}.{fmt}"
+
+
+@traced()
+def cache_lookup(dot_source: str, fmt: str, dpi: int, output_path: str) -> bool:
+    """Copy a cached render to *output_path*; returns False on a miss."""
+    cached = _cache_file(diagram_cache_dir(), dot_source, fmt, dpi)
+    try:
+        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(cached, output_path)
+        os.utime(cached)  # mark as recently used
+    except OSError:
         return False
-    finally:
+    return True
+
+
+@traced()
+def cache_store(dot_source: str, fmt: str, dpi: int, rendered_path: str) -> None:
+    """Add a freshly rendered file to the cache, then trim the cache."""
+    cache_dir = diagram_cache_dir()
+    target = _cache_file(cache_dir, dot_source, fmt, dpi)
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        shutil.copyfile(rendered_path, tmp)
+        os.replace(tmp, target)
+    except OSError as e:
+        print(f"Warning: could not cache diagram: {e}")
+        return
+
+    try:
+        max_mb = float(os.environ.get("DOCGEN_DIAGRAM_CACHE_MB", DEFAULT_CACHE_MB))
+    except ValueError:
+        max_mb = DEFAULT_CACHE_MB
+    _evict_cache(cache_dir, int(max_mb * 1024 * 1024), keep=target)
+
+
+def _evict_cache(cache_dir: Path, max_bytes: int, keep: Optional[Path] = None) -> None:
+    """Delete least-recently-used entries (never *keep*) until under *max_bytes*."""
+    entries = []
+    for entry in cache_dir.iterdir():
+        if entry.suffix == ".tmp":
+            continue
         try:
-            os.unlink(dot_file)
+            st = entry.stat()
+        except OSError:
+            continue
+        entries.append((st.st_mtime, st.st_size, entry))
+
+    total = sum(size for _, size, _ in entries)
+    for _, size, entry in sorted(entries, key=lambda e: e[0]):
+        if total <= max_bytes:
+            break
+        if entry == keep:
+            continue
+        try:
+            entry.unlink()
+            total -= size
         except OSError:
             pass
 
 
+@traced()
 def render_with_pillow(description: Dict[str, Any], output_path: str) -> bool:
     """Basic Pillow PNG fallback (grid layout, no zones)."""
     try:
@@ -383,7 +588,65 @@ def load_description(json_path: str) -> Optional[Dict[str, Any]]:
         return None
 
 
-def main():
+def generate_architecture_diagram(
+    description: Dict[str, Any],
+    output_path: Union[str, List[str]],
+    style: str = "detailed",
+    dpi: Union[int, List[int]] = 150,
+    use_cache: bool = True,
+) -> bool:
+    """Render *description* to one or more files.
+
+    *output_path* and *dpi* may each be a single value or a list; see
+    plan_targets() for how they combine.  All Graphviz outputs share one
+    layout pass and are served from / added to the on-disk render cache
+    unless *use_cache* is False.  If Graphviz is unavailable, the Pillow
+    renderer writes a PNG per output instead; see plan_fallback_targets().
+    """
+    outputs = [output_path] if isinstance(output_path, str) else list(output_path)
+    dpis = [dpi] if isinstance(dpi, int) else list(dpi)
+    targets = plan_targets(outputs, dpis)
+
+    dot_source = generate_dot(description, style=style)
+    print("\nGenerated DOT source:")
+    print(dot_source)
+    print()
+
+    pending = []
+    for path, fmt, target_dpi in targets:
+        if use_cache and cache_lookup(dot_source, fmt, target_dpi, path):
+            print(f"Reused cached diagram: {path}")
+        else:
+            pending.append((path, fmt, target_dpi))
+
+    if render_targets_with_graphviz(dot_source, pending):
+        if use_cache:
+            for path, fmt, target_dpi in pending:
+                cache_store(dot_source, fmt, target_dpi, path)
+        print("Success!")
+        return True
+
+    print("Falling back to Pillow renderer...")
+    if all(render_with_pillow(description, path)
+           for path in plan_fallback_targets(pending, dpis)):
+        print("Success (Pillow fallback)!")
+        return True
+
+    print("Error: all renderers failed")
+    return False
+
+
+def _parse_dpis(value: str) -> List[int]:
+    try:
+        dpis = [int(v) for v in value.split(",") if v.strip()]
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid DPI list: {value!r}")
+    if not dpis or min(dpis) <= 0:
+        raise argparse.ArgumentTypeError(f"invalid DPI list: {value!r}")
+    return dpis
+
+
+def main(argv: Optional[List[str]] = None):
     parser = argparse.ArgumentParser(
         description="Generate architecture diagrams from JSON descriptions",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -393,14 +656,24 @@ Component types: client, service, database, external, gateway, ai, queue, cache,
 Usage examples:
   %(prog)s -d arch.json -o diagram.png
   %(prog)s -d arch.json -o diagram.png --style detailed --dpi 200
+  %(prog)s -d arch.json -o diagram.png -o diagram.svg --dpi 150,300
         """,
     )
     parser.add_argument("-d", "--description", required=True, help="JSON description file")
-    parser.add_argument("-o", "--output", required=True, help="Output PNG path")
+    parser.add_argument("-o", "--output", required=True, action="append",
+                        help="Output path; repeat for several files. Format follows "
+                             "the extension (png, svg, pdf, jpg, gif, eps). Without "
+                             "Graphviz, a basic <stem>.png is written instead")
     parser.add_argument("-s", "--style", choices=["default", "detailed"], default="detailed")
-    parser.add_argument("--dpi", type=int, default=150, help="Output DPI (default 150)")
+    parser.add_argument("--dpi", type=_parse_dpis, default=[150],
+                        help="Output DPI, or a comma list such as 150,300 to also write "
+                             "<stem>@300dpi.png for raster outputs (default 150). "
+                             "Extra DPIs need Graphviz")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Always re-render; bypass the on-disk render cache")
+    add_profile_arguments(parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     description = load_description(args.description)
     if not description:
@@ -410,29 +683,16 @@ Usage examples:
     flows = description.get("flows", [])
     print(f"Loaded {len(comps)} components and {len(flows)} flows")
 
-    # Ensure output ends in .png
-    output = args.output
-    if not output.lower().endswith(".png"):
-        output = output.rsplit(".", 1)[0] + ".png"
+    # Unknown extensions are written as PNG, as before
+    outputs = []
+    for output in args.output:
+        root, ext = os.path.splitext(output)
+        outputs.append(output if ext.lower() in GRAPHVIZ_FORMATS else root + ".png")
 
-    # 1. Try Graphviz
-    dot_source = generate_dot(description, style=args.style)
-    print("\nGenerated DOT source:")
-    print(dot_source)
-    print()
-
-    if render_with_graphviz(dot_source, output, dpi=args.dpi):
-        print("Success!")
-        sys.exit(0)
-
-    # 2. Pillow fallback
-    print("Falling back to Pillow renderer...")
-    if render_with_pillow(description, output):
-        print("Success (Pillow fallback)!")
-        sys.exit(0)
-
-    print("Error: all renderers failed")
-    sys.exit(1)
+    with profiled(args, "generate_architecture_diagram"):
+        ok = generate_architecture_diagram(description, outputs, style=args.style, dpi=args.dpi,
+                                           use_cache=not args.no_cache)
+    sys.exit(0 if ok else 1)
 
 
 if __name__ == "__main__":
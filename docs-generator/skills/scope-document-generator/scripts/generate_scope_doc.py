@@ -5,22 +5,45 @@ Generate scope documents from a DOCX template.
 This script takes a pre-unpacked DOCX template directory, injects content via XML
 placeholder replacement, and repacks it into a final .docx file.
 
+The template is loaded into memory once per process (every part deflated up
+front); each generated document only re-compresses the parts that change and
+copies the rest as pre-compressed ZIP entries.
+
 Usage:
     python generate_scope_doc.py --template-dir <path> --variables <vars.json> \
         --content <content.json> --output <output.docx> [--arch-diagram <image_path>]
 """
 
 import argparse
+import hashlib
 import json
-import shutil
-import tempfile
+import struct
 import zipfile
+import zlib
 import os
 import re
-import random
 import sys
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple, Union
+
+# Shared helpers (docgen_trace, docgen_worker) live in <plugin>/scripts
+_PLUGIN_SCRIPTS = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                                "..", "..", "..", "scripts"))
+if _PLUGIN_SCRIPTS not in sys.path:
+    sys.path.insert(0, _PLUGIN_SCRIPTS)
+from docgen_trace import add_profile_arguments, profiled, span, traced
+
+if __name__ == "__main__":
+    # Hand off to a warm docgen worker (<plugin>/scripts/docgen_worker.py)
+    # when one is running; otherwise fall through and run in-process.
+    try:
+        from docgen_worker import forward_cli
+        _exit_code = forward_cli("generate_scope_doc", sys.argv[1:])
+    except ImportError:
+        _exit_code = None
+    if _exit_code is not None:
+        sys.exit(_exit_code)
 
 # Try to import PIL for image sizing, but handle gracefully if not available
 try:
@@ -40,23 +63,105 @@ def escape_xml_text(text: str) -> str:
     Returns:
         XML-safe text with &, <, > escaped
     """
-    text = text.replace("&", "&amp;")
-    text = text.replace("<", "&lt;")
-    text = text.replace(">", "&gt;")
+    # Most text has nothing to escape: three membership tests are far
+    # cheaper than building new strings.
+    if "&" in text or "<" in text or ">" in text:
+        return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
     return text
 
 
+_PARA_ID_RE = re.compile(r'w14:(?:paraId|textId)="([0-9A-Fa-f]{8})"')
+
+DEFAULT_PARA_ID_SEED = 0x2F3A9C11
+
+
+class ParagraphIdAllocator:
+    """
+    Deterministic, collision-free source of w14:paraId / w14:textId values.
+
+    IDs are a fixed permutation of a counter: the counter is multiplied by
+    an odd constant modulo 2**31 (a bijection) and XOR-ed with the seed, so
+    every call yields a distinct value below 0x80000000 (the range Word
+    accepts).  Values already present in the template or in reused section
+    fragments are reserved up front and skipped.  The same template, seed
+    and content therefore always produce the same IDs.
+    """
+
+    _MULTIPLIER = 0x9E3779B1
+    _MASK = 0x7FFFFFFF
+
+    def __init__(self, seed: int = DEFAULT_PARA_ID_SEED, used: Iterable[int] = ()) -> None:
+        self.seed = seed & self._MASK
+        self.used: Set[int] = set(used)
+        self._counter = 0
+
+    def reserve(self, xml: str) -> None:
+        """
+        Mark every paraId/textId that appears in *xml* as taken.
+
+        Args:
+            xml: OOXML text to scan
+        """
+        self.used.update(int(value, 16) for value in _PARA_ID_RE.findall(xml))
+
+    def next_id(self) -> str:
+        """
+        Return the next unused ID.
+
+        Returns:
+            8-digit hex string suitable for w14:paraId / w14:textId
+        """
+        counter, used = self._counter, self.used
+        while True:
+            counter += 1
+            value = ((counter * self._MULTIPLIER) & self._MASK) ^ self.seed
+            if value and value not in used:
+                break
+        self._counter = counter
+        used.add(value)
+        return '%08x' % value
+
+
+# Allocator used by generate_paragraph_id(); process_template() replaces it
+# with one primed for the template being filled.
+_paragraph_ids = ParagraphIdAllocator()
+
+
+def reset_paragraph_ids(
+    used: Iterable[int] = (),
+    seed: int = DEFAULT_PARA_ID_SEED
+) -> ParagraphIdAllocator:
+    """
+    Start a fresh ID sequence for a new document.
+
+    Args:
+        used: IDs already present in the template
+        seed: Allocator seed
+
+    Returns:
+        The allocator now backing generate_paragraph_id()
+    """
+    global _paragraph_ids
+    _paragraph_ids = ParagraphIdAllocator(seed, used)
+    return _paragraph_ids
+
+
 def generate_paragraph_id() -> str:
     """
-    Generate a unique paragraph ID (random hex string).
+    Generate a unique paragraph ID.
 
     Returns:
-        A random hex string suitable for w14:paraId
+        A hex string suitable for w14:paraId, unique within the document
+        and deterministic for a given template and content
     """
-    return format(random.randint(0, 0xFFFFFFFF), '08x')
+    return _paragraph_ids.next_id()
 
 
-def get_image_dimensions(image_path: str, max_width_inches: float = 6.0) -> Tuple[int, int]:
+def get_image_dimensions(
+    image_path: str,
+    max_width_inches: float = 6.0,
+    default_dpi: int = 96
+) -> Tuple[int, int]:
     """
     Get image dimensions in EMUs (English Metric Units), capped to page width.
 
@@ -67,6 +172,7 @@ def get_image_dimensions(image_path: str, max_width_inches: float = 6.0) -> Tupl
     Args:
         image_path: Path to the image file
         max_width_inches: Maximum width in inches (default 6.0 for letter with margins)
+        default_dpi: DPI assumed when the image carries no DPI information
 
     Returns:
         Tuple of (width_emu, height_emu)
@@ -81,9 +187,9 @@ def get_image_dimensions(image_path: str, max_width_inches: float = 6.0) -> Tupl
     try:
         with Image.open(image_path) as img:
             width_px, height_px = img.size
-            # Try to read actual DPI from the image; fall back to 96
-            dpi_info = img.info.get('dpi', (96, 96))
-            dpi_x = dpi_info[0] if dpi_info[0] > 0 else 96
+            # Try to read actual DPI from the image; fall back to default_dpi
+            dpi_info = img.info.get('dpi', (default_dpi, default_dpi))
+            dpi_x = dpi_info[0] if dpi_info[0] > 0 else default_dpi
 
             width_inches = width_px / dpi_x
             height_inches = height_px / dpi_x
@@ -103,18 +209,26 @@ def get_image_dimensions(image_path: str, max_width_inches: float = 6.0) -> Tupl
         return default_width_emu, default_height_emu
 
 
-def generate_image_xml(image_path: str, rel_id: str) -> str:
+def generate_image_xml(image_path: str, rel_id: str, doc_pr_id: int = 100) -> str:
     """
-    Generate OOXML for an inline image.
+    Generate OOXML for a centered inline image paragraph.
+
+    The drawing markup mirrors what python-docx's ``new_pic_inline()``
+    produces (locked aspect ratio, ``a``/``pic`` namespaces declared inline),
+    which Word opens without repair prompts. The image is capped at 6 inches
+    wide; images without DPI information are assumed to be 150 DPI, the
+    Graphviz renderer's default.
 
     Args:
         image_path: Path to the image file
         rel_id: Relationship ID to use in r:embed
+        doc_pr_id: Drawing object ID, unique within document.xml
 
     Returns:
-        OOXML string for the image
+        OOXML string for the image paragraph
     """
-    width_emu, height_emu = get_image_dimensions(image_path)
+    width_emu, height_emu = get_image_dimensions(image_path, default_dpi=150)
+    image_name = escape_xml_text(os.path.basename(image_path)).replace('"', '&quot;')
 
     image_xml = (
         f'<w:p>'
@@ -123,12 +237,15 @@ def generate_image_xml(image_path: str, rel_id: str) -> str:
         f'\n    <w:drawing>'
         f'\n      <wp:inline distT="0" distB="0" distL="0" distR="0">'
         f'\n        <wp:extent cx="{width_emu}" cy="{height_emu}"/>'
-        f'\n        <wp:docPr id="100" name="Architecture Diagram"/>'
+        f'\n        <wp:docPr id="{doc_pr_id}" name="Picture {doc_pr_id}"/>'
+        f'\n        <wp:cNvGraphicFramePr>'
+        f'\n          <a:graphicFrameLocks xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main" noChangeAspect="1"/>'
+        f'\n        </wp:cNvGraphicFramePr>'
         f'\n        <a:graphic xmlns:a="http://schemas.openxmlformats.org/drawingml/2006/main">'
         f'\n          <a:graphicData uri="http://schemas.openxmlformats.org/drawingml/2006/picture">'
         f'\n            <pic:pic xmlns:pic="http://schemas.openxmlformats.org/drawingml/2006/picture">'
         f'\n              <pic:nvPicPr>'
-        f'\n                <pic:cNvPr id="100" name="arch_diagram"/>'
+        f'\n                <pic:cNvPr id="0" name="{image_name}"/>'
         f'\n                <pic:cNvPicPr/>'
         f'\n              </pic:nvPicPr>'
         f'\n              <pic:blipFill>'
@@ -140,7 +257,7 @@ def generate_image_xml(image_path: str, rel_id: str) -> str:
         f'\n                  <a:off x="0" y="0"/>'
         f'\n                  <a:ext cx="{width_emu}" cy="{height_emu}"/>'
         f'\n                </a:xfrm>'
-        f'\n                <a:prstGeom prst="rect"><a:avLst/></a:prstGeom>'
+        f'\n                <a:prstGeom prst="rect"/>'
         f'\n              </pic:spPr>'
         f'\n            </pic:pic>'
         f'\n          </a:graphicData>'
@@ -427,173 +544,317 @@ def is_sprint_section(section: Dict[str, Any]) -> bool:
     return False
 
 
-def generate_body_content_xml(
-    content_data: Dict[str, Any],
-    language: str = "en"
+def is_architecture_section(section: Dict[str, Any]) -> bool:
+    """
+    Check if a section is the architecture diagram section.
+
+    Args:
+        section: Section dictionary
+
+    Returns:
+        True if the section title names the architecture diagram (EN or DE)
+    """
+    section_title = section.get("title", "")
+    if "Architecture" in section_title and "Diagram" in section_title:
+        return True
+    return "architekturdiagramm" in section_title.lower()
+
+
+@traced()
+def generate_section_xml(
+    section: Dict[str, Any],
+    language: str = "en",
+    is_first: bool = False,
+    arch_image_xml: Optional[str] = None
 ) -> str:
     """
-    Generate OOXML body content from content.json sections.
+    Generate the OOXML for one content.json section.
+
+    The output depends only on the arguments, which is what lets
+    generate_body_content_xml() reuse fragments for unchanged sections.
 
     Args:
-        content_data: Parsed content.json with sections
+        section: Section dictionary from content.json
         language: Language code for text
+        is_first: Whether this is the first section (no spacer paragraph)
+        arch_image_xml: Image paragraph to place after the section intro,
+            if this section receives the architecture diagram
 
     Returns:
-        OOXML string for all body content
+        OOXML string for the section
     """
     xml_parts = []
 
-    # Page break before first section
-    xml_parts.append('<w:p><w:pPr><w:pageBreakBefore/></w:pPr></w:p>')
+    # Add space between major sections (except first)
+    if not is_first:
+        para_id = generate_paragraph_id()
+        text_id = generate_paragraph_id()
+        xml_parts.append(
+            f'<w:p w14:paraId="{para_id}" w14:textId="{text_id}">'
+            f'<w:pPr></w:pPr></w:p>'
+        )
 
-    sections = content_data.get("sections", [])
+    # Section heading (Heading1)
+    section_num = section.get("number", "")
+    section_title = section.get("title", "")
 
-    for section_idx, section in enumerate(sections):
-        # Add space between major sections (except first)
-        if section_idx > 0:
-            para_id = generate_paragraph_id()
-            text_id = generate_paragraph_id()
-            xml_parts.append(
-                f'<w:p w14:paraId="{para_id}" w14:textId="{text_id}">'
-                f'<w:pPr></w:pPr></w:p>'
-            )
+    # Format: "1.  Initial Context" (number with dot, two spaces, title)
+    if section_num:
+        heading_text = f"{section_num}.  {section_title}"
+    else:
+        heading_text = section_title
+
+    xml_parts.append(generate_paragraph_xml(
+        heading_text,
+        style="Heading1",
+        language=language,
+        bold=False
+    ))
+
+    # Section intro content
+    section_content = section.get("content", "").strip()
+    if section_content:
+        xml_parts.append(generate_paragraph_xml(
+            section_content,
+            style="Normal",
+            language=language
+        ))
 
-        # Section heading (Heading1)
-        section_num = section.get("number", "")
-        section_title = section.get("title", "")
+    # Architecture diagram goes right below the section description
+    if arch_image_xml:
+        xml_parts.append(arch_image_xml)
 
-        # Format: "1.  Initial Context" (number with dot, two spaces, title)
-        if section_num:
-            heading_text = f"{section_num}.  {section_title}"
-        else:
-            heading_text = section_title
+    # Section-level bullet points (before subsections)
+    section_bullets = section.get("bullet_points", [])
+    bullet_style = section.get("bullet_style", "normal")
+    is_dash_bullets = bullet_style == "dash"
 
-        xml_parts.append(generate_paragraph_xml(
-            heading_text,
-            style="Heading1",
+    for bullet in section_bullets:
+        xml_parts.append(generate_bullet_paragraph_xml(
+            bullet,
             language=language,
-            bold=False
+            is_dash=is_dash_bullets
         ))
 
-        # Section intro content
-        section_content = section.get("content", "").strip()
-        if section_content:
-            xml_parts.append(generate_paragraph_xml(
-                section_content,
-                style="Normal",
+    # Check if this is a sprint section
+    if is_sprint_section(section):
+        # Sprint subsections use bold inline labels with ListParagraph style
+        subsections = section.get("subsections", [])
+        for subsection in subsections:
+            subsection_num = subsection.get("number", "")
+            subsection_title = subsection.get("title", "")
+
+            # Format sprint label: "Sprint 0: " or similar
+            sprint_label = f"{subsection_num}:"
+            sprint_desc = subsection_title
+
+            xml_parts.append(generate_sprint_paragraph_xml(
+                sprint_label,
+                sprint_desc,
                 language=language
             ))
 
-        # Section-level bullet points (before subsections)
-        section_bullets = section.get("bullet_points", [])
-        bullet_style = section.get("bullet_style", "normal")
-        is_dash_bullets = bullet_style == "dash"
+            subsection_content = subsection.get("content", "").strip()
+            if subsection_content:
+                # Label-like content (e.g., "Deliverables:") should be bold
+                is_label = subsection_content.endswith(":") and len(subsection_content) < 50
+                xml_parts.append(generate_paragraph_xml(
+                    subsection_content,
+                    style="Normal",
+                    language=language,
+                    bold=is_label
+                ))
 
-        for bullet in section_bullets:
-            xml_parts.append(generate_bullet_paragraph_xml(
-                bullet,
-                language=language,
-                is_dash=is_dash_bullets
-            ))
+            # Bullet points under sprint (deliverables)
+            sprint_bullets = subsection.get("bullet_points", [])
+            for bullet in sprint_bullets:
+                xml_parts.append(generate_bullet_paragraph_xml(
+                    bullet,
+                    language=language,
+                    is_dash=False
+                ))
+    else:
+        # Normal subsections use Heading2 with manual numbering override
+        subsections = section.get("subsections", [])
+        for subsection in subsections:
+            subsection_num = subsection.get("number", "")
+            subsection_title = subsection.get("title", "")
+
+            # Format: "2.1    Email classification"
+            if subsection_num:
+                subsection_heading = f"{subsection_num}    {subsection_title}"
+            else:
+                subsection_heading = subsection_title
+
+            # For Heading2, disable auto-numbering and use manual numbering
+            numPr_override = (
+                '<w:numPr>'
+                '<w:ilvl w:val="0"/>'
+                '<w:numId w:val="0"/>'
+                '</w:numPr>'
+            )
+
+            lang_val = "en-US" if language == "en" else "de-DE"
+            para_id = generate_paragraph_id()
+            text_id = generate_paragraph_id()
+            safe_text = escape_xml_text(subsection_heading)
 
-        # Check if this is a sprint section
-        if is_sprint_section(section):
-            # Sprint subsections use bold inline labels with ListParagraph style
-            subsections = section.get("subsections", [])
-            for subsection in subsections:
-                subsection_num = subsection.get("number", "")
-                subsection_title = subsection.get("title", "")
-
-                # Format sprint label: "Sprint 0: " or similar
-                sprint_label = f"{subsection_num}:"
-                sprint_desc = subsection_title
-
-                xml_parts.append(generate_sprint_paragraph_xml(
-                    sprint_label,
-                    sprint_desc,
+            heading2_xml = (
+                f'<w:p w14:paraId="{para_id}" w14:textId="{text_id}">'
+                f'\n  <w:pPr>'
+                f'\n    <w:pStyle w:val="Heading2"/>'
+                f'\n    {numPr_override}'
+                f'\n  </w:pPr>'
+                f'\n  <w:r>'
+                f'\n    <w:rPr>'
+                f'\n      <w:lang w:val="{lang_val}"/>'
+                f'\n    </w:rPr>'
+                f'\n    <w:t xml:space="preserve">{safe_text}</w:t>'
+                f'\n  </w:r>'
+                f'\n</w:p>'
+            )
+
+            xml_parts.append(heading2_xml)
+
+            subsection_content = subsection.get("content", "").strip()
+            if subsection_content:
+                xml_parts.append(generate_paragraph_xml(
+                    subsection_content,
+                    style="Normal",
                     language=language
                 ))
 
-                subsection_content = subsection.get("content", "").strip()
-                if subsection_content:
-                    # Label-like content (e.g., "Deliverables:") should be bold
-                    is_label = subsection_content.endswith(":") and len(subsection_content) < 50
-                    xml_parts.append(generate_paragraph_xml(
-                        subsection_content,
-                        style="Normal",
-                        language=language,
-                        bold=is_label
-                    ))
-
-                # Bullet points under sprint (deliverables)
-                sprint_bullets = subsection.get("bullet_points", [])
-                for bullet in sprint_bullets:
-                    xml_parts.append(generate_bullet_paragraph_xml(
-                        bullet,
-                        language=language,
-                        is_dash=False
-                    ))
-        else:
-            # Normal subsections use Heading2 with manual numbering override
-            subsections = section.get("subsections", [])
-            for subsection in subsections:
-                subsection_num = subsection.get("number", "")
-                subsection_title = subsection.get("title", "")
-
-                # Format: "2.1    Email classification"
-                if subsection_num:
-                    subsection_heading = f"{subsection_num}    {subsection_title}"
-                else:
-                    subsection_heading = subsection_title
-
-                # For Heading2, disable auto-numbering and use manual numbering
-                numPr_override = (
-                    '<w:numPr>'
-                    '<w:ilvl w:val="0"/>'
-                    '<w:numId w:val="0"/>'
-                    '</w:numPr>'
-                )
+            # Bullet points under subsection
+            subsection_bullets = subsection.get("bullet_points", [])
+            for bullet in subsection_bullets:
+                xml_parts.append(generate_bullet_paragraph_xml(
+                    bullet,
+                    language=language,
+                    is_dash=False
+                ))
 
-                lang_val = "en-US" if language == "en" else "de-DE"
-                para_id = generate_paragraph_id()
-                text_id = generate_paragraph_id()
-                safe_text = escape_xml_text(subsection_heading)
-
-                heading2_xml = (
-                    f'<w:p w14:paraId="{para_id}" w14:textId="{text_id}">'
-                    f'\n  <w:pPr>'
-                    f'\n    <w:pStyle w:val="Heading2"/>'
-                    f'\n    {numPr_override}'
-                    f'\n  </w:pPr>'
-                    f'\n  <w:r>'
-                    f'\n    <w:rPr>'
-                    f'\n      <w:lang w:val="{lang_val}"/>'
-                    f'\n    </w:rPr>'
-                    f'\n    <w:t xml:space="preserve">{safe_text}</w:t>'
-                    f'\n  </w:r>'
-                    f'\n</w:p>'
-                )
+    return "\n".join(xml_parts)
 
-                xml_parts.append(heading2_xml)
-
-                subsection_content = subsection.get("content", "").strip()
-                if subsection_content:
-                    xml_parts.append(generate_paragraph_xml(
-                        subsection_content,
-                        style="Normal",
-                        language=language
-                    ))
-
-                # Bullet points under subsection
-                subsection_bullets = subsection.get("bullet_points", [])
-                for bullet in subsection_bullets:
-                    xml_parts.append(generate_bullet_paragraph_xml(
-                        bullet,
-                        language=language,
-                        is_dash=False
-                    ))
 
-    return "\n".join(xml_parts)
+def section_fragment_key(
+    section: Dict[str, Any],
+    language: str,
+    is_first: bool,
+    arch_image_xml: Optional[str] = None
+) -> str:
+    """
+    Hash everything generate_section_xml() output depends on.
+
+    Args:
+        section: Section dictionary
+        language: Language code
+        is_first: Whether the section is the first one
+        arch_image_xml: Image paragraph the section receives, if any
+
+    Returns:
+        Hex digest identifying the section's fragment
+    """
+    payload = json.dumps(
+        [section, language, is_first, arch_image_xml or ""],
+        sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def generate_body_content_xml(
+    content_data: Dict[str, Any],
+    language: str = "en",
+    arch_image_xml: Optional[str] = None,
+    fragment_cache: Optional[Dict[str, str]] = None
+) -> str:
+    """
+    Generate OOXML body content from content.json sections as one string.
+
+    See iter_body_content_xml() for the arguments; process_template()
+    streams that iterator instead of building this string.
+
+    Returns:
+        OOXML string for all body content
+    """
+    return "\n".join(iter_body_content_xml(
+        content_data, language, arch_image_xml, fragment_cache
+    ))
+
+
+def iter_body_content_xml(
+    content_data: Dict[str, Any],
+    language: str = "en",
+    arch_image_xml: Optional[str] = None,
+    fragment_cache: Optional[Dict[str, str]] = None
+) -> Iterator[str]:
+    """
+    Generate OOXML body content from content.json sections, piece by piece.
+
+    Yields the leading page break and then one fragment per section, so the
+    caller can write each one out before the next is built.  Pieces are
+    meant to be joined with newlines.
+
+    Args:
+        content_data: Parsed content.json with sections
+        language: Language code for text
+        arch_image_xml: Optional image paragraph (see generate_image_xml),
+            placed after the intro text of the architecture diagram section
+        fragment_cache: Optional section-key -> XML fragments from an earlier
+            build.  Unchanged sections reuse their fragment byte-for-byte
+            (paraIds included); on return the dict holds exactly the
+            fragments of this build (once the iterator is exhausted).
+
+    Yields:
+        OOXML strings: the page break, then each section's fragment
+    """
+    # Page break before first section
+    yield '<w:p><w:pPr><w:pageBreakBefore/></w:pPr></w:p>'
+
+    sections = content_data.get("sections", [])
+
+    # (section, is_first, image paragraph it receives)
+    plan = []
+    for section_idx, section in enumerate(sections):
+        section_image_xml = None
+        if arch_image_xml and is_architecture_section(section):
+            section_image_xml = arch_image_xml
+            arch_image_xml = None
+        plan.append((section, section_idx == 0, section_image_xml))
+
+    if fragment_cache is None:
+        for section, is_first, section_image_xml in plan:
+            yield generate_section_xml(section, language, is_first, section_image_xml)
+        return
+
+    keys: List[str] = []
+    for section, is_first, section_image_xml in plan:
+        key = section_fragment_key(section, language, is_first, section_image_xml)
+        if key in keys:
+            # Identical repeated section: needs its own paraIds
+            key += f"-{sum(1 for k in keys if k.startswith(key))}"
+        keys.append(key)
+
+    # IDs inside reused fragments must not be handed out again
+    for key in keys:
+        if key in fragment_cache:
+            _paragraph_ids.reserve(fragment_cache[key])
+
+    fragments: Dict[str, str] = {}
+    reused = 0
+    for key, (section, is_first, section_image_xml) in zip(keys, plan):
+        fragment = fragment_cache.get(key)
+        if fragment is None:
+            fragment = generate_section_xml(
+                section, language, is_first, section_image_xml
+            )
+        else:
+            reused += 1
+        fragments[key] = fragment
+        yield fragment
+
+    print(f"Reused {reused} of {len(sections)} section fragments")
+    fragment_cache.clear()
+    fragment_cache.update(fragments)
 
 
 def replace_cover_placeholders(
@@ -638,41 +899,30 @@ def replace_cover_placeholders(
     return document_xml
 
 
-def add_image_to_docx(
-    working_dir: str,
+def add_image_to_package(
+    sources: Dict[str, str],
     image_path: str,
     image_filename: str = "image2.jpeg"
 ) -> str:
     """
-    Add an image to the DOCX template and update relationships.
+    Register an image part in the package relationships and content types.
+
+    Rewrites the document.xml.rels and [Content_Types].xml texts held in
+    *sources* in place; the image bytes themselves are packed by the caller.
 
     Args:
-        working_dir: Path to unpacked DOCX template
+        sources: Mutable map of part name to XML text (see TemplatePackage)
         image_path: Path to the image file to add
         image_filename: Desired filename in word/media/
 
     Returns:
         Relationship ID for the image
     """
-    # Create media directory if it doesn't exist
-    media_dir = os.path.join(working_dir, "word", "media")
-    os.makedirs(media_dir, exist_ok=True)
-
-    # Copy image to media directory
-    dest_path = os.path.join(media_dir, image_filename)
-    shutil.copy2(image_path, dest_path)
-    print(f"Copied image to {dest_path}")
-
-    # Update document.xml.rels to add relationship
-    rels_path = os.path.join(working_dir, "word", "_rels", "document.xml.rels")
-
-    if not os.path.exists(rels_path):
-        print(f"Warning: {rels_path} not found")
+    rels_content = sources.get(DOCUMENT_RELS_PART)
+    if rels_content is None:
+        print(f"Warning: {DOCUMENT_RELS_PART} not found")
         return "rIdArch"
 
-    with open(rels_path, 'r', encoding='utf-8') as f:
-        rels_content = f.read()
-
     # Find the next available rId number
     rel_ids = re.findall(r'Id="rId(\d+)"', rels_content)
     next_id = max([int(rid) for rid in rel_ids] + [0]) + 1
@@ -691,36 +941,342 @@ def add_image_to_docx(
 
     # Add relationship entry before the closing </Relationships>
     new_rel = f'  <Relationship Id="{rel_id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/image" Target="media/{image_filename}"/>\n'
-    rels_content = rels_content.replace('</Relationships>', f'{new_rel}</Relationships>')
-
-    with open(rels_path, 'w', encoding='utf-8') as f:
-        f.write(rels_content)
+    sources[DOCUMENT_RELS_PART] = rels_content.replace('</Relationships>', f'{new_rel}</Relationships>')
     print(f"Added relationship {rel_id} for image")
 
     # Update [Content_Types].xml if needed
-    content_types_path = os.path.join(working_dir, "[Content_Types].xml")
-    if os.path.exists(content_types_path):
-        with open(content_types_path, 'r', encoding='utf-8') as f:
-            content_types = f.read()
+    content_types = sources.get(CONTENT_TYPES_PART)
+    if content_types is not None and f'/word/media/{image_filename}' not in content_types:
+        override_entry = f'  <Override PartName="/word/media/{image_filename}" ContentType="{media_type}"/>\n'
+        sources[CONTENT_TYPES_PART] = content_types.replace('</Types>', f'{override_entry}</Types>')
+        print(f"Added content type for {media_type}")
 
-        # Check if this specific media file override already exists
-        if f'/word/media/{image_filename}' not in content_types:
-            override_entry = f'  <Override PartName="/word/media/{image_filename}" ContentType="{media_type}"/>\n'
-            content_types = content_types.replace('</Types>', f'{override_entry}</Types>')
+    return rel_id
 
-            with open(content_types_path, 'w', encoding='utf-8') as f:
-                f.write(content_types)
-            print(f"Added content type for {media_type}")
 
-    return rel_id
+def _next_media_filename(package_parts: Dict[str, Any], image_path: str) -> str:
+    """Return the next free word/media/imageN.<ext> filename."""
+    ext = os.path.splitext(image_path)[1].lower() or ".png"
+    used = {
+        int(m.group(1))
+        for name in package_parts
+        for m in [re.match(r'word/media/image(\d+)\.', name)]
+        if m
+    }
+    return f"image{max(used | {0}) + 1}{ext}"
+
+
+def _next_doc_pr_id(document_xml: str) -> int:
+    """Return a drawing object ID not yet used in document.xml."""
+    ids = [int(i) for i in re.findall(r'<wp:docPr[^>]*\bid="(\d+)"', document_xml)]
+    return max(ids + [0]) + 1
+
+
+# ---------------------------------------------------------------------------
+# In-memory template packing
+# ---------------------------------------------------------------------------
+
+# Parts that are rewritten per document; every other part is copied verbatim.
+DOCUMENT_PART = "word/document.xml"
+DOCUMENT_RELS_PART = "word/_rels/document.xml.rels"
+CONTENT_TYPES_PART = "[Content_Types].xml"
+MUTABLE_PARTS = (DOCUMENT_PART, DOCUMENT_RELS_PART, CONTENT_TYPES_PART)
+
+# Fixed DOS timestamp (1980-01-01 00:00) for every entry, as zipfile.ZipInfo does
+_ZIP_DOS_TIME = 0
+_ZIP_DOS_DATE = (1 << 5) | 1
+
+
+@dataclass
+class PackedPart:
+    """A single ZIP entry whose payload is already raw-deflated."""
+    name: str
+    crc: int
+    size: int
+    data: bytes
+
+
+@dataclass
+class StreamedPart:
+    """A ZIP entry deflated while it is written, from a stream of byte chunks."""
+    name: str
+    chunks: Iterable[bytes]
+
+
+@dataclass
+class TemplatePackage:
+    """An unpacked DOCX template held in memory, ready to be streamed out."""
+    template_dir: str
+    signature: Tuple[Tuple[str, int, int], ...]
+    digest: str = ""
+    parts: Dict[str, PackedPart] = field(default_factory=dict)
+    sources: Dict[str, str] = field(default_factory=dict)
+    para_ids: Set[int] = field(default_factory=set)
+
+
+_TEMPLATE_CACHE: Dict[str, TemplatePackage] = {}
+
+
+def _arcname_for(rel_path: str) -> str:
+    """Map a template file path to its ZIP arcname (restores [Content_Types].xml)."""
+    arcname = rel_path.replace(os.sep, "/")
+    if arcname == "_Content_Types_.xml":
+        return CONTENT_TYPES_PART
+    return arcname
+
+
+def _template_signature(template_dir: str) -> Tuple[Tuple[str, int, int], ...]:
+    """Return (relpath, mtime_ns, size) for every file, used to invalidate the cache."""
+    entries = []
+    for root, dirs, files in os.walk(template_dir):
+        dirs.sort()
+        for name in sorted(files):
+            file_path = os.path.join(root, name)
+            st = os.stat(file_path)
+            entries.append((os.path.relpath(file_path, template_dir), st.st_mtime_ns, st.st_size))
+    return tuple(entries)
+
+
+def pack_part(name: str, data: bytes) -> PackedPart:
+    """Deflate *data* once into a ZIP-ready entry."""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    compressed = compressor.compress(data) + compressor.flush()
+    return PackedPart(name=name, crc=zlib.crc32(data), size=len(data), data=compressed)
+
+
+def load_template_package(template_dir: str) -> TemplatePackage:
+    """
+    Load (or reuse) the in-memory package for an unpacked DOCX template.
+
+    Every part is read and deflated exactly once per process. The XML parts
+    that are rewritten per document are additionally kept as text. The cached
+    package is reused as long as no template file has changed on disk.
+
+    Args:
+        template_dir: Path to unpacked DOCX template
+
+    Returns:
+        TemplatePackage with pre-compressed parts
+    """
+    key = os.path.realpath(template_dir)
+    signature = _template_signature(key)
+    cached = _TEMPLATE_CACHE.get(key)
+    if cached is not None and cached.signature == signature:
+        return cached
+
+    package = TemplatePackage(template_dir=key, signature=signature)
+    content_hash = hashlib.sha256()
+    for rel_path, _mtime, _size in signature:
+        arcname = _arcname_for(rel_path)
+        with open(os.path.join(key, rel_path), 'rb') as f:
+            data = f.read()
+        content_hash.update(f"{arcname}\0{len(data)}\0".encode('utf-8'))
+        content_hash.update(data)
+        package.parts[arcname] = pack_part(arcname, data)
+        if arcname in MUTABLE_PARTS:
+            package.sources[arcname] = data.decode('utf-8')
+        if arcname.startswith('word/') and arcname.endswith('.xml'):
+            package.para_ids.update(
+                int(value, 16) for value in _PARA_ID_RE.findall(data.decode('utf-8'))
+            )
+    package.digest = content_hash.hexdigest()
+
+    _TEMPLATE_CACHE[key] = package
+    return package
+
+
+def _write_streamed_entry(part: StreamedPart, dest: BinaryIO) -> Tuple[int, int, int]:
+    """Deflate *part* chunk by chunk into *dest*; returns (crc, csize, size)."""
+    compressor = zlib.compressobj(zlib.Z_DEFAULT_COMPRESSION, zlib.DEFLATED, -15)
+    crc = compressed_size = size = 0
+    for chunk in part.chunks:
+        crc = zlib.crc32(chunk, crc)
+        size += len(chunk)
+        data = compressor.compress(chunk)
+        if data:
+            dest.write(data)
+            compressed_size += len(data)
+    data = compressor.flush()
+    dest.write(data)
+    compressed_size += len(data)
+    return crc, compressed_size, size
+
+
+@traced()
+def write_docx_package(
+    parts: List[Union[PackedPart, StreamedPart]],
+    dest: BinaryIO
+) -> None:
+    """
+    Write parts as a ZIP archive to a binary stream.
+
+    Pre-compressed payloads are copied byte-for-byte. Streamed parts are
+    deflated as their chunks arrive and followed by a data descriptor, so
+    they are never held in memory whole. Only the headers and the central
+    directory are generated here. The stream does not need to be seekable.
+
+    Args:
+        parts: Entries in archive order
+        dest: Writable binary stream
+    """
+    offset = 0
+    central = []
+    for part in parts:
+        name = part.name.encode('utf-8')
+        flags = 0 if part.name.isascii() else 0x800
+        streamed = isinstance(part, StreamedPart)
+        if streamed:
+            flags |= 0x08  # sizes and CRC follow the data
+            crc = compressed_size = size = 0
+        else:
+            crc, compressed_size, size = part.crc, len(part.data), part.size
+        local_header = struct.pack(
+            '<IHHHHHIIIHH',
+            0x04034b50, 20, flags, zipfile.ZIP_DEFLATED,
+            _ZIP_DOS_TIME, _ZIP_DOS_DATE,
+            crc, compressed_size, size, len(name), 0,
+        )
+        dest.write(local_header)
+        dest.write(name)
+        entry_size = len(local_header) + len(name)
+        if streamed:
+            crc, compressed_size, size = _write_streamed_entry(part, dest)
+            dest.write(struct.pack('<IIII', 0x08074b50, crc, compressed_size, size))
+            entry_size += compressed_size + 16
+        else:
+            dest.write(part.data)
+            entry_size += compressed_size
+        central.append(struct.pack(
+            '<IHHHHHHIIIHHHHHII',
+            0x02014b50, 20, 20, flags, zipfile.ZIP_DEFLATED,
+            _ZIP_DOS_TIME, _ZIP_DOS_DATE,
+            crc, compressed_size, size, len(name), 0, 0, 0, 0,
+            0o644 << 16, offset,
+        ) + name)
+        offset += entry_size
+
+    central_dir = b''.join(central)
+    dest.write(central_dir)
+    dest.write(struct.pack(
+        '<IHHHHIIH',
+        0x06054b50, 0, 0, len(parts), len(parts), len(central_dir), offset, 0,
+    ))
+
+
+# ---------------------------------------------------------------------------
+# Section fragment cache
+# ---------------------------------------------------------------------------
+# Review rounds regenerate the same document with a few sections changed.
+# The fragments of the last build are kept in a JSON file so the next run
+# (a new process) only regenerates the sections whose content changed and
+# reuses the rest byte-for-byte, keeping paraIds -- and document diffs --
+# stable.  The cache is opt-in (--fragment-cache), since it makes a build
+# depend on earlier ones.  The file is discarded whenever this script or the
+# template changes: reused fragments keep their paraIds, which must not
+# collide with those of a different template.
+
+def default_fragment_cache_path(output_path: str) -> str:
+    """
+    Per-output fragment cache file under the user cache directory.
+
+    Args:
+        output_path: Output DOCX path
+
+    Returns:
+        Path of the JSON file holding that document's section fragments
+    """
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    digest = hashlib.sha256(os.path.abspath(output_path).encode('utf-8')).hexdigest()[:16]
+    name = f"{os.path.splitext(os.path.basename(output_path))[0]}-{digest}.json"
+    return os.path.join(base, "docs-generator", "scope-fragments", name)
+
+
+def _generator_fingerprint() -> str:
+    with open(os.path.abspath(__file__), 'rb') as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def load_fragment_cache(path: str, template_digest: str) -> Dict[str, str]:
+    """
+    Load section fragments saved by a previous build.
+
+    Args:
+        path: Fragment cache file
+        template_digest: Content hash of the template being filled
+
+    Returns:
+        Section-key -> XML mapping (empty if missing, unreadable or stale)
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (not isinstance(data, dict)
+            or data.get("generator") != _generator_fingerprint()
+            or data.get("template") != template_digest):
+        return {}
+    fragments = data.get("fragments")
+    return fragments if isinstance(fragments, dict) else {}
+
+
+def save_fragment_cache(path: str, fragments: Dict[str, str], template_digest: str) -> None:
+    """
+    Atomically write the fragments of the current build.
+
+    Args:
+        path: Fragment cache file
+        fragments: Section-key -> XML mapping
+        template_digest: Content hash of the template the fragments were built for
+    """
+    try:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({"generator": _generator_fingerprint(), "template": template_digest,
+                       "fragments": fragments}, f)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"Warning: Could not save section fragment cache: {e}")
+
+
+BODY_MARKER_PATTERN = re.compile(
+    r'<!-- BODY_CONTENT_START -->\s*<!-- BODY_CONTENT_END -->',
+    re.DOTALL
+)
+
+
+def iter_document_chunks(
+    head: str,
+    body_parts: Iterable[str],
+    tail: str
+) -> Iterator[bytes]:
+    """
+    Encode document.xml as template head, newline-joined body parts, tail.
+
+    Args:
+        head: document.xml up to the body markers
+        body_parts: Body XML pieces (see iter_body_content_xml)
+        tail: document.xml after the body markers
+
+    Yields:
+        UTF-8 chunks of the final document.xml
+    """
+    yield head.encode('utf-8')
+    separator = ""
+    for part in body_parts:
+        yield (separator + part).encode('utf-8')
+        separator = "\n"
+    yield tail.encode('utf-8')
 
 
 def process_template(
     template_dir: str,
     variables: Dict[str, str],
     content_data: Dict[str, Any],
-    output_path: str,
-    arch_diagram_path: Optional[str] = None
+    output_path: Union[str, BinaryIO],
+    arch_diagram_path: Optional[str] = None,
+    fragment_cache_path: Optional[str] = None
 ) -> bool:
     """
     Process the template and generate the final DOCX.
@@ -729,92 +1285,108 @@ def process_template(
         template_dir: Path to unpacked DOCX template
         variables: Variables for placeholder replacement
         content_data: Content data with sections
-        output_path: Output DOCX file path
+        output_path: Output DOCX file path, or a writable binary stream
+            (e.g. io.BytesIO) to receive the document
         arch_diagram_path: Optional path to architecture diagram image
+        fragment_cache_path: Optional section fragment cache file; sections
+            unchanged since the build that wrote it are not regenerated
 
     Returns:
         True if successful, False otherwise
     """
     try:
-        # Create a temporary working directory
-        with tempfile.TemporaryDirectory() as work_temp:
-            print(f"Creating working copy of template...")
-
-            # Copy template to working directory
-            working_dir = os.path.join(work_temp, "docx_work")
-            shutil.copytree(template_dir, working_dir)
-
-            # Restore [Content_Types].xml if renamed for zip compatibility
-            safe_ct = os.path.join(working_dir, "_Content_Types_.xml")
-            real_ct = os.path.join(working_dir, "[Content_Types].xml")
-            if os.path.exists(safe_ct) and not os.path.exists(real_ct):
-                os.rename(safe_ct, real_ct)
-
-            # Read document.xml
-            doc_xml_path = os.path.join(working_dir, "word", "document.xml")
-            if not os.path.exists(doc_xml_path):
-                print(f"Error: {doc_xml_path} not found")
-                return False
-
-            with open(doc_xml_path, 'r', encoding='utf-8') as f:
-                document_xml = f.read()
-
-            print("Replacing cover page placeholders...")
-            language = variables.get("language", "en")
+        print("Loading template package...")
+        with span("load_template_package"):
+            package = load_template_package(template_dir)
+
+        document_xml = package.sources.get(DOCUMENT_PART)
+        if document_xml is None:
+            print(f"Error: {os.path.join(template_dir, DOCUMENT_PART)} not found")
+            return False
+
+        print("Replacing cover page placeholders...")
+        language = variables.get("language", "en")
+        with span("replace_cover_placeholders"):
             document_xml = replace_cover_placeholders(document_xml, variables)
 
-            # Generate body content XML
-            print("Generating body content from sections...")
-            body_content_xml = generate_body_content_xml(content_data, language)
-
-            # NOTE: Architecture diagram is inserted AFTER the DOCX is built,
-            # using python-docx's new_pic_inline() for reliable image embedding.
-            # Raw OOXML injection was unreliable (Word rejected the files).
-            if arch_diagram_path and not os.path.exists(arch_diagram_path):
-                print(f"Warning: Architecture diagram not found: {arch_diagram_path}")
-                arch_diagram_path = None  # skip insertion later
-
-            # Replace the body content markers (<!-- BODY_CONTENT_START --> to <!-- BODY_CONTENT_END -->)
-            # with the generated content
-            body_marker_pattern = re.compile(
-                r'<!-- BODY_CONTENT_START -->\s*<!-- BODY_CONTENT_END -->',
-                re.DOTALL
-            )
-
-            if body_marker_pattern.search(document_xml):
-                document_xml = body_marker_pattern.sub(body_content_xml, document_xml)
-                print("Injected body content via comment markers")
-            else:
-                print("Warning: Could not find BODY_CONTENT markers in document.xml")
-                return False
-
-            # Write modified document.xml
-            with open(doc_xml_path, 'w', encoding='utf-8') as f:
-                f.write(document_xml)
-
-            # Repack into DOCX (ZIP) file
-            print(f"Repacking into DOCX file: {output_path}")
+        # Deterministic paragraph IDs that avoid those already in the template
+        reset_paragraph_ids(package.para_ids)
+
+        # Working copies of the rels / content-types texts for this document
+        sources = dict(package.sources)
+        replaced: Dict[str, Union[PackedPart, StreamedPart]] = {}
+
+        # Architecture diagram: register the image part and build its inline
+        # drawing so it is written in the same pass as the body content.
+        arch_image_xml = None
+        sections = content_data.get("sections", [])
+        if arch_diagram_path and not os.path.exists(arch_diagram_path):
+            print(f"Warning: Architecture diagram not found: {arch_diagram_path}")
+        elif arch_diagram_path and not any(is_architecture_section(s) for s in sections):
+            print("Warning: Could not find 'Architecture Diagram' section — image not inserted")
+        elif arch_diagram_path:
+            print(f"Embedding architecture diagram: {arch_diagram_path}")
+            with span("embed_arch_diagram"):
+                image_filename = _next_media_filename(package.parts, arch_diagram_path)
+                rel_id = add_image_to_package(sources, arch_diagram_path, image_filename)
+                arch_image_xml = generate_image_xml(
+                    arch_diagram_path, rel_id, doc_pr_id=_next_doc_pr_id(document_xml)
+                )
+                media_part = f"word/media/{image_filename}"
+                with open(arch_diagram_path, 'rb') as f:
+                    replaced[media_part] = pack_part(media_part, f.read())
+
+        # The body replaces the markers (<!-- BODY_CONTENT_START --> to
+        # <!-- BODY_CONTENT_END -->); split the template around them.
+        marker = BODY_MARKER_PATTERN.search(document_xml)
+        if not marker:
+            print("Warning: Could not find BODY_CONTENT markers in document.xml")
+            return False
+        document_head = document_xml[:marker.start()]
+        document_tail = document_xml[marker.end():]
+
+        # Body content is generated section by section while document.xml
+        # is being deflated into the package.
+        print("Generating body content from sections...")
+        with span("load_fragment_cache"):
+            fragment_cache = (load_fragment_cache(fragment_cache_path, package.digest)
+                              if fragment_cache_path else None)
+        body_parts = iter_body_content_xml(content_data, language, arch_image_xml, fragment_cache)
+        replaced[DOCUMENT_PART] = StreamedPart(
+            DOCUMENT_PART, iter_document_chunks(document_head, body_parts, document_tail)
+        )
 
+        # Swap in the rewritten parts; everything else is copied pre-compressed.
+        # [Content_Types].xml goes first, as Word itself writes it.
+        for name in (DOCUMENT_RELS_PART, CONTENT_TYPES_PART):
+            if name in sources and sources[name] != package.sources[name]:
+                replaced[name] = pack_part(name, sources[name].encode('utf-8'))
+        parts = [replaced.pop(name, part) for name, part in package.parts.items()]
+        parts.extend(replaced.values())
+        parts.sort(key=lambda part: part.name != CONTENT_TYPES_PART)
+
+        print(f"Packing DOCX: {output_path if isinstance(output_path, str) else '<stream>'}")
+        if isinstance(output_path, str):
             # Ensure output directory exists
             os.makedirs(os.path.dirname(os.path.abspath(output_path)), exist_ok=True)
+            # The body is generated mid-write: never leave a half-written file
+            tmp_path = f"{output_path}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_path, 'wb') as f:
+                    write_docx_package(parts, f)
+                os.replace(tmp_path, output_path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        else:
+            write_docx_package(parts, output_path)
 
-            # Create ZIP file with DEFLATED compression
-            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as docx_zip:
-                for root, dirs, files in os.walk(working_dir):
-                    for file in files:
-                        file_path = os.path.join(root, file)
-                        # Calculate relative path from working directory
-                        arcname = os.path.relpath(file_path, working_dir)
-                        docx_zip.write(file_path, arcname)
-
-            print(f"Successfully created DOCX: {output_path}")
-
-            # --- Insert architecture diagram using python-docx ---
-            if arch_diagram_path and os.path.exists(arch_diagram_path):
-                print(f"Embedding architecture diagram via python-docx: {arch_diagram_path}")
-                _insert_arch_diagram_with_docx(output_path, arch_diagram_path)
+        if fragment_cache_path:
+            with span("save_fragment_cache"):
+                save_fragment_cache(fragment_cache_path, fragment_cache, package.digest)
 
-            return True
+        print(f"Successfully created DOCX: {output_path}")
+        return True
 
     except Exception as e:
         print(f"Error processing template: {e}", file=sys.stderr)
@@ -823,74 +1395,7 @@ def process_template(
         return False
 
 
-def _insert_arch_diagram_with_docx(docx_path: str, image_path: str) -> None:
-    """
-    Open the generated DOCX with python-docx and insert the architecture
-    diagram image into the 'Architecture Diagram' section.
-
-    This uses python-docx's ``new_pic_inline()`` which correctly manages
-    relationships, content types, and OOXML structure — unlike raw XML
-    injection which Word may reject.
-    """
-    from docx import Document as DocxDocument
-    from docx.shared import Inches
-    from docx.oxml.ns import qn
-    from docx.oxml import OxmlElement
-
-    doc = DocxDocument(docx_path)
-
-    # Find the Architecture Diagram heading
-    target_para = None
-    for i, p in enumerate(doc.paragraphs):
-        if 'Architecture' in p.text and 'Diagram' in p.text and 'Heading' in p.style.name:
-            # Use the paragraph right after the heading (description text)
-            if i + 1 < len(doc.paragraphs):
-                target_para = doc.paragraphs[i + 1]
-            else:
-                target_para = p
-            break
-
-    if target_para is None:
-        print("Warning: Could not find 'Architecture Diagram' heading — image not inserted")
-        return
-
-    # Calculate width: max 6 inches, preserve aspect ratio
-    width_inches = 6.0
-    if HAS_PIL:
-        try:
-            with Image.open(image_path) as img:
-                w_px, h_px = img.size
-                dpi = img.info.get('dpi', (150, 150))
-                dpi_x = dpi[0] if dpi[0] > 0 else 150
-                w_in = w_px / dpi_x
-                if w_in < width_inches:
-                    width_inches = w_in
-        except Exception:
-            pass
-
-    # Create a new centered paragraph after the description
-    new_para = OxmlElement('w:p')
-    pPr = OxmlElement('w:pPr')
-    jc = OxmlElement('w:jc')
-    jc.set(qn('w:val'), 'center')
-    pPr.append(jc)
-    new_para.append(pPr)
-    target_para._element.addnext(new_para)
-
-    # Use python-docx to build the inline image element
-    inline = doc.part.new_pic_inline(image_path, width=Inches(width_inches))
-
-    run = OxmlElement('w:r')
-    drawing = OxmlElement('w:drawing')
-    drawing.append(inline)
-    run.append(drawing)
-    new_para.append(run)
-
-    doc.save(docx_path)
-    print(f"Architecture diagram inserted successfully ({width_inches:.1f}\" wide)")
-
-
-def main():
+def main(argv: Optional[List[str]] = None):
     """Main entry point."""
     parser = argparse.ArgumentParser(
         description="Generate scope documents from a DOCX template"
@@ -919,8 +1424,17 @@ def main():
         "--arch-diagram",
         help="Optional path to architecture diagram image"
     )
+    parser.add_argument(
+        "--fragment-cache",
+        nargs="?",
+        const="",
+        metavar="PATH",
+        help="Reuse unchanged sections from the previous build's fragment cache "
+             "(default file: per-output under ~/.cache/docs-generator/scope-fragments)"
+    )
+    add_profile_arguments(parser)
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Validate input files exist
     if not os.path.isdir(args.template_dir):
@@ -957,14 +1471,20 @@ def main():
         print(f"Error: Architecture diagram not found: {args.arch_diagram}", file=sys.stderr)
         return 1
 
+    fragment_cache_path = None
+    if args.fragment_cache is not None:
+        fragment_cache_path = args.fragment_cache or default_fragment_cache_path(args.output)
+
     # Process template
-    success = process_template(
-        args.template_dir,
-        variables,
-        content_data,
-        args.output,
-        args.arch_diagram
-    )
+    with profiled(args, "generate_scope_doc"):
+        success = process_template(
+            args.template_dir,
+            variables,
+            content_data,
+            args.output,
+            args.arch_diagram,
+            fragment_cache_path
+        )
 
     return 0 if success else 1
 